@@ -0,0 +1,24 @@
+import secrets
+from typing import Optional
+
+from fastapi import Depends, Header
+
+from app.base.exceptions.basic import ForbiddenException, NotFoundException
+from app.core.config import get_app_settings
+
+DEBUG_TOKEN_HEADER = "X-Debug-Token"
+
+
+def require_debug_token(
+        x_debug_token: Optional[str] = Header(default=None, description="the DEBUG_TOKEN setting"),
+) -> None:
+    token = get_app_settings().DEBUG_TOKEN
+    if token is None:
+        raise NotFoundException("Debug endpoints are disabled; set DEBUG_TOKEN to enable them.")
+    if x_debug_token is None or not secrets.compare_digest(
+            x_debug_token.encode(), token.get_secret_value().encode()
+    ):
+        raise ForbiddenException(f"A valid {DEBUG_TOKEN_HEADER} header is required.")
+
+
+DebugAccess = Depends(require_debug_token)
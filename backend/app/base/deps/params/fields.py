@@ -0,0 +1,17 @@
+from typing import Annotated, Optional
+
+from fastapi import Query, Depends
+
+
+def fields_params(
+        fields: Optional[str] = Query(
+            default=None,
+            description="comma-separated fields to return (e.g. `item,next_review_at`); all fields if omitted",
+        )
+) -> Optional[list[str]]:
+    if not fields:
+        return None
+    return [field.strip() for field in fields.split(",") if field.strip()]
+
+
+FieldsParam = Annotated[Optional[list[str]], Depends(fields_params)]
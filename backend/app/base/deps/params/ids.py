@@ -0,0 +1,35 @@
+import uuid
+from typing import Annotated, Optional
+
+from fastapi import Query, Depends
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+
+MAX_IDS = 200
+
+_ids_adapter = TypeAdapter(list[uuid.UUID])
+
+
+def ids_params(
+        ids: Optional[str] = Query(
+            default=None,
+            description=f"comma-separated ids to fetch in a single request (max {MAX_IDS}); replaces pagination",
+        )
+) -> Optional[list[uuid.UUID]]:
+    if not ids:
+        return None
+    try:
+        values = _ids_adapter.validate_python([value.strip() for value in ids.split(",") if value.strip()])
+    except ValidationError as e:
+        raise RequestValidationError([
+            {**error, "loc": ("query", "ids", *error["loc"])}
+            for error in e.errors(include_url=False, include_context=False)
+        ])
+    if len(values) > MAX_IDS:
+        raise RequestValidationError([{
+            "type": "too_long", "loc": ("query", "ids"), "msg": f"At most {MAX_IDS} ids are allowed", "input": ids,
+        }])
+    return values
+
+
+IdsParam = Annotated[Optional[list[uuid.UUID]], Depends(ids_params)]
@@ -1,16 +1,42 @@
-from typing import Any, Annotated
+from typing import Any, Annotated, Optional
 
 from fastapi import Query, Depends
 
+from app.base.repos.count import CountStrategy
+
+COUNT_DESCRIPTION = "total_count strategy: exact, window (same query), none (skip), cached (per-filter TTL cache)"
+
 
 def pagination_params(
         offset: int = Query(default=0, description="offset for pagination"),
-        limit: int = Query(default=100, le=200, description="limit for pagination")
+        limit: int = Query(default=100, le=200, description="limit for pagination"),
+        count_strategy: CountStrategy = Query(default=CountStrategy.EXACT, alias="count", description=COUNT_DESCRIPTION),
 ) -> dict[str, Any]:
     return {
         "offset": offset,
-        "limit": limit
+        "limit": limit,
+        "count_strategy": count_strategy,
     }
 
 
 PaginationParam = Annotated[dict, Depends(pagination_params)]
+
+
+def cursor_pagination_params(
+        cursor: Optional[str] = Query(default=None, description="cursor (next_cursor/prev_cursor) from a previous page"),
+        offset: int = Query(default=0, ge=0, description="offset for pagination; cannot be combined with cursor"),
+        limit: int = Query(default=100, le=200, description="limit for pagination"),
+        count_strategy: Optional[CountStrategy] = Query(
+            default=None, alias="count", description=f"{COUNT_DESCRIPTION}; exact by default, none with a cursor",
+        ),
+) -> dict[str, Any]:
+    """Cursor pagination that still accepts offset paging; giving both is a 400 (rejected by the repository)."""
+    return {
+        "cursor": cursor,
+        "offset": offset,
+        "limit": limit,
+        "count_strategy": count_strategy,
+    }
+
+
+CursorPaginationParam = Annotated[dict, Depends(cursor_pagination_params)]
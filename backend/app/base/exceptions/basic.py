@@ -21,3 +21,9 @@ class NotFoundException(CustomException):
 class ConflictException(CustomException):
     status_code = status.HTTP_409_CONFLICT
     message = "Conflict"
+
+
+class ServiceUnavailableException(CustomException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    message = "Service Unavailable"
+    trace = False
@@ -1,16 +1,26 @@
 import uuid
 from datetime import datetime, timezone
-from typing import Optional, Union, Generic, Sequence, TypeVar, Any
+from typing import Optional, Union, Generic, Sequence, TypeVar, Any, ClassVar, AsyncIterator, Callable, Mapping
 
 from sqlalchemy import (
-    select, update, delete, literal, func,
+    select, insert, update, delete, literal, func, tuple_, case,
 )
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy import Column, inspect as sa_inspect
+from sqlalchemy.orm import load_only
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.dml import Update, Delete
+from sqlalchemy.sql.base import Executable
 from sqlalchemy.sql.selectable import Select
-from sqlalchemy.sql.elements import ColumnElement, UnaryExpression
+from sqlalchemy.sql import operators, visitors
+from sqlalchemy.sql.elements import ColumnElement, UnaryExpression, BinaryExpression, BindParameter
 from pydantic import BaseModel
 
+from app.base.repos.count import CountStrategy, CountCache
+from app.base.repos.loader import BatchLoader, ROW_IDENTITIES_OPTION
+from app.base.repos.cursor import (
+    KeysetColumns, resolve_keyset_columns, keyset_order_by, keyset_filter, encode_cursor, decode_cursor,
+)
 from app.base.schemas.paginated import PaginatedList
 
 ModelType = TypeVar("ModelType", bound=Any)
@@ -19,7 +29,7 @@ UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 PrimaryKeyType = Union[Sequence[Union[str, int, uuid.UUID]], Union[str, int, uuid.UUID]]
 WhereClause = ColumnElement[bool] | Sequence[ColumnElement[bool]]
-
+TStatement = TypeVar("TStatement", bound=Executable)
 
 class BaseRepository(
     Generic[
@@ -32,6 +42,14 @@ class BaseRepository(
     default_order_by_col: Optional[str] = "updated_at"
     is_deleted_column: Optional[str] = "is_deleted"
     deleted_at_column: Optional[str] = "deleted_at"
+    count_cache: ClassVar[CountCache] = CountCache()
+    # Maximum bound parameters per statement, by dialect name (unknown dialects use the lowest common limit).
+    max_bind_params: ClassVar[dict[str, int]] = {"sqlite": 32766, "postgresql": 32767}
+    default_max_bind_params: ClassVar[int] = 999
+    # Use INSERT/UPDATE ... RETURNING when the database supports it (SQLite 3.35+, PostgreSQL).
+    use_returning: ClassVar[bool] = True
+    # Statements that only depend on the model, built once per process (see _cached_statement).
+    _statement_cache: ClassVar[dict[tuple[type, type, str], Executable]] = {}
 
     def __init__(self):
         self._primary_keys = self._get_primary_keys(self.model)
@@ -41,17 +59,7 @@ class BaseRepository(
         return self.model.__name__
 
     def model_repr(self, pk):
-        if not self._primary_keys:
-            raise ValueError("No primary key defined for this model.")
-
-        if not isinstance(pk, Sequence) or isinstance(pk, str):
-            pk_values = [pk]
-        else:
-            pk_values = pk
-
-        if len(self._primary_keys) != len(pk_values):
-            raise ValueError(
-                f"Incorrect number of primary key values provided. Expected {len(self._primary_keys)}, got {len(pk_values)}.")
+        pk_values = self._pk_values(pk)
         pk_str = ", ".join(
             f"{pk_col.key}={str(value)}"
             for pk_col, value in zip(self._primary_keys, pk_values)
@@ -66,7 +74,8 @@ class BaseRepository(
         primary_key_columns: Sequence[Column] = inspector_result.mapper.primary_key
         return primary_key_columns
 
-    def _get_primary_key_filters(self, pk: PrimaryKeyType):
+    def _pk_values(self, pk: PrimaryKeyType) -> Sequence[Any]:
+        """Normalize a primary key (single value or sequence) into one value per primary key column."""
         if not self._primary_keys:
             raise ValueError("No primary key defined for this model.")
 
@@ -78,40 +87,135 @@ class BaseRepository(
         if len(self._primary_keys) != len(pk_values):
             raise ValueError(
                 f"Incorrect number of primary key values provided. Expected {len(self._primary_keys)}, got {len(pk_values)}.")
+        return pk_values
 
+    def _get_primary_key_filters(self, pk: PrimaryKeyType):
+        pk_values = self._pk_values(pk)
         return [
             pk_col == value
             for pk_col, value in zip(self._primary_keys, pk_values)
         ]
 
+    @staticmethod
+    def _where_clauses(where: Optional[WhereClause]) -> list[ColumnElement[bool]]:
+        """Normalize a where clause (single condition, sequence or None) into a list."""
+        if where is None:
+            return []
+        if isinstance(where, Sequence):
+            return list(where)
+        return [where]
+
+    def _cached_statement(self, name: str, factory: Callable[[], TStatement]) -> TStatement:
+        """
+        Return the statement built by ``factory``, building it once per repository class and model.
+
+        Reusing the same (immutable) construct skips rebuilding it and lets SQLAlchemy memoize its cache
+        key, so a hot query costs a compiled-cache lookup instead of construction plus key generation.
+        Only cache statements whose varying parts are ``bindparam()`` values supplied at execution.
+        """
+        key = (type(self), self.model, name)
+        stmt = self._statement_cache.get(key)
+        if stmt is None:
+            stmt = self._statement_cache[key] = factory()
+        return stmt
+
+    def _default_order_by(self) -> list[UnaryExpression]:
+        default_order_by = getattr(self.model, self.default_order_by_col, None) if self.default_order_by_col else None
+        if default_order_by is None:
+            return []
+        return [default_order_by.desc()]
+
+    def _load_options(self, fields: Optional[Sequence[str]]) -> list[Any]:
+        """
+        Loader options restricting the loaded columns to ``fields`` (plus the primary key).
+
+        Unloaded columns raise on access instead of lazy loading, which would need I/O outside the query.
+        """
+        if fields is None:
+            return []
+        mapper = sa_inspect(self.model).mapper
+        unknown_fields = set(fields) - set(mapper.column_attrs.keys())
+        if unknown_fields:
+            raise ValueError(f"Unknown fields for model {self.model.__name__}: {unknown_fields}")
+
+        pk_fields = [mapper.get_property_by_column(pk_col).key for pk_col in self._primary_keys]
+        attrs = [getattr(self.model, key) for key in dict.fromkeys([*pk_fields, *fields])]
+        return [load_only(*attrs, raiseload=True)]
+
     def _select(
             self,
             where: WhereClause = (),
-            order_by: Sequence[UnaryExpression] = ()
+            order_by: Sequence[UnaryExpression] = (),
+            fields: Optional[Sequence[str]] = None,
     ) -> Select:
-        stmt = select(self.model)
+        if order_by is not None and order_by != ():
+            stmt = self._cached_statement("select", lambda: select(self.model)).order_by(*order_by)
+        else:
+            stmt = self._cached_statement(
+                "select_default_order", lambda: select(self.model).order_by(*self._default_order_by())
+            )
+        load_options = self._load_options(fields)
+        if load_options:
+            stmt = stmt.options(*load_options)
         if where is not None:
             if isinstance(where, Sequence):
                 if where:
                     stmt = stmt.where(*where)
             else:
                 stmt = stmt.where(where)
-
-        if order_by is not None and order_by != ():
-            stmt = stmt.order_by(*order_by)
-        else:
-            default_order_by = getattr(self.model, self.default_order_by_col, None)
-            if default_order_by is not None:
-                stmt = stmt.order_by(default_order_by.desc())
         return stmt
 
+    def _keyset_columns(self, order_by: Optional[Sequence[UnaryExpression]]) -> Optional[KeysetColumns]:
+        """
+        Resolve the active ordering plus the primary key into keyset columns.
+
+        Returns None when the ordering contains expressions other than columns of this model.
+        """
+        clauses = order_by if order_by is not None and order_by != () else self._default_order_by()
+        keys = resolve_keyset_columns(clauses)
+        if keys is None:
+            return None
+
+        mapper = sa_inspect(self.model).mapper
+        if any(col.table is not mapper.local_table for col, _ in keys):
+            return None
+        # The primary key makes the ordering total, so every row has a unique position.
+        tie_desc = keys[-1][1] if keys else False
+        ordered_keys = {col.key for col, _ in keys}
+        keys.extend((pk_col, tie_desc) for pk_col in self._primary_keys if pk_col.key not in ordered_keys)
+        return keys
+
+    def _keyset_anchor(self, keys: KeysetColumns, values: Sequence[Any]) -> list[Any]:
+        """
+        Compare against the stored values of the cursor row rather than the decoded ones.
+
+        Round-tripping through the cursor can change a value's database representation (e.g. SQLite
+        stores ``server_default`` timestamps without fractional seconds), so non-key columns are read
+        back by primary key, falling back to the cursor values if that row no longer exists.
+        """
+        pk_values = {col.key: value for (col, _), value in zip(keys, values) if col.primary_key}
+        anchor_table = sa_inspect(self.model).mapper.local_table.alias("cursor_anchor")
+        anchor_filters = [anchor_table.c[key] == value for key, value in pk_values.items()]
+        return [
+            value if col.primary_key else func.coalesce(
+                select(anchor_table.c[col.key]).where(*anchor_filters).scalar_subquery(),
+                literal(value, type_=col.type),
+            )
+            for (col, _), value in zip(keys, values)
+        ]
+
+    def _keyset_values(self, keys: KeysetColumns, obj: ModelType) -> list[Any]:
+        mapper = sa_inspect(self.model).mapper
+        return [getattr(obj, mapper.get_property_by_column(mapper.local_table.c[col.key]).key) for col, _ in keys]
+
     async def get(
             self,
             session: AsyncSession,
             where: WhereClause = (),
-            order_by: Sequence[UnaryExpression] = ()
+            order_by: Sequence[UnaryExpression] = (),
+            fields: Optional[Sequence[str]] = None,
     ) -> Optional[ModelType]:
-        stmt = self._select(where, order_by)
+        stmt = self._select(where, order_by, fields=fields)
         stmt = stmt.limit(1)
 
         db_row = await session.execute(stmt)
@@ -121,41 +225,171 @@ class BaseRepository(
             self,
             session: AsyncSession,
             pk: PrimaryKeyType,
+            fields: Optional[Sequence[str]] = None,
+            where: WhereClause = (),
     ) -> Optional[ModelType]:
-        if not self._primary_keys:
-            raise ValueError("No primary key defined for this model.")
-
-        pk_values: Union[Sequence, Any]
-        if not isinstance(pk, Sequence) or isinstance(pk, str):
-            pk_values = [pk]
-        else:
-            pk_values = pk
-
-        if len(self._primary_keys) != len(pk_values):
-            raise ValueError(
-                f"Incorrect number of primary key values provided. Expected {len(self._primary_keys)}, got {len(pk_values)}.")
-
+        """
+        Fetch one row by primary key, from the identity map when possible.
+
+        Extra ``where`` conditions (e.g. an ownership predicate) are fused into the SELECT, so a row
+        that exists but does not match them is reported as missing. Simple ``column == value``
+        conditions are checked against a row already in the identity map instead of querying again.
+        """
+        extra_filters = self._where_clauses(where)
+        if extra_filters:
+            obj = self._loaded_from_identity_map(session, tuple(self._pk_values(pk)))
+            matched = None if obj is None else self._matches_loaded(obj, extra_filters)
+            if matched is not None:
+                return obj if matched else None
+            return await self.get(session, where=[*self._get_primary_key_filters(pk), *extra_filters], fields=fields)
+
+        pk_values = self._pk_values(pk)
         if len(self._primary_keys) == 1:
             ident = pk_values[0]
         else:
             ident = dict(zip([pk_col.key for pk_col in self._primary_keys], pk_values))
 
+        if fields is not None:
+            return await session.get(self.model, ident, options=self._load_options(fields))
         return await session.get(self.model, ident)
 
+    def _loaded_from_identity_map(self, session: AsyncSession, ident: tuple) -> Optional[ModelType]:
+        obj = session.identity_map.get(sa_inspect(self.model).mapper.identity_key_from_primary_key(ident))
+        if obj is not None and not sa_inspect(obj).expired:
+            return obj
+        return None
+
+    def _matches_loaded(self, obj: ModelType, filters: Sequence[ColumnElement[bool]]) -> Optional[bool]:
+        """Evaluate ``column == value`` filters in memory; None if any filter is anything else or not loaded."""
+        state = sa_inspect(obj)
+        mapper = state.mapper
+        for clause in filters:
+            if not (
+                    isinstance(clause, BinaryExpression) and clause.operator is operators.eq
+                    and isinstance(clause.left, Column) and clause.left.table is mapper.local_table
+                    and isinstance(clause.right, BindParameter)
+            ):
+                return None
+            key = mapper.get_property_by_column(clause.left).key
+            if key not in state.dict:
+                return None
+            if state.dict[key] != clause.right.effective_value:
+                return False
+        return True
+
+    def _chunk_pks(self, session: AsyncSession, identities: Sequence[tuple]) -> list[Sequence[tuple]]:
+        """Split primary key tuples so an ``IN`` list stays under the dialect's bound parameter limit."""
+        per_chunk = max(1, self._max_bind_params(session) // len(self._primary_keys))
+        return [identities[i:i + per_chunk] for i in range(0, len(identities), per_chunk)]
+
+    def _pks_condition(self, identities: Sequence[tuple]) -> ColumnElement[bool]:
+        if len(self._primary_keys) == 1:
+            return self._primary_keys[0].in_([ident[0] for ident in identities])
+        return tuple_(*self._primary_keys).in_(identities)
+
+    async def get_by_pks(
+            self,
+            session: AsyncSession,
+            pks: Sequence[PrimaryKeyType],
+            fields: Optional[Sequence[str]] = None,
+    ) -> list[Optional[ModelType]]:
+        """
+        Fetch many rows by primary key, in the order of ``pks`` (None where a row does not exist).
+
+        Objects already in the session's identity map are reused without a query; the rest are loaded
+        with ``IN`` queries, chunked under the dialect's bound parameter limit.
+        """
+        mapper = sa_inspect(self.model).mapper
+        identities = [tuple(self._pk_values(pk)) for pk in pks]
+
+        found: dict[tuple, ModelType] = {}
+        missing: list[tuple] = []
+        for ident in dict.fromkeys(identities):
+            obj = self._loaded_from_identity_map(session, ident)
+            if obj is not None:
+                found[ident] = obj
+            else:
+                missing.append(ident)
+
+        load_options = self._load_options(fields)
+        for chunk in self._chunk_pks(session, missing):
+            stmt = self._cached_statement("select", lambda: select(self.model)).where(self._pks_condition(chunk))
+            if load_options:
+                stmt = stmt.options(*load_options)
+            for obj in (await session.scalars(stmt)).all():
+                found[mapper.identity_key_from_instance(obj)[1]] = obj
+
+        return [found.get(ident) for ident in identities]
+
+    async def exists_by_pk(self, session: AsyncSession, pk: PrimaryKeyType) -> bool:
+        """Whether the row exists, without loading it (``SELECT 1 ... LIMIT 1``)."""
+        return await self.exists(session, self._get_primary_key_filters(pk))
+
+    def loader(self, session: AsyncSession) -> BatchLoader[ModelType]:
+        """The session-scoped loader coalescing concurrent primary key lookups (see BatchLoader)."""
+        return BatchLoader.for_session(self, session)
+
     async def exists(
             self,
             session: AsyncSession,
             where: WhereClause = (),
     ) -> bool:
-        stmt = select(literal(1))  # select 1
-        stmt = stmt.select_from(self.model)
-        if where is not None:
-            stmt = stmt.where(where)
-        stmt = stmt.limit(1)
+        stmt = self._cached_statement(
+            "exists", lambda: select(literal(1)).select_from(self.model).limit(1)  # select 1
+        )
+        where_clauses = self._where_clauses(where)
+        if where_clauses:
+            stmt = stmt.where(*where_clauses)
 
         result = await session.execute(stmt)
         return result.scalar_one_or_none() is not None
 
+    async def first_existing(
+            self,
+            session: AsyncSession,
+            conditions: Sequence[ColumnElement[bool]],
+    ) -> Optional[int]:
+        """
+        Index of the first condition matched by at least one row, or None, in a single query.
+
+        Renders ``SELECT CASE WHEN EXISTS (...) THEN 0 WHEN EXISTS (...) THEN 1 ... END``, so several
+        existence checks cost one round trip and the database stops at the first match. Conditions
+        that would exceed the dialect's bound parameter limit are checked in further queries, in order.
+        """
+        for start, chunk in self._chunk_conditions(session, conditions):
+            whens = [
+                (select(literal(1)).select_from(self.model).where(condition).exists(), start + index)
+                for index, condition in enumerate(chunk)
+            ]
+            matched = (await session.execute(select(case(*whens, else_=None)))).scalar_one()
+            if matched is not None:
+                return matched
+        return None
+
+    def _chunk_conditions(
+            self, session: AsyncSession, conditions: Sequence[ColumnElement[bool]]
+    ) -> list[tuple[int, Sequence[ColumnElement[bool]]]]:
+        """Split conditions, with the index of each chunk's first one, under the bound parameter limit."""
+        max_params = self._max_bind_params(session)
+        chunks, start, params = [], 0, 0
+        for index, condition in enumerate(conditions):
+            # The condition's own parameters, plus the EXISTS subquery's literal and the THEN index.
+            cost = sum(1 for element in visitors.iterate(condition) if isinstance(element, BindParameter)) + 2
+            if index > start and params + cost > max_params:
+                chunks.append((start, conditions[start:index]))
+                start, params = index, 0
+            params += cost
+        if start < len(conditions):
+            chunks.append((start, conditions[start:]))
+        return chunks
+
+    def _supports_returning(self, session: AsyncSession, statement: str) -> bool:
+        """Whether ``statement`` ("insert", "update" or "delete") can use RETURNING on this session's database."""
+        if not self.use_returning:
+            return False
+        dialect = session.get_bind().dialect
+        return bool(getattr(dialect, f"{statement}_returning", False))
+
     async def create(
             self,
             session: AsyncSession,
@@ -164,12 +398,137 @@ class BaseRepository(
     ) -> ModelType:
         obj_dict = obj_in.model_dump()
         obj_dict.update(update_fields)
+        if self._supports_returning(session, "insert"):
+            # Single round trip: server defaults come back with the inserted row.
+            stmt = insert(self.model).values(obj_dict).returning(self.model)
+            result = await session.scalars(stmt)
+            return result.one()
+
         db_obj: ModelType = self.model(**obj_dict)
         session.add(db_obj)
         await session.flush()
         await session.refresh(db_obj)
         return db_obj
 
+    def _row_data(self, obj_in: Union[CreateSchemaType, dict[str, Any]], update_fields: dict[str, Any]) -> dict[str, Any]:
+        row = dict(obj_in) if isinstance(obj_in, dict) else obj_in.model_dump()
+        row.update(update_fields)
+        return row
+
+    def _max_bind_params(self, session: AsyncSession) -> int:
+        return self.max_bind_params.get(session.get_bind().dialect.name, self.default_max_bind_params)
+
+    def _chunk_rows(self, session: AsyncSession, rows: Sequence[dict[str, Any]]) -> list[Sequence[dict[str, Any]]]:
+        """Split rows so a multi-row INSERT stays under the dialect's bound parameter limit."""
+        max_params = self._max_bind_params(session)
+        # Python-side column defaults are bound too, so budget for every column of the table.
+        params_per_row = len(sa_inspect(self.model).mapper.local_table.columns)
+        rows_per_chunk = max(1, max_params // params_per_row)
+        return [rows[i:i + rows_per_chunk] for i in range(0, len(rows), rows_per_chunk)]
+
+    async def create_many(
+            self,
+            session: AsyncSession,
+            objs: Sequence[Union[CreateSchemaType, dict[str, Any]]],
+            returning: bool = True,
+            **update_fields: Any,
+    ) -> Union[Sequence[ModelType], int]:
+        """
+        Insert many rows with multi-row INSERT statements, chunked under the driver's parameter limit.
+
+        Returns the created objects in input order, or the number of inserted rows if ``returning`` is False.
+        """
+        rows = [self._row_data(obj_in, update_fields) for obj_in in objs]
+        if not rows:
+            return [] if returning else 0
+
+        if returning and not self._supports_returning(session, "insert"):
+            # No INSERT ... RETURNING on this database: let the unit of work insert and fetch the rows.
+            db_objs = [self.model(**row) for row in rows]
+            session.add_all(db_objs)
+            await session.flush()
+            return db_objs
+
+        created: list[ModelType] = []
+        for chunk in self._chunk_rows(session, rows):
+            if returning:
+                stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+                result = await session.scalars(stmt, chunk)
+                created.extend(result.all())
+            else:
+                await session.execute(insert(self.model), chunk)
+        return created if returning else len(rows)
+
+    async def upsert_many(
+            self,
+            session: AsyncSession,
+            objs: Sequence[Union[CreateSchemaType, dict[str, Any]]],
+            conflict_cols: Sequence[str],
+            update_cols: Optional[Sequence[str]] = None,
+            returning: bool = True,
+            **update_fields: Any,
+    ) -> Union[Sequence[ModelType], int]:
+        """
+        Insert many rows, updating existing rows that conflict on ``conflict_cols``.
+
+        Uses ``INSERT ... ON CONFLICT DO UPDATE`` (SQLite, PostgreSQL) with multi-row VALUES, chunked under
+        the driver's parameter limit. ``update_cols`` defaults to every provided column except the conflict
+        columns and the primary key; with nothing to update, conflicting rows are skipped (DO NOTHING) and
+        are not returned. All rows must provide the same columns.
+
+        Returns the inserted or updated objects in input order, or the affected row count if ``returning``
+        is False.
+        """
+        rows = [self._row_data(obj_in, update_fields) for obj_in in objs]
+        if not rows:
+            return [] if returning else 0
+        if any(row.keys() != rows[0].keys() for row in rows):
+            raise ValueError("All rows of an upsert must provide the same columns.")
+
+        dialect = session.get_bind().dialect
+        dialect_insert = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}.get(dialect.name)
+        if dialect_insert is None:
+            raise NotImplementedError(f"Upsert is not supported for the '{dialect.name}' dialect.")
+        if returning and not self._supports_returning(session, "insert"):
+            raise NotImplementedError(f"Upsert with RETURNING is not supported by this '{dialect.name}' database.")
+
+        model_columns = {col.key for col in sa_inspect(self.model).mapper.columns}
+        extra_fields = (set(rows[0]) | set(conflict_cols)) - model_columns
+        if extra_fields:
+            raise ValueError(f"Extra fields provided that are not in the model {self.model.__name__}: {extra_fields}")
+        if update_cols is None:
+            pk_keys = {pk_col.key for pk_col in self._primary_keys}
+            update_cols = [key for key in rows[0] if key not in conflict_cols and key not in pk_keys]
+
+        affected: list[ModelType] = []
+        affected_count = 0
+        for chunk in self._chunk_rows(session, rows):
+            stmt = dialect_insert(self.model).values(list(chunk))
+            if update_cols:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=list(conflict_cols),
+                    set_={key: stmt.excluded[key] for key in update_cols},
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_cols))
+
+            if returning:
+                result = await session.scalars(stmt.returning(self.model),
+                                               execution_options={"populate_existing": True})
+                affected.extend(result.all())
+            else:
+                result = await session.execute(stmt)
+                affected_count += result.rowcount
+
+        if not returning:
+            return affected_count
+        # RETURNING order is not guaranteed for multi-row VALUES, so restore the input order.
+        position = {tuple(row.get(key) for key in conflict_cols): i for i, row in enumerate(rows)}
+        return sorted(
+            affected,
+            key=lambda obj: position.get(tuple(getattr(obj, key) for key in conflict_cols), len(rows)),
+        )
+
     async def get_multi(
             self,
             session: AsyncSession,
@@ -177,35 +536,121 @@ class BaseRepository(
             limit: Optional[int] = 100,
             where: WhereClause = (),
             order_by: Sequence[UnaryExpression] = (),
+            cursor: Optional[str] = None,
+            count_strategy: Optional[CountStrategy] = None,
+            fields: Optional[Sequence[str]] = None,
     ) -> PaginatedList[ModelType]:
+        """
+        Fetch a page of rows.
+
+        Without a cursor, the page is selected with OFFSET/LIMIT. With a cursor (taken from
+        ``next_cursor``/``prev_cursor`` of a previous page), rows are selected by comparing the
+        ordering columns plus the primary key against the cursor values, so the cost of a page
+        does not grow with its depth. Keyset columns are expected to be non-nullable.
+
+        ``count_strategy`` selects how ``total_count`` is computed (see CountStrategy); by default
+        offset pages count exactly and cursor pages skip counting. The window strategy counts within
+        the page query, so it falls back to an exact count for cursor pages (whose WHERE includes the
+        cursor predicate) and for empty pages past the end.
+
+        ``fields`` restricts the loaded columns (sparse fieldset); the primary key and the ordering
+        columns needed for cursors are always loaded.
+        """
         if limit is not None and limit < 0:
             raise ValueError("Limit must be non-negative.")
         if offset < 0:
             raise ValueError("Offset must be non-negative.")
+        if cursor is not None and offset:
+            raise ValueError("Offset and cursor cannot be combined.")
+
+        where = self._where_clauses(where)
+        keys = self._keyset_columns(order_by)
+        if cursor is not None and keys is None:
+            raise ValueError("Cursor pagination requires ordering by columns of the model.")
+        if fields is not None and keys is not None:
+            mapper = sa_inspect(self.model).mapper
+            fields = [*fields, *(mapper.get_property_by_column(mapper.local_table.c[col.key]).key for col, _ in keys)]
+
+        if count_strategy is None:
+            count_strategy = CountStrategy.NONE if cursor is not None else CountStrategy.EXACT
+        if count_strategy == CountStrategy.WINDOW and cursor is not None:
+            count_strategy = CountStrategy.EXACT
 
         # Total count
-        count_stmt = select(func.count()).select_from(self.model)
-        if where is not None:
-            count_stmt = count_stmt.where(*where)
-        total_count_result = await session.execute(count_stmt)
-        total_count = total_count_result.scalar_one()
+        total_count: Optional[int] = None
+        if count_strategy in (CountStrategy.EXACT, CountStrategy.CACHED):
+            total_count = await self._count(session, where, cached=count_strategy == CountStrategy.CACHED)
 
         # Query
-        stmt = self._select(where=where, order_by=order_by)
+        reverse = False
+        if cursor is not None:
+            values, reverse = decode_cursor(keys, cursor)
+            anchor = self._keyset_anchor(keys, values)
+            stmt = self._select(where=[*where, keyset_filter(keys, anchor, reverse)],
+                                order_by=keyset_order_by(keys, reverse), fields=fields)
+        else:
+            stmt = self._select(where=where, order_by=order_by, fields=fields)
+            if keys is not None:
+                # Break ties on the primary key so offset pages and cursors agree on row order.
+                tie_breakers = [key for key in keys if any(key[0] is pk_col for pk_col in self._primary_keys)]
+                stmt = stmt.order_by(*keyset_order_by(tie_breakers))
         stmt = stmt.offset(offset)
         if limit is not None:
-            stmt = stmt.limit(limit)
-
-        result = await session.execute(stmt)
-        data = result.scalars().all()
+            # Fetch one extra row to know whether another page follows.
+            stmt = stmt.limit(limit + 1)
+
+        if count_strategy == CountStrategy.WINDOW:
+            stmt = stmt.add_columns(func.count().over().label("total_count"))
+            rows = (await session.execute(stmt)).all()
+            data = [row[0] for row in rows]
+            if rows:
+                total_count = rows[0].total_count
+            elif offset == 0:
+                total_count = 0
+            else:
+                total_count = await self._count(session, where)
+        else:
+            result = await session.execute(stmt)
+            data = list(result.scalars().all())
+
+        has_more = limit is not None and len(data) > limit
+        if has_more:
+            data = data[:limit]
+        if reverse:
+            data.reverse()
+
+        next_cursor = prev_cursor = None
+        if keys is not None and data:
+            if has_more or reverse:
+                next_cursor = encode_cursor(keys, self._keyset_values(keys, data[-1]))
+            if (has_more and reverse) or (cursor is not None and not reverse):
+                prev_cursor = encode_cursor(keys, self._keyset_values(keys, data[0]), reverse=True)
 
         return PaginatedList(
             items=data,
             total_count=total_count,
             offset=offset,
             limit=limit,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
         )
 
+    async def _count(self, session: AsyncSession, where: Sequence[ColumnElement[bool]], cached: bool = False) -> int:
+        count_stmt = select(func.count()).select_from(self.model)
+        if where:
+            count_stmt = count_stmt.where(*where)
+
+        if cached:
+            total_count = self.count_cache.get(count_stmt)
+            if total_count is not None:
+                return total_count
+
+        total_count_result = await session.execute(count_stmt)
+        total_count = total_count_result.scalar_one()
+        if cached:
+            self.count_cache.set(count_stmt, total_count)
+        return total_count
+
     async def get_all(
             self,
             session: AsyncSession,
@@ -218,18 +663,40 @@ class BaseRepository(
             limit=None,
             where=where,
             order_by=order_by,
+            count_strategy=CountStrategy.NONE,
         )
         return res.items
 
-    async def update_by_pk(
+    async def stream(
             self,
             session: AsyncSession,
-            pk: PrimaryKeyType,
-            obj_in: Union[UpdateSchemaType, dict[str, Any]],
-            return_updated_obj: bool = True,
-            **update_fields: Any,
-    ) -> Optional[ModelType]:
-        filters = self._get_primary_key_filters(pk)
+            where: WhereClause = (),
+            order_by: Sequence[UnaryExpression] = (),
+            batch_size: int = 1000,
+    ) -> AsyncIterator[ModelType]:
+        """
+        Iterate over matching rows without materializing the whole result.
+
+        Rows are fetched ``batch_size`` at a time from a server-side cursor, and each batch is expunged
+        from the session once the consumer moves past it, so memory stays flat for large exports.
+        Yielded objects are detached afterwards; don't rely on lazy loading them.
+        """
+        if batch_size <= 0:
+            raise ValueError("Batch size must be positive.")
+        stmt = self._select(where=where, order_by=order_by).execution_options(yield_per=batch_size)
+        result = await session.stream_scalars(stmt)
+        try:
+            async for batch in result.partitions():
+                for obj in batch:
+                    yield obj
+                for obj in batch:
+                    session.expunge(obj)
+        finally:
+            await result.close()
+
+    def _update_data(
+            self, obj_in: Union[UpdateSchemaType, dict[str, Any]], update_fields: dict[str, Any]
+    ) -> dict[str, Any]:
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
@@ -244,8 +711,47 @@ class BaseRepository(
         extra_fields = set(update_data.keys()) - model_columns
         if extra_fields:
             raise ValueError(f"Extra fields provided that are not in the model {self.model.__name__}: {extra_fields}")
+        return update_data
+
+    def _soft_delete_values(self) -> dict[str, Any]:
+        has_is_deleted = hasattr(self.model, self.is_deleted_column)
+
+        if not has_is_deleted:
+            raise ValueError(
+                f"Soft delete requires the column '{self.is_deleted_column}' in model {self.model.__name__}.")
+
+        if self.deleted_at_column and not hasattr(self.model, self.deleted_at_column):
+            raise ValueError(
+                f"Soft delete is configured to use '{self.deleted_at_column}', but it's missing in model {self.model.__name__}."
+            )
+
+        update_values: dict[str, Any] = {self.is_deleted_column: True}
+        if self.deleted_at_column and hasattr(self.model, self.deleted_at_column):
+            update_values[self.deleted_at_column] = datetime.now(timezone.utc)
+        return update_values
+
+    async def update_by_pk(
+            self,
+            session: AsyncSession,
+            pk: PrimaryKeyType,
+            obj_in: Union[UpdateSchemaType, dict[str, Any]],
+            return_updated_obj: bool = True,
+            where: WhereClause = (),
+            **update_fields: Any,
+    ) -> Optional[ModelType]:
+        """Update one row by primary key; returns None if no row matched the key and ``where``."""
+        filters = [*self._get_primary_key_filters(pk), *self._where_clauses(where)]
+        update_data = self._update_data(obj_in, update_fields)
+
+        stmt = update(self.model).filter(*filters).values(**update_data).execution_options(
+            **{ROW_IDENTITIES_OPTION: [tuple(self._pk_values(pk))]}
+        )
+        if return_updated_obj and self._supports_returning(session, "update"):
+            # Single round trip: the updated row refreshes the identity map instead of a re-SELECT.
+            stmt = stmt.returning(self.model).execution_options(populate_existing=True)
+            result = await session.scalars(stmt)
+            return result.one_or_none()
 
-        stmt = update(self.model).filter(*filters).values(**update_data)
         result = await session.execute(stmt)
 
         if result.rowcount == 0:
@@ -253,32 +759,63 @@ class BaseRepository(
         await session.flush()
         return await self.get(session, where=filters) if return_updated_obj else None
 
+    async def update_by_pks(
+            self,
+            session: AsyncSession,
+            objs_in: Mapping[PrimaryKeyType, Union[UpdateSchemaType, dict[str, Any]]],
+            where: WhereClause = (),
+    ) -> list[Optional[ModelType]]:
+        """
+        Update each row with its own values, set-wise: rows with equal values share one
+        ``UPDATE ... WHERE pk IN (...)`` (chunked under the bound parameter limit).
+
+        Returns the updated objects in the order of ``objs_in`` (None where no row matched the key and ``where``).
+        """
+        groups: list[tuple[dict[str, Any], list[tuple]]] = []
+        identities = []
+        for pk, obj_in in objs_in.items():
+            values = self._update_data(obj_in, {})
+            ident = tuple(self._pk_values(pk))
+            identities.append(ident)
+            for group_values, group_identities in groups:
+                if group_values == values:
+                    group_identities.append(ident)
+                    break
+            else:
+                groups.append((values, [ident]))
+
+        where_clauses = self._where_clauses(where)
+        returning = self._supports_returning(session, "update")
+        updated: dict[tuple, ModelType] = {}
+        for values, group_identities in groups:
+            for chunk in self._chunk_pks(session, group_identities):
+                stmt = update(self.model).where(self._pks_condition(chunk), *where_clauses).values(**values)
+                stmt = stmt.execution_options(**{ROW_IDENTITIES_OPTION: chunk})
+                if returning:
+                    stmt = stmt.returning(self.model).execution_options(populate_existing=True)
+                    for obj in (await session.scalars(stmt)).all():
+                        updated[sa_inspect(obj).identity] = obj
+                else:
+                    await session.execute(stmt)
+        if not returning:
+            for chunk in self._chunk_pks(session, identities):
+                stmt = select(self.model).where(self._pks_condition(chunk), *where_clauses)
+                for obj in (await session.scalars(stmt.execution_options(populate_existing=True))).all():
+                    updated[sa_inspect(obj).identity] = obj
+        return [updated.get(ident) for ident in identities]
+
     async def delete_by_pk(
             self,
             session: AsyncSession,
             pk: PrimaryKeyType,
             soft_delete: bool = False,
+            where: WhereClause = (),
     ) -> bool:
-        filters = self._get_primary_key_filters(pk)
-        if soft_delete:
-            has_is_deleted = hasattr(self.model, self.is_deleted_column)
-
-            if not has_is_deleted:
-                raise ValueError(
-                    f"Soft delete requires the column '{self.is_deleted_column}' in model {self.model.__name__}.")
-
-            if self.deleted_at_column and not hasattr(self.model, self.deleted_at_column):
-                raise ValueError(
-                    f"Soft delete is configured to use '{self.deleted_at_column}', but it's missing in model {self.model.__name__}."
-                )
-
-            update_values: dict[str, Any] = {self.is_deleted_column: True}
-            if self.deleted_at_column and hasattr(self.model, self.deleted_at_column):
-                update_values[self.deleted_at_column] = datetime.now(timezone.utc)
-
-            stmt = update(self.model).filter(*filters).values(**update_values)
-        else:
-            stmt = delete(self.model).filter(*filters)
+        """Delete one row by primary key; returns False if no row matched the key and ``where``."""
+        filters = [*self._get_primary_key_filters(pk), *self._where_clauses(where)]
+        stmt = self._delete_statement(filters, soft_delete).execution_options(
+            **{ROW_IDENTITIES_OPTION: [tuple(self._pk_values(pk))]}
+        )
 
         result = await session.execute(stmt)
 
@@ -286,3 +823,92 @@ class BaseRepository(
         if deleted_or_updated:
             await session.flush()
         return deleted_or_updated
+
+    async def delete_by_pks(
+            self,
+            session: AsyncSession,
+            pks: Sequence[PrimaryKeyType],
+            soft_delete: bool = False,
+            where: WhereClause = (),
+    ) -> int:
+        """
+        Delete many rows by primary key with ``IN`` statements, chunked under the bound parameter limit.
+
+        Extra ``where`` conditions are fused into every statement. Returns the number of affected rows.
+        """
+        identities = list(dict.fromkeys(tuple(self._pk_values(pk)) for pk in pks))
+        extra_filters = self._where_clauses(where)
+        deleted = 0
+        for chunk in self._chunk_pks(session, identities):
+            stmt = self._delete_statement([self._pks_condition(chunk), *extra_filters], soft_delete)
+            result = await session.execute(stmt.execution_options(**{ROW_IDENTITIES_OPTION: chunk}))
+            deleted += int(result.rowcount)
+        return deleted
+
+    def _delete_statement(self, filters: Sequence[ColumnElement[bool]], soft_delete: bool) -> Union[Update, Delete]:
+        if soft_delete:
+            return update(self.model).where(*filters).values(**self._soft_delete_values())
+        return delete(self.model).where(*filters)
+
+    async def _execute_where(
+            self,
+            session: AsyncSession,
+            stmt: Union[Update, Delete],
+            returning_ids: bool,
+    ) -> Union[int, list[Any]]:
+        if not returning_ids:
+            result = await session.execute(stmt)
+            return int(result.rowcount)
+
+        if self._supports_returning(session, "update" if isinstance(stmt, Update) else "delete"):
+            rows = (await session.execute(stmt.returning(*self._primary_keys))).all()
+        else:
+            # Without RETURNING, read the matching keys first within the same transaction.
+            id_stmt = select(*self._primary_keys).where(stmt.whereclause)
+            rows = (await session.execute(id_stmt)).all()
+            await session.execute(stmt)
+
+        if len(self._primary_keys) == 1:
+            return [row[0] for row in rows]
+        return [tuple(row) for row in rows]
+
+    async def update_where(
+            self,
+            session: AsyncSession,
+            where: WhereClause,
+            values: Union[UpdateSchemaType, dict[str, Any]],
+            returning_ids: bool = False,
+            **update_fields: Any,
+    ) -> Union[int, list[Any]]:
+        """
+        Update every row matching ``where`` with a single set-based UPDATE.
+
+        Returns the number of affected rows, or their primary keys if ``returning_ids`` is True.
+        """
+        filters = self._where_clauses(where)
+        if not filters:
+            raise ValueError("update_where requires a where clause.")
+        update_data = self._update_data(values, update_fields)
+
+        stmt = update(self.model).where(*filters).values(**update_data)
+        return await self._execute_where(session, stmt, returning_ids)
+
+    async def delete_where(
+            self,
+            session: AsyncSession,
+            where: WhereClause,
+            soft_delete: bool = False,
+            returning_ids: bool = False,
+    ) -> Union[int, list[Any]]:
+        """
+        Delete (or soft delete) every row matching ``where`` with a single set-based statement.
+
+        Soft deletes use the ``is_deleted_column``/``deleted_at_column`` configuration, as in delete_by_pk.
+        Returns the number of affected rows, or their primary keys if ``returning_ids`` is True.
+        """
+        filters = self._where_clauses(where)
+        if not filters:
+            raise ValueError("delete_where requires a where clause.")
+
+        stmt = self._delete_statement(filters, soft_delete)
+        return await self._execute_where(session, stmt, returning_ids)
@@ -0,0 +1,124 @@
+import enum
+import weakref
+from functools import lru_cache
+from typing import Any, Collection, Optional
+
+from cachetools import TTLCache
+from sqlalchemy import Table, event, inspect as sa_inspect
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+from sqlalchemy.sql.selectable import Select
+from sqlalchemy.sql.util import find_tables
+
+# session.info key: tables written in this transaction, whose counts are invalidated again when it ends.
+PENDING_COUNT_INVALIDATIONS_KEY = "count_cache_invalidations"
+
+# Every CountCache of the process; writes are evicted from all of them.
+_count_caches: "weakref.WeakSet[CountCache]" = weakref.WeakSet()
+
+
+class CountStrategy(str, enum.Enum):
+    """How get_multi computes PaginatedList.total_count."""
+    EXACT = "exact"
+    """Separate ``SELECT count(*)`` before the page query."""
+    WINDOW = "window"
+    """``count(*) OVER ()`` in the page query itself (single round trip)."""
+    NONE = "none"
+    """Skip counting; total_count is None."""
+    CACHED = "cached"
+    """Exact count, reused per filter until the cache entry expires."""
+
+
+class CountCache:
+    """
+    In-process TTL cache of total counts, keyed by the compiled count statement and its parameters.
+
+    Entries remember the tables their statement reads; every write of the process to one of those tables
+    evicts them (see ``_invalidate_written_tables``).
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        _count_caches.add(self)
+
+    @staticmethod
+    def key(stmt: Select) -> tuple[str, str]:
+        compiled = stmt.compile()
+        return str(compiled), repr(sorted(compiled.params.items()))
+
+    def get(self, stmt: Select) -> Optional[int]:
+        entry = self._cache.get(self.key(stmt))
+        return entry[1] if entry is not None else None
+
+    def set(self, stmt: Select, value: int) -> None:
+        tables = frozenset(t for t in find_tables(stmt, check_columns=True, include_joins=True) if isinstance(t, Table))
+        self._cache[self.key(stmt)] = (tables, value)
+
+    def delete_tables(self, tables: Collection[Table]) -> None:
+        """Drop every count reading one of ``tables``."""
+        for key, (entry_tables, _) in list(self._cache.items()):
+            if not entry_tables.isdisjoint(tables):
+                self._cache.pop(key, None)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __contains__(self, stmt: Any) -> bool:
+        return self.key(stmt) in self._cache
+
+
+def invalidate_tables(session: Session, tables: set[Table]) -> None:
+    """
+    Drop the counts of ``tables`` now, and again when the transaction ends.
+
+    The second pass covers a concurrent read that re-cached the old committed count before our commit.
+    """
+    for cache in list(_count_caches):
+        cache.delete_tables(tables)
+    session.info.setdefault(PENDING_COUNT_INVALIDATIONS_KEY, set()).update(tables)
+
+
+@lru_cache
+def _with_referencing_tables(table: Table) -> frozenset[Table]:
+    """``table`` and the tables referencing it by foreign key, directly or through other tables."""
+    tables = [table]
+    for current in tables:
+        for other in table.metadata.tables.values():
+            if other not in tables and any(fk.column.table is current for fk in other.foreign_keys):
+                tables.append(other)
+    return frozenset(tables)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _invalidate_pending(session: Session) -> None:
+    tables = session.info.pop(PENDING_COUNT_INVALIDATIONS_KEY, None)
+    if tables:
+        for cache in list(_count_caches):
+            cache.delete_tables(tables)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_written_tables(orm_execute_state: ORMExecuteState) -> None:
+    """Evict counts of tables written by statements (bulk inserts, upserts, updates and deletes)."""
+    state = orm_execute_state
+    mapper = state.bind_mapper
+    if mapper is None or not (state.is_insert or state.is_update or state.is_delete):
+        return
+    # A hard delete may cascade to the rows referencing it.
+    tables = _with_referencing_tables(mapper.local_table) if state.is_delete else {mapper.local_table}
+    invalidate_tables(state.session, set(tables))
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed_tables(session: Session, flush_context: UOWTransaction) -> None:
+    # Rows written by the unit of work (session.add, ORM deletes and cascades) rather than by a statement.
+    tables: set[Table] = set()
+    for obj in (*session.new, *session.dirty):
+        tables.add(sa_inspect(obj).mapper.local_table)
+    for obj in session.deleted:
+        tables.update(_with_referencing_tables(sa_inspect(obj).mapper.local_table))
+    if tables:
+        invalidate_tables(session, tables)
@@ -0,0 +1,114 @@
+import base64
+import datetime
+import decimal
+import json
+import uuid
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import ColumnElement, UnaryExpression
+
+# (column, descending) pairs describing a keyset ordering.
+KeysetColumns = list[tuple[ColumnElement, bool]]
+
+
+def resolve_keyset_columns(order_by: Sequence[Any]) -> Optional[KeysetColumns]:
+    """Resolve order_by clauses into (column, descending) pairs.
+
+    Returns None when a clause is not a plain (optionally asc/desc) column,
+    since keyset pagination can only compare column values.
+    """
+    keys: KeysetColumns = []
+    for clause in order_by:
+        # nulls_first()/nulls_last() wrap the asc/desc modifier
+        if isinstance(clause, UnaryExpression) and clause.modifier in (
+                operators.nulls_first_op, operators.nulls_last_op
+        ):
+            clause = clause.element
+        if isinstance(clause, UnaryExpression):
+            if clause.modifier not in (operators.desc_op, operators.asc_op):
+                return None
+            column, desc = clause.element, clause.modifier is operators.desc_op
+        else:
+            column, desc = getattr(clause, "__clause_element__", lambda: clause)(), False
+        if getattr(column, "key", None) is None or getattr(column, "table", None) is None:
+            return None
+        keys.append((column, desc))
+    return keys
+
+
+def keyset_order_by(keys: KeysetColumns, reverse: bool = False) -> list[UnaryExpression]:
+    """Build the ORDER BY clauses for the keyset, optionally reversed."""
+    return [col.desc() if desc != reverse else col.asc() for col, desc in keys]
+
+
+def keyset_filter(keys: KeysetColumns, values: Sequence[Any], reverse: bool = False) -> ColumnElement[bool]:
+    """Build the row-value predicate selecting rows strictly after (or before) the cursor.
+
+    Expanded as ``(a > :a) OR (a = :a AND b > :b) ...`` so mixed directions work on every dialect.
+    """
+    clauses = []
+    for i, (col, desc) in enumerate(keys):
+        after = col < values[i] if desc != reverse else col > values[i]
+        equals = [prev_col == value for (prev_col, _), value in zip(keys[:i], values[:i])]
+        clauses.append(and_(*equals, after))
+    return or_(*clauses)
+
+
+def keyset_signature(keys: KeysetColumns) -> list[str]:
+    """Stable description of the ordering, embedded in cursors to reject reuse across orderings."""
+    return [f"{'-' if desc else ''}{col.table.name}.{col.key}" for col, desc in keys]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, decimal.Decimal)):
+        return str(value)
+    raise TypeError(f"Object of type '{value.__class__.__name__}' is not cursor serializable")
+
+
+def encode_cursor(keys: KeysetColumns, values: Sequence[Any], reverse: bool = False) -> str:
+    """Encode keyset values into an opaque, URL-safe cursor string."""
+    payload = {"k": keyset_signature(keys), "v": list(values), "r": reverse}
+    raw = json.dumps(payload, default=_json_default, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _coerce(column: ColumnElement, value: Any) -> Any:
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if isinstance(value, python_type):
+        return value
+    if python_type in (datetime.datetime, datetime.date, datetime.time):
+        return python_type.fromisoformat(value)
+    return python_type(value)
+
+
+def decode_cursor(keys: KeysetColumns, cursor: str) -> tuple[list[Any], bool]:
+    """Decode a cursor produced by encode_cursor for the same ordering.
+
+    Returns:
+        The typed keyset values and whether the cursor points backwards.
+
+    Raises:
+        ValueError: If the cursor is malformed or was built for a different ordering.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        signature, values, reverse = payload["k"], payload["v"], bool(payload["r"])
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid cursor.") from e
+
+    if signature != keyset_signature(keys) or len(values) != len(keys):
+        raise ValueError("Cursor does not match the requested ordering.")
+    try:
+        return [_coerce(col, value) for (col, _), value in zip(keys, values)], reverse
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor.") from e
@@ -0,0 +1,139 @@
+import asyncio
+from typing import Any, Generic, Iterable, Optional, Sequence, TypeVar, TYPE_CHECKING
+
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+if TYPE_CHECKING:
+    from app.base.repos.base import BaseRepository
+
+ModelType = TypeVar("ModelType", bound=Any)
+
+# Execution option of write statements limited to known rows: their identities (tuples of primary key values),
+# so session listeners (the loaders below, the services' read cache) can act on those rows instead of the table.
+ROW_IDENTITIES_OPTION = "row_identities"
+
+
+class BatchLoader(Generic[ModelType]):
+    """
+    DataLoader-style primary key loader scoped to one session (i.e. one request's transaction).
+
+    ``load()`` calls made in the same event loop iteration (e.g. under ``asyncio.gather``) are coalesced into
+    a single ``get_by_pks`` query, and results are memoized for the rest of the session, so it doubles as
+    the per-request entity memo consulted by service hooks. Use ``BaseRepository.loader(session)`` to get
+    the loader of a repository. Every write of the session clears the entries it may have made stale
+    (see ``_forget_written_rows``).
+    """
+
+    SESSION_INFO_KEY = "batch_loaders"
+
+    def __init__(self, repo: "BaseRepository", session: AsyncSession):
+        self._repo = repo
+        self._session = session
+        self._futures: dict[tuple, asyncio.Future] = {}
+        self._queue: list[tuple] = []
+        self._lock = asyncio.Lock()
+        self._dispatches: set[asyncio.Task] = set()
+
+    @classmethod
+    def for_session(cls, repo: "BaseRepository", session: AsyncSession) -> "BatchLoader":
+        loaders = session.info.setdefault(cls.SESSION_INFO_KEY, {})
+        key = (type(repo), repo.model)
+        loader = loaders.get(key)
+        if loader is None:
+            loader = loaders[key] = cls(repo, session)
+        return loader
+
+    @classmethod
+    def loaders_of(cls, session: Session, model: type) -> list["BatchLoader"]:
+        """The loaders of ``model`` in ``session``, one per repository class."""
+        loaders = session.info.get(cls.SESSION_INFO_KEY, {})
+        return [loader for (_, loader_model), loader in loaders.items() if loader_model is model]
+
+    def load(self, pk: Any) -> "asyncio.Future[Optional[ModelType]]":
+        key = tuple(self._repo._pk_values(pk))
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._futures[key] = loop.create_future()
+            if not self._queue:
+                loop.call_soon(self._schedule_dispatch)
+            self._queue.append(key)
+        return future
+
+    async def load_many(self, pks: Sequence[Any]) -> list[Optional[ModelType]]:
+        return list(await asyncio.gather(*(self.load(pk) for pk in pks)))
+
+    def clear(self, pk: Any = None) -> None:
+        """Forget memoized results (all, or those of one primary key) so they are loaded again."""
+        if pk is None:
+            self._futures = {key: future for key, future in self._futures.items() if not future.done()}
+        else:
+            self.clear_identities([tuple(self._repo._pk_values(pk))])
+
+    def clear_identities(self, identities: Iterable[tuple]) -> None:
+        """Forget the memoized results of these identities (tuples of primary key values)."""
+        for key in identities:
+            if key in self._futures and self._futures[key].done():
+                del self._futures[key]
+
+    def clear_misses(self) -> None:
+        """Forget memoized misses, the only results a newly inserted row makes stale."""
+        self._futures = {
+            key: future for key, future in self._futures.items() if not future.done() or future.result() is not None
+        }
+
+    def _schedule_dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        task = asyncio.ensure_future(self._dispatch(keys))
+        self._dispatches.add(task)
+        task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, keys: list[tuple]) -> None:
+        try:
+            # An AsyncSession runs one statement at a time.
+            async with self._lock:
+                objs = await self._repo.get_by_pks(self._session, keys)
+        except Exception as e:
+            for key in keys:
+                # Failed loads are not memoized, so they can be retried.
+                self._futures.pop(key).set_exception(e)
+            return
+        for key, obj in zip(keys, objs):
+            self._futures[key].set_result(obj)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _forget_written_rows(orm_execute_state: ORMExecuteState) -> None:
+    """
+    Clear what a write statement may have made stale in the session's loaders of its model.
+
+    Updates and deletes carrying ``ROW_IDENTITIES_OPTION`` clear those rows; plain inserts clear the
+    memoized misses; upserts and other writes clear the whole model.
+    """
+    state = orm_execute_state
+    mapper = state.bind_mapper
+    if mapper is None or not (state.is_insert or state.is_update or state.is_delete):
+        return
+    loaders = BatchLoader.loaders_of(state.session, mapper.class_)
+    if not loaders:
+        return
+    is_upsert = isinstance(state.statement, (sqlite.Insert, postgresql.Insert))
+    identities = state.execution_options.get(ROW_IDENTITIES_OPTION)
+    for loader in loaders:
+        if state.is_insert and not is_upsert:
+            loader.clear_misses()
+        elif identities is not None and not is_upsert:
+            loader.clear_identities(identities)
+        else:
+            loader.clear()
+
+
+@event.listens_for(Session, "pending_to_persistent")
+def _forget_flushed_insert(session: Session, obj: Any) -> None:
+    # Rows inserted by the unit of work (session.add) rather than by a statement.
+    state = sa_inspect(obj)
+    for loader in BatchLoader.loaders_of(session, state.class_):
+        loader.clear_identities([state.identity])
@@ -0,0 +1,39 @@
+from typing import Any, AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def ndjson_response(
+        rows: AsyncIterator[Any], schema: type[BaseModel], lines_per_chunk: int = 100, **kwargs
+) -> StreamingResponse:
+    """
+    Stream ``rows`` as newline-delimited JSON, serialized with ``schema``.
+
+    The first row is fetched before the response starts, so errors raised up front (validation, missing
+    parent, ...) still go through the exception handlers instead of breaking an already-started response.
+    """
+    iterator = aiter(rows)
+    try:
+        first = [await anext(iterator)]
+    except StopAsyncIteration:
+        first = []
+
+    async def body() -> AsyncIterator[bytes]:
+        try:
+            chunk = [schema.model_validate(row).model_dump_json().encode() for row in first]
+            async for row in iterator:
+                chunk.append(schema.model_validate(row).model_dump_json().encode())
+                if len(chunk) >= lines_per_chunk:
+                    yield b"\n".join(chunk) + b"\n"
+                    chunk = []
+            if chunk:
+                yield b"\n".join(chunk) + b"\n"
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE, **kwargs)
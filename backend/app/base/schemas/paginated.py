@@ -5,16 +5,27 @@ PageItem = TypeVar('PageItem', bound=Any)
 
 
 class PaginatedList(BaseModel, Generic[PageItem]):
-    """Offset Pagination Items"""
+    """Offset or Keyset (Cursor) Pagination Items"""
     items: Sequence[PageItem]
     total_count: Optional[int] = None
     offset: int = 0
     limit: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+    @classmethod
+    def from_items(cls, items: Sequence[PageItem], limit: Optional[int] = None) -> "PaginatedList[PageItem]":
+        """A single page holding every item (e.g. a lookup by ids)."""
+        return cls(items=items, total_count=len(items), offset=0, limit=limit, next_cursor=None, prev_cursor=None)
 
     @computed_field
     @property
     def last(self) -> bool | None:
         """Check if the current page is the last page"""
+        if self.next_cursor is not None:
+            return False
+        if self.prev_cursor is not None:
+            return True
         if self.limit is None or self.total_count is None:
             return None
         return self.offset + self.limit >= self.total_count
@@ -22,4 +33,4 @@ class PaginatedList(BaseModel, Generic[PageItem]):
     @computed_field
     @property
     def first(self) -> bool:
-        return self.offset == 0
+        return self.offset == 0 and self.prev_cursor is None
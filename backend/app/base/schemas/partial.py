@@ -0,0 +1,51 @@
+from typing import Any, Optional, Sequence
+
+from pydantic import BaseModel, ConfigDict, create_model, model_validator
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.exc import NoInspectionAvailable
+
+
+class PartialSchemaMixin(BaseModel):
+    """
+    Sparse fieldset response schema.
+
+    ORM objects are validated from their loaded column attributes only, so columns left unloaded by
+    ``load_only`` stay unset instead of raising. Serialize with ``response_model_exclude_unset=True``.
+    """
+    model_config = ConfigDict(from_attributes=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _loaded_attributes(cls, data: Any) -> Any:
+        try:
+            state = sa_inspect(data)
+        except NoInspectionAvailable:
+            return data
+        unloaded = state.unloaded
+        return {
+            key: getattr(data, key)
+            for key in state.mapper.column_attrs.keys()
+            if key not in unloaded and key in cls.model_fields
+        }
+
+    @classmethod
+    def model_validate_fields(cls, obj: Any, fields: Optional[Sequence[str]] = None):
+        """Validate ``obj`` keeping only ``fields`` (and ``id``) set; all loaded fields if None."""
+        if fields is None:
+            return cls.model_validate(obj)
+        keys = [key for key in dict.fromkeys(["id", *fields]) if key in cls.model_fields]
+        return cls.model_validate({key: getattr(obj, key) for key in keys})
+
+
+def partial_schema(schema: type[BaseModel], name: Optional[str] = None) -> type[PartialSchemaMixin]:
+    """Create a copy of ``schema`` whose fields are all optional, for sparse fieldset responses."""
+    fields = {
+        field_name: (Optional[field.annotation], None)
+        for field_name, field in schema.model_fields.items()
+    }
+    return create_model(
+        name or f"Partial{schema.__name__}",
+        __base__=PartialSchemaMixin,
+        __module__=schema.__module__,
+        **fields,
+    )
@@ -1,13 +1,15 @@
 from abc import abstractmethod, ABC
 from contextlib import asynccontextmanager
-from functools import lru_cache
-from typing import Generic, Any, TypedDict, Optional
+from typing import Generic, Any, TypedDict, Optional, Sequence, Mapping, AsyncIterator, ClassVar, Callable, \
+    AsyncContextManager
 from typing_extensions import TypeVar
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.base.repos.base import BaseRepository, ModelType, CreateSchemaType, UpdateSchemaType
+from app.base.repos.count import CountStrategy
 from app.base.schemas.paginated import PaginatedList
+from app.base.services.pipeline import build_hook_pipeline, noop_hook, HookStack, NO_HOOKS
 from pydantic import TypeAdapter, ValidationError
 
 
@@ -30,6 +32,20 @@ class BaseServiceMixinInterface:
     repo: TRepo
     context_model: type[TContextKwargs]
 
+    # Compiled validate_python per context model, shared by every service using that model.
+    _context_validators: ClassVar[dict[type, Callable[[Any], Any]]] = {}
+
+    # Hook name -> resolved hooks for this class (see build_hook_pipeline).
+    _hook_pipeline: ClassVar[dict[str, Any]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._hook_pipeline = build_hook_pipeline(cls)
+        # Compile the validator at import time rather than on the first request.
+        context_model = cls.__dict__.get("context_model")
+        if isinstance(context_model, type):
+            cls._context_validator(context_model)
+
     @property
     @abstractmethod
     def repo(self) -> TRepo:
@@ -42,11 +58,22 @@ class BaseServiceMixinInterface:
         """Pydantic model for context kwargs."""
         pass
 
+    def _hooks(self, name: str, *args: Any, **kwargs: Any) -> AsyncContextManager:
+        """Run the flattened stages of a ``_context_*`` hook; no-op base hooks cost nothing."""
+        stages = self._hook_pipeline[name]
+        if not stages:
+            return NO_HOOKS
+        if len(stages) == 1:
+            return stages[0](self, *args, **kwargs)
+        return HookStack([stage(self, *args, **kwargs) for stage in stages])
+
     @classmethod
-    @lru_cache
-    def _get_adapter(cls, cast_to: type[TContextKwargs]) -> TypeAdapter[TContextKwargs]:
-        """Get Pydantic TypeAdapter for the given context type."""
-        return TypeAdapter(cast_to)
+    def _context_validator(cls, cast_to: type[TContextKwargs]) -> Callable[[Any], TContextKwargs]:
+        """Get the compiled Pydantic validator for the given context type."""
+        validator = cls._context_validators.get(cast_to)
+        if validator is None:
+            validator = cls._context_validators[cast_to] = TypeAdapter(cast_to).validate_python
+        return validator
 
     @classmethod
     def _ensure_context(cls, context: Optional[TContextKwargs],
@@ -59,10 +86,10 @@ class BaseServiceMixinInterface:
         """
         if context is None:
             context = {}
-        # Use Pydantic TypeAdapter to validate and cast the context
+        # Use the compiled Pydantic validator to validate and cast the context
+        validator = cls._context_validators.get(cast_to) or cls._context_validator(cast_to)
         try:
-            adapter = cls._get_adapter(cast_to)
-            return adapter.validate_python(context)
+            return validator(context)
         except ValidationError as e:
             raise ValueError(f"Invalid context provided: {e}") from e
 
@@ -74,6 +101,7 @@ class BaseServiceMixinInterface:
 class BaseCreateHooks(BaseHooksInterface):
     """Hook methods for Create operations."""
 
+    @noop_hook
     @asynccontextmanager
     async def _context_create(self, session: AsyncSession, obj_data: CreateSchemaType, context: TContextKwargs):
         """Hook executed within a context before create (validation, cascade handling, etc.)."""
@@ -83,10 +111,24 @@ class BaseCreateHooks(BaseHooksInterface):
         """Hook to prepare additional fields before create."""
         return {}
 
+    @noop_hook
     async def _post_create(self, session: AsyncSession, obj: ModelType, context: TContextKwargs) -> ModelType:
         """Hook executed after create."""
         return obj
 
+    @noop_hook
+    @asynccontextmanager
+    async def _context_create_many(self, session: AsyncSession, objs_data: Sequence[CreateSchemaType],
+                                   context: TContextKwargs):
+        """Hook executed within a context before create many, once for the whole batch."""
+        yield
+
+    @noop_hook
+    async def _post_create_many(self, session: AsyncSession, objs: list[ModelType],
+                                context: TContextKwargs) -> list[ModelType]:
+        """Hook executed after create many."""
+        return objs
+
 
 class BaseCreateServiceMixin(
     ABC, BaseCreateHooks, BaseServiceMixinInterface,
@@ -97,16 +139,32 @@ class BaseCreateServiceMixin(
 
     Usage:
         await service.create(session, obj_data, context={})
+        await service.create_many(session, [obj_data, ...], context={})
     """
 
     async def create(
             self, session: AsyncSession, obj_data: CreateSchemaType, context: Optional[TContextKwargs] = None
     ) -> ModelType:
         ctx = self._ensure_context(context, self.context_model)
-        async with self._context_create(session, obj_data, context=ctx):
+        async with self._hooks("_context_create", session, obj_data, context=ctx):
             extra_fields = self._prepare_create_fields(obj_data, context=ctx)
             obj = await self.repo.create(session, obj_in=obj_data, **extra_fields)
-            return await self._post_create(session, obj, context=ctx)
+            post = self._hook_pipeline["_post_create"]
+            return obj if post is None else await post(self, session, obj, context=ctx)
+
+    async def create_many(
+            self, session: AsyncSession, objs_data: Sequence[CreateSchemaType], context: Optional[TContextKwargs] = None
+    ) -> list[ModelType]:
+        """Create every object with multi-row INSERTs, running the batch hooks once; returns them in input order."""
+        ctx = self._ensure_context(context, self.context_model)
+        async with self._hooks("_context_create_many", session, objs_data, context=ctx):
+            rows = [
+                {**obj_data.model_dump(), **self._prepare_create_fields(obj_data, context=ctx)}
+                for obj_data in objs_data
+            ]
+            objs = list(await self.repo.create_many(session, rows))
+            post = self._hook_pipeline["_post_create_many"]
+            return objs if post is None else await post(self, session, objs, context=ctx)
 
 
 # ============================================================
@@ -116,6 +174,7 @@ class BaseCreateServiceMixin(
 class BaseUpdateHooks(BaseHooksInterface):
     """Hook methods for Update operations."""
 
+    @noop_hook
     @asynccontextmanager
     async def _context_update(self, session: AsyncSession, obj_id: uuid.UUID, obj_data: UpdateSchemaType,
                               context: TContextKwargs):
@@ -126,10 +185,28 @@ class BaseUpdateHooks(BaseHooksInterface):
         """Hook to prepare additional fields before update."""
         return {}
 
+    def _prepare_update_filters(self, context: TContextKwargs) -> list[Any]:
+        """Hook to prepare additional filter conditions fused into the UPDATE statement."""
+        return []
+
+    @noop_hook
     async def _post_update(self, session: AsyncSession, obj: ModelType, context: TContextKwargs) -> ModelType:
         """Hook executed after update."""
         return obj
 
+    @noop_hook
+    @asynccontextmanager
+    async def _context_update_many(self, session: AsyncSession, objs_data: Mapping[uuid.UUID, UpdateSchemaType],
+                                   context: TContextKwargs):
+        """Hook executed within a context before update many, once for the whole batch."""
+        yield
+
+    @noop_hook
+    async def _post_update_many(self, session: AsyncSession, objs: list[Optional[ModelType]],
+                                context: TContextKwargs) -> list[Optional[ModelType]]:
+        """Hook executed after update many (None where an object was not updated)."""
+        return objs
+
 
 class BaseUpdateServiceMixin(
     ABC, BaseUpdateHooks, BaseServiceMixinInterface,
@@ -140,6 +217,7 @@ class BaseUpdateServiceMixin(
 
     Usage:
         await service.update(session, obj_id, obj_data, context={})
+        await service.update_many(session, {obj_id: obj_data, ...}, context={})
     """
 
     async def update(
@@ -147,10 +225,32 @@ class BaseUpdateServiceMixin(
             context: Optional[TContextKwargs] = None
     ) -> ModelType:
         ctx = self._ensure_context(context, self.context_model)
-        async with self._context_update(session, obj_id, obj_data, context=ctx):
+        async with self._hooks("_context_update", session, obj_id, obj_data, context=ctx):
             extra_fields = self._prepare_update_fields(obj_data, context=ctx)
-            obj = await self.repo.update_by_pk(session, pk=obj_id, obj_in=obj_data, **extra_fields)
-            return await self._post_update(session, obj, context=ctx)
+            where = self._prepare_update_filters(context=ctx)
+            obj = await self.repo.update_by_pk(session, pk=obj_id, obj_in=obj_data, where=where, **extra_fields)
+            post = self._hook_pipeline["_post_update"]
+            return obj if post is None else await post(self, session, obj, context=ctx)
+
+    async def update_many(
+            self, session: AsyncSession, objs_data: Mapping[uuid.UUID, UpdateSchemaType],
+            context: Optional[TContextKwargs] = None
+    ) -> list[Optional[ModelType]]:
+        """
+        Update each object with its own data, running the batch hooks once.
+
+        Objects updated with the same values share one UPDATE statement (see ``update_by_pks``).
+        Returns the updated objects in the order of ``objs_data`` (None where no row matched).
+        """
+        ctx = self._ensure_context(context, self.context_model)
+        async with self._hooks("_context_update_many", session, objs_data, context=ctx):
+            where = self._prepare_update_filters(context=ctx)
+            objs = await self.repo.update_by_pks(session, {
+                obj_id: {**obj_data.model_dump(exclude_unset=True), **self._prepare_update_fields(obj_data, context=ctx)}
+                for obj_id, obj_data in objs_data.items()
+            }, where=where)
+            post = self._hook_pipeline["_post_update_many"]
+            return objs if post is None else await post(self, session, objs, context=ctx)
 
 
 # ============================================================
@@ -161,16 +261,35 @@ class BaseUpdateServiceMixin(
 class BaseDeleteHooks(BaseHooksInterface):
     """Hook methods for Delete operations."""
 
+    @noop_hook
     @asynccontextmanager
     async def _context_delete(self, session: AsyncSession, obj_id: uuid.UUID, context: TContextKwargs):
         """Hook executed within a context before delete (validation, cascade handling, etc.)."""
         yield
 
+    def _prepare_delete_filters(self, context: TContextKwargs) -> list[Any]:
+        """Hook to prepare additional filter conditions fused into the DELETE statement."""
+        return []
+
+    @noop_hook
     async def _post_delete(self, session: AsyncSession, obj_id: uuid.UUID, result: bool,
                            context: TContextKwargs) -> bool:
         """Hook executed after delete."""
         return result
 
+    @noop_hook
+    @asynccontextmanager
+    async def _context_delete_many(self, session: AsyncSession, obj_ids: Sequence[uuid.UUID],
+                                   context: TContextKwargs):
+        """Hook executed within a context before delete many, once for the whole batch."""
+        yield
+
+    @noop_hook
+    async def _post_delete_many(self, session: AsyncSession, obj_ids: Sequence[uuid.UUID], result: int,
+                                context: TContextKwargs) -> int:
+        """Hook executed after delete many, with the number of deleted rows."""
+        return result
+
 
 class BaseDeleteServiceMixin(
     ABC, BaseDeleteHooks, BaseServiceMixinInterface,
@@ -181,15 +300,27 @@ class BaseDeleteServiceMixin(
 
     Usage:
         await service.delete(session, obj_id, context={})
+        await service.delete_many(session, [obj_id, ...], context={})
     """
 
     async def delete(
             self, session: AsyncSession, obj_id: uuid.UUID, context: Optional[TContextKwargs] = None
     ) -> bool:
         ctx = self._ensure_context(context, self.context_model)
-        async with self._context_delete(session, obj_id, context=ctx):
-            result = await self.repo.delete_by_pk(session, pk=obj_id)
-            return await self._post_delete(session, obj_id, result, context=ctx)
+        async with self._hooks("_context_delete", session, obj_id, context=ctx):
+            result = await self.repo.delete_by_pk(session, pk=obj_id, where=self._prepare_delete_filters(context=ctx))
+            post = self._hook_pipeline["_post_delete"]
+            return result if post is None else await post(self, session, obj_id, result, context=ctx)
+
+    async def delete_many(
+            self, session: AsyncSession, obj_ids: Sequence[uuid.UUID], context: Optional[TContextKwargs] = None
+    ) -> int:
+        """Delete the objects with set-based DELETEs, running the batch hooks once; returns the deleted count."""
+        ctx = self._ensure_context(context, self.context_model)
+        async with self._hooks("_context_delete_many", session, obj_ids, context=ctx):
+            result = await self.repo.delete_by_pks(session, obj_ids, where=self._prepare_delete_filters(context=ctx))
+            post = self._hook_pipeline["_post_delete_many"]
+            return result if post is None else await post(self, session, obj_ids, result, context=ctx)
 
 
 # ============================================================
@@ -199,16 +330,38 @@ class BaseDeleteServiceMixin(
 class BaseGetHooks(BaseHooksInterface):
     """Hook methods for Get (single item) operations."""
 
+    @noop_hook
     @asynccontextmanager
     async def _context_get(self, session: AsyncSession, obj_id: uuid.UUID, context: TContextKwargs):
         """Hook executed within a context before get (validation, cascade handling, etc.)."""
         yield
 
+    def _prepare_get_filters(self, context: TContextKwargs) -> list[Any]:
+        """Hook to prepare additional filter conditions fused into the SELECT by primary key."""
+        return []
+
+    def _prepare_get_fields(self, fields: Sequence[str]) -> list[str]:
+        """Hook to add the fields that post-get hooks read to a sparse fieldset."""
+        return list(fields)
+
+    @noop_hook
     async def _post_get(self, session: AsyncSession, obj: ModelType | None,
                         context: TContextKwargs) -> ModelType | None:
         """Hook executed after get (data transformation, etc.)."""
         return obj
 
+    @noop_hook
+    @asynccontextmanager
+    async def _context_get_many(self, session: AsyncSession, obj_ids: Sequence[uuid.UUID], context: TContextKwargs):
+        """Hook executed within a context before get many (validation, etc.)."""
+        yield
+
+    @noop_hook
+    async def _post_get_many(self, session: AsyncSession, objs: list[ModelType],
+                             context: TContextKwargs) -> list[ModelType]:
+        """Hook executed after get many, with the found objects in request order (filtering, etc.)."""
+        return objs
+
 
 class BaseGetServiceMixin(
     ABC, BaseGetHooks, BaseServiceMixinInterface,
@@ -219,15 +372,38 @@ class BaseGetServiceMixin(
 
     Usage:
         await service.get(session, obj_id, context={})
+        await service.get_many(session, [obj_id, ...], context={})
     """
 
     async def get(
-            self, session: AsyncSession, obj_id: uuid.UUID, context: Optional[TContextKwargs] = None
+            self, session: AsyncSession, obj_id: uuid.UUID, context: Optional[TContextKwargs] = None,
+            fields: Optional[Sequence[str]] = None,
     ) -> ModelType | None:
         ctx = self._ensure_context(context, self.context_model)
-        async with self._context_get(session, obj_id, context=ctx):
-            obj = await self.repo.get_by_pk(session, pk=obj_id)
-            return await self._post_get(session, obj, context=ctx)
+        async with self._hooks("_context_get", session, obj_id, context=ctx):
+            where = self._prepare_get_filters(context=ctx)
+            obj = await self.repo.get_by_pk(session, pk=obj_id, fields=fields, where=where)
+            post = self._hook_pipeline["_post_get"]
+            return obj if post is None else await post(self, session, obj, context=ctx)
+
+    async def get_many(
+            self, session: AsyncSession, obj_ids: Sequence[uuid.UUID], context: Optional[TContextKwargs] = None,
+            fields: Optional[Sequence[str]] = None,
+    ) -> list[ModelType]:
+        """
+        Get the existing objects among ``obj_ids`` in one batched query, in request order.
+
+        A sparse fieldset bypasses the session's loader, which memoizes fully loaded rows.
+        """
+        ctx = self._ensure_context(context, self.context_model)
+        async with self._hooks("_context_get_many", session, obj_ids, context=ctx):
+            if fields is None:
+                objs = await self.repo.loader(session).load_many(obj_ids)
+            else:
+                objs = await self.repo.get_by_pks(session, obj_ids, fields=self._prepare_get_fields(fields))
+            objs = [obj for obj in objs if obj is not None]
+            post = self._hook_pipeline["_post_get_many"]
+            return objs if post is None else await post(self, session, objs, context=ctx)
 
 
 # ============================================================
@@ -237,6 +413,7 @@ class BaseGetServiceMixin(
 class BaseGetMultiHooks(BaseHooksInterface):
     """Hook methods for Get Multi (list) operations."""
 
+    @noop_hook
     @asynccontextmanager
     async def _context_get_multi(self, session: AsyncSession, context: TContextKwargs):
         """Hook executed within a context before get multi (data transformation, etc.)."""
@@ -246,6 +423,7 @@ class BaseGetMultiHooks(BaseHooksInterface):
         """Hook to prepare additional filter conditions for list queries."""
         return []
 
+    @noop_hook
     async def _post_get_multi(
             self, session: AsyncSession, result: PaginatedList[ModelType], context: TContextKwargs
     ) -> PaginatedList[ModelType]:
@@ -262,27 +440,46 @@ class BaseGetMultiServiceMixin(
 
     Usage:
         await service.get_multi(session, offset=0, limit=100, context={})
+        await service.get_multi(session, cursor=page.next_cursor, limit=100, context={})
+        async for obj in service.stream(session, context={}): ...
     """
 
+    def _merge_get_multi_where(self, where, context: TContextKwargs) -> list[Any]:
+        extra_filters = self._prepare_get_multi_filters(context=context)
+        if where is None:
+            return extra_filters
+        if isinstance(where, list):
+            return where + extra_filters
+        return [where] + extra_filters
+
     async def get_multi(
             self, session: AsyncSession,
             offset: int = 0, limit: int = 100,
             order_by=None, where=None,
-            context: Optional[TContextKwargs] = None
+            context: Optional[TContextKwargs] = None,
+            cursor: Optional[str] = None,
+            count_strategy: Optional[CountStrategy] = None,
+            fields: Optional[Sequence[str]] = None,
     ) -> PaginatedList[ModelType]:
         ctx = self._ensure_context(context, self.context_model)
-        async with self._context_get_multi(session, context=ctx):
-            extra_filters = self._prepare_get_multi_filters(context=ctx)
-
-            # Merge where conditions
-            if where is None:
-                where = extra_filters
-            elif isinstance(where, list):
-                where = where + extra_filters
-            elif extra_filters:
-                where = [where] + extra_filters
-
+        async with self._hooks("_context_get_multi", session, context=ctx):
+            where = self._merge_get_multi_where(where, context=ctx)
             result = await self.repo.get_multi(
-                session, offset=offset, limit=limit, where=where, order_by=order_by
+                session, offset=offset, limit=limit, where=where, order_by=order_by, cursor=cursor,
+                count_strategy=count_strategy, fields=fields,
             )
-            return await self._post_get_multi(session, result, context=ctx)
+            post = self._hook_pipeline["_post_get_multi"]
+            return result if post is None else await post(self, session, result, context=ctx)
+
+    async def stream(
+            self, session: AsyncSession,
+            order_by=None, where=None,
+            context: Optional[TContextKwargs] = None,
+            batch_size: int = 1000,
+    ) -> AsyncIterator[ModelType]:
+        """Stream every matching row (e.g. for exports); runs the get multi context hook but not post hooks."""
+        ctx = self._ensure_context(context, self.context_model)
+        async with self._hooks("_context_get_multi", session, context=ctx):
+            where = self._merge_get_multi_where(where, context=ctx)
+            async for obj in self.repo.stream(session, where=where, order_by=order_by or (), batch_size=batch_size):
+                yield obj
@@ -0,0 +1,270 @@
+import copy
+import uuid
+import weakref
+from collections.abc import MutableMapping
+from functools import lru_cache
+from typing import Any, Optional, Sequence, Union
+
+from cachetools import TTLCache
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapper, ORMExecuteState, Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.base.repos.base import ModelType, ROW_IDENTITIES_OPTION
+from app.base.services.base import BaseCreateHooks, BaseUpdateHooks, BaseGetHooks, BaseDeleteHooks, TContextKwargs
+from app.base.services.pipeline import hook_stage
+from app.core.database.transaction import READ_ONLY_KEY
+
+# session.info key: (cache, key) pairs written in this transaction, invalidated again when it ends.
+# A key is a row key (see ReadCache.key) or a model, for writes whose rows are not known.
+PENDING_INVALIDATIONS_KEY = "read_cache_invalidations"
+
+# Every ReadCache of the process; writes are evicted from all of them.
+_read_caches: "weakref.WeakSet[ReadCache]" = weakref.WeakSet()
+
+
+class ReadCache:
+    """
+    In-process cache of row snapshots keyed by model and primary key, with hit and miss counters.
+
+    The backend is any MutableMapping; the default is a cachetools ``TTLCache`` (LRU eviction plus a
+    TTL, which also bounds staleness for writes made outside the services, e.g. by another process).
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 30.0, backend: Optional[MutableMapping] = None):
+        self._backend: MutableMapping = backend if backend is not None else TTLCache(maxsize=maxsize, ttl=ttl)
+        self.hits = 0
+        self.misses = 0
+        _read_caches.add(self)
+
+    @staticmethod
+    def key(model: type, pk: Any) -> tuple:
+        return model, tuple(pk) if isinstance(pk, (tuple, list)) else (pk,)
+
+    @staticmethod
+    def exists_key(model: type, pk: Any) -> tuple:
+        return ("exists",) + ReadCache.key(model, pk)
+
+    def get(self, key: tuple) -> Any:
+        value = self._backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: tuple, value: Any) -> None:
+        self._backend[key] = value
+
+    def delete(self, key: tuple) -> None:
+        self._backend.pop(key, None)
+
+    def delete_model(self, model: type) -> None:
+        """Drop every row (and cached existence) of ``model``."""
+        for key in list(self._backend):
+            if key[0] is model or key[:2] == ("exists", model):
+                self._backend.pop(key, None)
+
+    def clear(self) -> None:
+        self._backend.clear()
+        self.hits = self.misses = 0
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._backend
+
+    def __len__(self) -> int:
+        return len(self._backend)
+
+
+default_read_cache = ReadCache()
+
+
+def invalidate(session: Union[AsyncSession, Session], cache: ReadCache, model: type, pk: Any) -> None:
+    """
+    Drop a row (and its cached existence) now, and again when the transaction ends.
+
+    The second pass covers a concurrent read that re-cached the old committed row before our commit.
+    """
+    pending = session.info.setdefault(PENDING_INVALIDATIONS_KEY, set())
+    for key in (ReadCache.key(model, pk), ReadCache.exists_key(model, pk)):
+        cache.delete(key)
+        pending.add((cache, key))
+
+
+def invalidate_model(session: Union[AsyncSession, Session], cache: ReadCache, model: type) -> None:
+    """Drop every row of a model now, and again when the transaction ends (see ``invalidate``)."""
+    cache.delete_model(model)
+    session.info.setdefault(PENDING_INVALIDATIONS_KEY, set()).add((cache, model))
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _invalidate_pending(session: Session) -> None:
+    for cache, key in session.info.pop(PENDING_INVALIDATIONS_KEY, ()):
+        if isinstance(key, tuple):
+            cache.delete(key)
+        else:
+            cache.delete_model(key)
+
+
+@lru_cache
+def _referencing_models(mapper: Mapper) -> tuple[type, ...]:
+    """Models whose tables reference ``mapper``'s table by foreign key, directly or through other tables."""
+    models: list[type] = []
+    tables = [mapper.local_table]
+    for table in tables:
+        for other in mapper.registry.mappers:
+            other_table = other.local_table
+            if other_table not in tables and any(fk.column.table is table for fk in other_table.foreign_keys):
+                tables.append(other_table)
+                models.append(other.class_)
+    return tuple(models)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_written_rows(orm_execute_state: ORMExecuteState) -> None:
+    """
+    Evict rows written by statements rather than by the unit of work (bulk updates, deletes and upserts).
+
+    Statements carrying ``ROW_IDENTITIES_OPTION`` evict those rows; others evict the whole model. A hard
+    delete also evicts the models referencing it, which a foreign key may cascade the delete to.
+    """
+    statement = orm_execute_state.statement
+    is_upsert = isinstance(statement, (sqlite.Insert, postgresql.Insert))
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or not (orm_execute_state.is_update or orm_execute_state.is_delete or is_upsert):
+        return
+    session = orm_execute_state.session
+    identities = orm_execute_state.execution_options.get(ROW_IDENTITIES_OPTION)
+    for cache in list(_read_caches):
+        if identities is None or is_upsert:
+            invalidate_model(session, cache, mapper.class_)
+        else:
+            for identity in identities:
+                invalidate(session, cache, mapper.class_, identity)
+        if orm_execute_state.is_delete:
+            for model in _referencing_models(mapper):
+                invalidate_model(session, cache, model)
+
+
+@event.listens_for(Session, "persistent_to_deleted")
+def _invalidate_deleted_object(session: Session, obj: Any) -> None:
+    # Deletes flushed by the unit of work, including ORM cascades (e.g. "all, delete-orphan").
+    state = sa_inspect(obj)
+    for cache in list(_read_caches):
+        invalidate(session, cache, state.class_, state.identity)
+
+
+def _copy_value(value: Any) -> Any:
+    # JSON columns hold lists/dicts; never share them between sessions.
+    return copy.deepcopy(value) if isinstance(value, (list, dict)) else value
+
+
+class CachedReadHooksMixin(BaseCreateHooks, BaseUpdateHooks, BaseGetHooks, BaseDeleteHooks):
+    """
+    Read-through cache for ``get`` in read-only transactions, invalidated by every write of the process.
+
+    A hit puts a detached copy of the cached row into the session's identity map before the
+    repository runs, so ``get_by_pk`` answers without SQL (fused ``column == value`` ownership
+    predicates are checked against the cached row). Misses are cached in ``_post_get``; only
+    complete rows are cached, never sparse fieldsets. Write transactions neither read nor fill
+    the cache, so a snapshot is never flushed back and uncommitted rows are never cached.
+
+    The service's writes invalidate their rows in the hooks below; statements run through any
+    session (the repository's bulk writes, cascades) are invalidated by ``_invalidate_written_rows``.
+
+    Place it after NestedResourceHooksMixin in the bases so its get stage runs first.
+    """
+
+    read_cache: ReadCache = default_read_cache
+
+    def _snapshot(self, obj: ModelType) -> Optional[dict[str, Any]]:
+        state = sa_inspect(obj)
+        keys = [prop.key for prop in state.mapper.column_attrs]
+        if state.expired or any(key not in state.dict for key in keys):
+            return None
+        return {key: _copy_value(state.dict[key]) for key in keys}
+
+    def _attach_snapshot(self, session: AsyncSession, snapshot: dict[str, Any]) -> Optional[ModelType]:
+        """Add a detached copy of the snapshot to the session; the caller must hold on to it (the identity map is weak)."""
+        mapper = sa_inspect(self.repo.model).mapper
+        identity_key = mapper.identity_key_from_primary_key(
+            [snapshot[mapper.get_property_by_column(col).key] for col in mapper.primary_key]
+        )
+        if identity_key in session.identity_map:
+            return None
+        obj = mapper.class_manager.new_instance()
+        for key, value in snapshot.items():
+            set_committed_value(obj, key, _copy_value(value))
+        make_transient_to_detached(obj)
+        session.add(obj)
+        return obj
+
+    def _remember(self, session: AsyncSession, obj: ModelType) -> None:
+        key = ReadCache.key(self.repo.model, sa_inspect(obj).identity)
+        pending = session.info.get(PENDING_INVALIDATIONS_KEY, ())
+        if key in self.read_cache or (self.read_cache, key) in pending or (self.read_cache, key[0]) in pending:
+            return
+        snapshot = self._snapshot(obj)
+        if snapshot is not None:
+            self.read_cache.set(key, snapshot)
+
+    # ============================================================
+    # Get Hooks
+    # ============================================================
+
+    @hook_stage
+    async def _context_get(self, session: AsyncSession, obj_id: uuid.UUID, context: TContextKwargs):
+        if not session.info.get(READ_ONLY_KEY):
+            yield
+            return
+        snapshot = self.read_cache.get(ReadCache.key(self.repo.model, obj_id))
+        # Held until the get returns: the identity map only keeps weak references.
+        attached = self._attach_snapshot(session, snapshot) if snapshot is not None else None  # noqa: F841
+        yield
+
+    async def _post_get(self, session: AsyncSession, obj: ModelType | None,
+                        context: TContextKwargs) -> ModelType | None:
+        obj = await super()._post_get(session, obj, context)
+        if obj is not None and session.info.get(READ_ONLY_KEY):
+            self._remember(session, obj)
+        return obj
+
+    # ============================================================
+    # Write Hooks (invalidation)
+    # ============================================================
+
+    async def _post_create(self, session: AsyncSession, obj: ModelType, context: TContextKwargs) -> ModelType:
+        obj = await super()._post_create(session, obj, context)
+        invalidate(session, self.read_cache, self.repo.model, sa_inspect(obj).identity)
+        return obj
+
+    async def _post_update(self, session: AsyncSession, obj: ModelType, context: TContextKwargs) -> ModelType:
+        obj = await super()._post_update(session, obj, context)
+        if obj is not None:
+            invalidate(session, self.read_cache, self.repo.model, sa_inspect(obj).identity)
+        return obj
+
+    async def _post_update_many(self, session: AsyncSession, objs: list[Optional[ModelType]],
+                                context: TContextKwargs) -> list[Optional[ModelType]]:
+        objs = await super()._post_update_many(session, objs, context)
+        for obj in objs:
+            if obj is not None:
+                invalidate(session, self.read_cache, self.repo.model, sa_inspect(obj).identity)
+        return objs
+
+    async def _post_delete(self, session: AsyncSession, obj_id: uuid.UUID, result: bool,
+                           context: TContextKwargs) -> bool:
+        result = await super()._post_delete(session, obj_id, result, context)
+        if result:
+            invalidate(session, self.read_cache, self.repo.model, obj_id)
+        return result
+
+    async def _post_delete_many(self, session: AsyncSession, obj_ids: Sequence[uuid.UUID], result: int,
+                                context: TContextKwargs) -> int:
+        result = await super()._post_delete_many(session, obj_ids, result, context)
+        for obj_id in obj_ids:
+            invalidate(session, self.read_cache, self.repo.model, obj_id)
+        return result
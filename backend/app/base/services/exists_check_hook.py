@@ -1,29 +1,50 @@
 import uuid
-from contextlib import asynccontextmanager
+from typing import Mapping, Sequence
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.base.exceptions.basic import NotFoundException
 from app.base.repos.base import UpdateSchemaType
 from app.base.services.base import BaseUpdateHooks, BaseDeleteHooks, TContextKwargs
+from app.base.services.pipeline import hook_stage
 
 
 class ExistsCheckHooksMixin(BaseUpdateHooks, BaseDeleteHooks):
 
-    @asynccontextmanager
+    @hook_stage
     async def _context_update(self, session: AsyncSession, obj_id: uuid.UUID, obj_data: UpdateSchemaType,
                               context: TContextKwargs):
-        if not await self.repo.get_by_pk(session, obj_id):
+        if not await self.repo.loader(session).load(obj_id):
             raise NotFoundException(
                 log_message=f"{self.repo.model_repr(obj_id)} does not exist."
             )
         yield
 
-    @asynccontextmanager
+    @hook_stage
     async def _context_delete(self, session: AsyncSession, obj_id: uuid.UUID, context: TContextKwargs):
-        if await self.repo.get_by_pk(session, obj_id) is None:
+        if await self.repo.loader(session).load(obj_id) is None:
             raise NotFoundException(
                 log_message=f"{self.repo.model_repr(obj_id)} does not exist."
             )
 
         yield
+
+    async def _ensure_all_exist(self, session: AsyncSession, obj_ids: Sequence[uuid.UUID]) -> None:
+        objs = await self.repo.loader(session).load_many(obj_ids)
+        missing = [obj_id for obj_id, obj in zip(obj_ids, objs) if obj is None]
+        if missing:
+            raise NotFoundException(
+                log_message=f"{', '.join(self.repo.model_repr(obj_id) for obj_id in missing)} do not exist."
+            )
+
+    @hook_stage
+    async def _context_update_many(self, session: AsyncSession, objs_data: Mapping[uuid.UUID, UpdateSchemaType],
+                                   context: TContextKwargs):
+        await self._ensure_all_exist(session, list(objs_data))
+        yield
+
+    @hook_stage
+    async def _context_delete_many(self, session: AsyncSession, obj_ids: Sequence[uuid.UUID],
+                                   context: TContextKwargs):
+        await self._ensure_all_exist(session, obj_ids)
+        yield
@@ -1,15 +1,16 @@
 import uuid
 from abc import abstractmethod
 
-from contextlib import asynccontextmanager
-from typing import Required, Any
+from typing import Required, Any, Sequence, Mapping, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.base.exceptions.basic import NotFoundException
-from app.base.repos.base import BaseRepository, CreateSchemaType, UpdateSchemaType
+from app.base.repos.base import BaseRepository, CreateSchemaType, UpdateSchemaType, ModelType
 from app.base.services.base import BaseCreateHooks, BaseContextKwargs, TContextKwargs, BaseUpdateHooks, BaseGetHooks, \
     BaseGetMultiHooks, BaseDeleteHooks
+from app.base.services.cached_read_hook import ReadCache
+from app.base.services.pipeline import hook_stage
 
 
 class NestedResourceContextKwargs(BaseContextKwargs):
@@ -35,24 +36,40 @@ class NestedResourceHooksMixin(
         """The name of the foreign key field in the child model that references the parent."""
         return "parent_id"
 
+    # When True, get/update/delete add ``fk_name == parent_id`` to their own statement instead of
+    # loading the row to check ownership first: one round trip, and no window between check and write.
+    # A row of another parent then simply looks missing (None / False), like a row that does not exist.
+    fuse_ownership_checks: bool = False
+
+    # Remember parents known to exist (never missing ones) in this cache. Deleting the parent through
+    # a service with CachedReadHooksMixin on the same cache invalidates the entry; the TTL bounds the rest.
+    parent_exists_cache: Optional[ReadCache] = None
+
     # ============================================================
     # Helpers
     # ============================================================
 
     async def _check_parent_exists(self, session: AsyncSession, parent_id: Any) -> None:
-        """Check if parent exists, raise NotFoundException if not."""
-        #
-        if not await self.parent_repo.get_by_pk(session, parent_id):
+        """Check if parent exists (without loading it), raise NotFoundException if not."""
+        cache_key = None
+        if self.parent_exists_cache is not None:
+            cache_key = ReadCache.exists_key(self.parent_repo.model, parent_id)
+            if self.parent_exists_cache.get(cache_key):
+                return
+        if not await self.parent_repo.exists_by_pk(session, parent_id):
             raise NotFoundException(
                 log_message=f"Parent {self.parent_repo.model_repr(parent_id)} not found."
             )
+        if cache_key is not None:
+            self.parent_exists_cache.set(cache_key, True)
 
     async def _ensure_ownership(self, session: AsyncSession, obj_id: uuid.UUID, parent_id: Any):
         """
         Ensure the object belongs to the specific parent.
         This prevents accessing/modifying a child object through a wrong parent URL.
         """
-        obj = await self.repo.get_by_pk(session, obj_id)
+        # Memoized for the session, so later hooks and the operation itself reuse the loaded row.
+        obj = await self.repo.loader(session).load(obj_id)
         if not obj:
             return
 
@@ -65,16 +82,37 @@ class NestedResourceHooksMixin(
                 log_message=f"{self.repo.model_repr(obj_id)} does not belong to {self.parent_repo.model_repr(parent_id)}"
             )
 
+    async def _ensure_ownership_many(self, session: AsyncSession, obj_ids: Sequence[uuid.UUID], parent_id: Any):
+        """Ensure every existing object among ``obj_ids`` belongs to the parent, with one batched load."""
+        objs = await self.repo.loader(session).load_many(obj_ids)
+        for obj_id, obj in zip(obj_ids, objs):
+            if obj is not None and str(getattr(obj, self.fk_name)) != str(parent_id):
+                raise NotFoundException(
+                    log_message=f"{self.repo.model_repr(obj_id)} does not belong to {self.parent_repo.model_repr(parent_id)}"
+                )
+
+    def _ownership_filters(self, context: TContextKwargs) -> list[Any]:
+        """The ``fk_name == parent_id`` predicate, when ownership checks are fused into statements."""
+        if not self.fuse_ownership_checks:
+            return []
+        return [getattr(self.repo.model, self.fk_name) == context["parent_id"]]
+
     # ============================================================
     # Create Hooks
     # ============================================================
 
-    @asynccontextmanager
+    @hook_stage
     async def _context_create(self, session: AsyncSession, obj_data: CreateSchemaType, context: TContextKwargs):
-        async with super()._context_create(session, obj_data, context):
-            parent_id = context["parent_id"]
-            await self._check_parent_exists(session, parent_id)
-            yield
+        parent_id = context["parent_id"]
+        await self._check_parent_exists(session, parent_id)
+        yield
+
+    @hook_stage
+    async def _context_create_many(self, session: AsyncSession, objs_data: Sequence[CreateSchemaType],
+                                   context: TContextKwargs):
+        """Every object gets the same parent, so it is checked once for the batch."""
+        await self._check_parent_exists(session, context["parent_id"])
+        yield
 
     def _prepare_create_fields(self, obj_data: CreateSchemaType, context: TContextKwargs) -> dict[str, Any]:
         """Inject parent_id into the creation data."""
@@ -95,44 +133,82 @@ class NestedResourceHooksMixin(
 
         return filters
 
-    @asynccontextmanager
+    @hook_stage
     async def _context_get_multi(self, session: AsyncSession, context: TContextKwargs):
         """Optionally check if parent exists before listing children."""
-        async with super()._context_get_multi(session, context):
-            # Optional: Fail fast if parent doesn't exist, even if list would just be empty.
-            await self._check_parent_exists(session, context["parent_id"])
-            yield
+        # Optional: Fail fast if parent doesn't exist, even if list would just be empty.
+        await self._check_parent_exists(session, context["parent_id"])
+        yield
 
     # ============================================================
     # Get (Single) Hooks
     # ============================================================
 
-    @asynccontextmanager
+    @hook_stage
     async def _context_get(self, session: AsyncSession, obj_id: uuid.UUID, context: TContextKwargs):
         """Ensure the requested object belongs to the parent context."""
-        async with super()._context_get(session, obj_id, context):
+        if not self.fuse_ownership_checks:
             await self._ensure_ownership(session, obj_id, context["parent_id"])
-            yield
+        yield
+
+    def _prepare_get_filters(self, context: TContextKwargs) -> list[Any]:
+        return super()._prepare_get_filters(context) + self._ownership_filters(context)
+
+    def _prepare_get_fields(self, fields: Sequence[str]) -> list[str]:
+        """_post_get_many compares the foreign key, so a sparse fieldset must load it."""
+        return [*super()._prepare_get_fields(fields), self.fk_name]
+
+    @hook_stage
+    async def _context_get_many(self, session: AsyncSession, obj_ids: Sequence[uuid.UUID], context: TContextKwargs):
+        await self._check_parent_exists(session, context["parent_id"])
+        yield
+
+    async def _post_get_many(self, session: AsyncSession, objs: list[ModelType],
+                             context: TContextKwargs) -> list[ModelType]:
+        """Drop objects that belong to another parent, as if they did not exist."""
+        objs = await super()._post_get_many(session, objs, context)
+        parent_id = str(context["parent_id"])
+        return [obj for obj in objs if str(getattr(obj, self.fk_name)) == parent_id]
 
     # ============================================================
     # Update Hooks
     # ============================================================
 
-    @asynccontextmanager
+    @hook_stage
     async def _context_update(self, session: AsyncSession, obj_id: uuid.UUID, obj_data: UpdateSchemaType,
                               context: TContextKwargs):
         """Ensure the object being updated belongs to the parent context."""
-        async with super()._context_update(session, obj_id, obj_data, context):
+        if not self.fuse_ownership_checks:
             await self._ensure_ownership(session, obj_id, context["parent_id"])
-            yield
+        yield
+
+    def _prepare_update_filters(self, context: TContextKwargs) -> list[Any]:
+        return super()._prepare_update_filters(context) + self._ownership_filters(context)
+
+    @hook_stage
+    async def _context_update_many(self, session: AsyncSession, objs_data: Mapping[uuid.UUID, UpdateSchemaType],
+                                   context: TContextKwargs):
+        if not self.fuse_ownership_checks:
+            await self._ensure_ownership_many(session, list(objs_data), context["parent_id"])
+        yield
 
     # ============================================================
     # Delete Hooks
     # ============================================================
 
-    @asynccontextmanager
+    @hook_stage
     async def _context_delete(self, session: AsyncSession, obj_id: uuid.UUID, context: TContextKwargs):
         """Ensure the object being deleted belongs to the parent context."""
-        async with super()._context_delete(session, obj_id, context):
+        if not self.fuse_ownership_checks:
             await self._ensure_ownership(session, obj_id, context["parent_id"])
-            yield
+        yield
+
+    def _prepare_delete_filters(self, context: TContextKwargs) -> list[Any]:
+        return super()._prepare_delete_filters(context) + self._ownership_filters(context)
+
+    @hook_stage
+    async def _context_delete_many(self, session: AsyncSession, obj_ids: Sequence[uuid.UUID],
+                                   context: TContextKwargs):
+        if not self.fuse_ownership_checks:
+            await self._ensure_ownership_many(session, obj_ids, context["parent_id"])
+        yield
@@ -0,0 +1,146 @@
+from contextlib import asynccontextmanager
+from functools import partial, update_wrapper
+from typing import Any, Callable, AsyncContextManager, Optional
+
+HookStageFactory = Callable[..., AsyncContextManager]
+
+
+def noop_hook(func):
+    """Mark a base hook as a no-op, so hook pipelines can leave it out."""
+    func.__noop_hook__ = True
+    return func
+
+
+def is_noop_hook(attr: Any) -> bool:
+    return getattr(attr, "__noop_hook__", False)
+
+
+class hook_stage:
+    """
+    Decorator for a ``_context_*`` hook written as one stage, without calling ``super()``.
+
+    The decorated async generator yields once, like an ``@asynccontextmanager`` hook. Services run
+    the stages of their whole MRO from a flat pipeline (see ``build_hook_pipeline``); calling the hook
+    as a method still works and behaves like the cooperative form::
+
+        async with super()._context_create(...):
+            <stage body>
+    """
+
+    def __init__(self, func):
+        self.body = asynccontextmanager(func)
+        self.owner: Optional[type] = None
+        self.name: Optional[str] = None
+        update_wrapper(self, func)
+
+    def __set_name__(self, owner: type, name: str):
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return partial(self._chained, instance)
+
+    @asynccontextmanager
+    async def _chained(self, instance, *args, **kwargs):
+        async with getattr(super(self.owner, instance), self.name)(*args, **kwargs):
+            async with self.body(instance, *args, **kwargs):
+                yield
+
+
+def _resolve_context_hook(cls: type, name: str) -> tuple[HookStageFactory, ...]:
+    """
+    Flatten the ``super()`` chain of one context hook into its stages, in the order they are entered.
+
+    Walks the MRO collecting ``hook_stage`` bodies and stops at the no-op base hook. A plain hook
+    (one that chains with ``super()`` itself) ends the walk too and runs the rest of the chain as before.
+    """
+    stages: list[HookStageFactory] = []
+    for klass in cls.__mro__:
+        attr = klass.__dict__.get(name)
+        if attr is None:
+            continue
+        if is_noop_hook(attr):
+            break
+        if isinstance(attr, hook_stage):
+            stages.append(attr.body)
+            continue
+        stages.append(lambda self, *args, _attr=attr, **kwargs: _attr.__get__(self)(*args, **kwargs))
+        break
+    # The outermost class wraps super() around its own stage, so the deepest stage is entered first.
+    stages.reverse()
+    return tuple(stages)
+
+
+def _resolve_hook(cls: type, name: str) -> Optional[Callable[..., Any]]:
+    """The hook function to call, or None if it resolves to the no-op base hook."""
+    for klass in cls.__mro__:
+        attr = klass.__dict__.get(name)
+        if attr is not None:
+            return None if is_noop_hook(attr) else attr
+    return None
+
+
+def build_hook_pipeline(cls: type) -> dict[str, Any]:
+    """
+    Resolve every hook declared on ``cls`` once, at class creation.
+
+    ``_context_*`` hooks map to a tuple of stage factories (empty if only the no-op remains); other
+    hooks (``_post_*``, ...) map to the function to call, or None when it is the no-op base hook.
+    """
+    names = {name for klass in cls.__mro__ for name, attr in vars(klass).items() if is_noop_hook(attr)}
+    return {
+        name: _resolve_context_hook(cls, name) if name.startswith("_context_") else _resolve_hook(cls, name)
+        for name in names
+    }
+
+
+class _NoHooks:
+    """Context manager for a hook without stages."""
+    __slots__ = ()
+
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+NO_HOOKS = _NoHooks()
+
+
+class HookStack:
+    """Enter several hook stages in order and exit them in reverse, like nested ``async with``."""
+    __slots__ = ("_managers", "_entered")
+
+    def __init__(self, managers: list[AsyncContextManager]):
+        self._managers = managers
+        self._entered = 0
+
+    async def __aenter__(self):
+        try:
+            for manager in self._managers:
+                await manager.__aenter__()
+                self._entered += 1
+        except BaseException as exc:
+            # Unwind the stages already entered; the operation itself must not run.
+            await self.__aexit__(type(exc), exc, exc.__traceback__)
+            raise
+        return None
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pending = exc
+        for manager in reversed(self._managers[:self._entered]):
+            try:
+                if pending is None:
+                    await manager.__aexit__(None, None, None)
+                elif await manager.__aexit__(type(pending), pending, pending.__traceback__):
+                    pending = None
+            except BaseException as new_exc:
+                pending = new_exc
+        if pending is exc:
+            return False
+        if pending is None:
+            return True
+        raise pending
@@ -1,10 +1,13 @@
 import abc
+import re
 import uuid
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Tuple, Union
+from typing import Any, AsyncIterator, Mapping, Optional, Sequence, Tuple, Union
 
-from sqlalchemy import and_
+from sqlalchemy import and_, Column
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import visitors
 from sqlalchemy.sql.expression import ColumnElement
 
 from app.base.exceptions.basic import BadRequestException
@@ -15,6 +18,13 @@ from app.base.services.base import (
     TContextKwargs,
     UpdateSchemaType,
 )
+from app.base.services.pipeline import hook_stage
+
+DEFAULT_MESSAGE = "Data already exists."
+
+# SQLSTATE unique_violation (PostgreSQL); the other drivers only say so in the message.
+UNIQUE_VIOLATION_SQLSTATE = "23505"
+UNIQUE_VIOLATION_MESSAGES = ("unique constraint", "duplicate entry", "duplicate key")
 
 
 class UniqueConstraintHooksMixin(BaseCreateHooks, BaseUpdateHooks, metaclass=abc.ABCMeta):
@@ -22,7 +32,12 @@ class UniqueConstraintHooksMixin(BaseCreateHooks, BaseUpdateHooks, metaclass=abc
     Async Generator-based Unique Constraint Check Hook.
 
     This mixin allows services to define unique constraints using a generator pattern.
-    It automatically checks for duplicates before Create and Update operations.
+    It automatically checks for duplicates before Create and Update operations, with a
+    single query for all yielded constraints.
+
+    With ``optimistic_unique_checks = True`` the pre-check is skipped and an ``IntegrityError``
+    raised by the write is mapped back to the message of the violated constraint. Only use it
+    when every yielded condition is backed by a real UNIQUE constraint in the database.
 
     Usage Example:
         class UserService(UniqueConstraintHooks, ...):
@@ -35,6 +50,8 @@ class UniqueConstraintHooksMixin(BaseCreateHooks, BaseUpdateHooks, metaclass=abc
                     yield User.email == obj_data.email, "Email already exists."
     """
 
+    optimistic_unique_checks: bool = False
+
     @abc.abstractmethod
     async def _unique_constraints(
             self,
@@ -55,24 +72,24 @@ class UniqueConstraintHooksMixin(BaseCreateHooks, BaseUpdateHooks, metaclass=abc
         # Subclasses must implement this method and use 'yield'.
         yield
 
-    async def _check_constraint(
-            self,
-            session: AsyncSession,
-            condition: ColumnElement[bool],
-            message: str,
-            exclude_id: Any = None,
-    ) -> None:
-        """Executes the DB query to check if the unique condition is violated."""
+    def _exclude_current(self, condition: ColumnElement[bool], exclude_id: Any = None) -> ColumnElement[bool]:
         if exclude_id is not None:
             # For updates: Check if record exists matching the condition BUT has a different ID.
-            query_condition = and_(condition, self.repo.model.id != exclude_id)
-        else:
-            # For creates: Just check if the condition matches any record.
-            query_condition = condition
+            return and_(condition, self.repo.model.id != exclude_id)
+        # For creates: Just check if the condition matches any record.
+        return condition
 
-        is_exists = await self.repo.exists(session, query_condition)
-        if is_exists:
-            raise BadRequestException(message)
+    @staticmethod
+    async def _collect_constraints(
+            constraints: AsyncIterator[Tuple[ColumnElement[bool], str]],
+    ) -> list[Tuple[ColumnElement[bool], str]]:
+        items = []
+        async for item in constraints:
+            if isinstance(item, tuple):
+                items.append(item)
+            else:
+                items.append((item, DEFAULT_MESSAGE))  # Default fallback message
+        return items
 
     async def _process_constraints(
             self,
@@ -80,33 +97,93 @@ class UniqueConstraintHooksMixin(BaseCreateHooks, BaseUpdateHooks, metaclass=abc
             constraints: AsyncIterator[Tuple[ColumnElement[bool], str]],
             exclude_id: Any = None,
     ) -> None:
-        """Iterates over the constraints generator and performs checks."""
-        async for item in constraints:
-            if isinstance(item, tuple):
-                condition, message = item
-            else:
-                condition = item
-                message = "Data already exists."  # Default fallback message
+        """Checks every yielded constraint in one query and raises with the first violated one's message."""
+        items = await self._collect_constraints(constraints)
+        conditions = [self._exclude_current(condition, exclude_id) for condition, _ in items]
+        matched = await self.repo.first_existing(session, conditions)
+        if matched is not None:
+            raise BadRequestException(items[matched][1])
+
+    async def _process_constraints_many(
+            self,
+            session: AsyncSession,
+            objs_data: Sequence[Union[CreateSchemaType, UpdateSchemaType]],
+            context: TContextKwargs,
+            exclude_ids: Optional[Sequence[Any]] = None,
+    ) -> None:
+        """
+        Checks the constraints of every object in one query (``exclude_ids`` pairs up with ``objs_data``).
+
+        Only existing rows are checked: duplicates within the batch itself are left to the database.
+        """
+        items = []
+        for i, obj_data in enumerate(objs_data):
+            exclude_id = exclude_ids[i] if exclude_ids is not None else None
+            for condition, message in await self._collect_constraints(self._unique_constraints(obj_data, context)):
+                items.append((self._exclude_current(condition, exclude_id), message))
+        matched = await self.repo.first_existing(session, [condition for condition, _ in items])
+        if matched is not None:
+            raise BadRequestException(items[matched][1])
+
+    @staticmethod
+    def _integrity_error_message(
+            error: IntegrityError, items: list[Tuple[ColumnElement[bool], str]]
+    ) -> Optional[str]:
+        """
+        The message of the constraint whose columns all appear in the database error, if any.
 
-            await self._check_constraint(session, condition, message, exclude_id)
+        Both SQLite ("UNIQUE constraint failed: table.col") and PostgreSQL ("Key (col)=(...) already
+        exists") name the offending columns. Other integrity errors (NOT NULL, foreign keys, checks)
+        may name the same columns, so only unique violations are mapped.
+        """
+        detail = str(error.orig)
+        sqlstate = getattr(error.orig, "sqlstate", None) or getattr(error.orig, "pgcode", None)
+        if sqlstate != UNIQUE_VIOLATION_SQLSTATE and not any(
+                text in detail.lower() for text in UNIQUE_VIOLATION_MESSAGES):
+            return None
+        for condition, message in items:
+            columns = {
+                element.name for element in visitors.iterate(condition) if isinstance(element, Column)
+            }
+            if columns and all(re.search(rf"\b{re.escape(name)}\b", detail) for name in columns):
+                return message
+        return None
+
+    @asynccontextmanager
+    async def _translate_integrity_error(
+            self, objs_data: Sequence[Union[CreateSchemaType, UpdateSchemaType]], context: TContextKwargs
+    ):
+        try:
+            yield
+        except IntegrityError as e:
+            items = []
+            for obj_data in objs_data:
+                items += await self._collect_constraints(self._unique_constraints(obj_data, context))
+            message = self._integrity_error_message(e, items)
+            if message is None:
+                raise
+            raise BadRequestException(message, log_message=str(e.orig), trace=False) from e
 
     # ============================================================
     # Hooks Implementation
     # ============================================================
 
-    @asynccontextmanager
+    @hook_stage
     async def _context_create(
             self, session: AsyncSession, obj_data: CreateSchemaType, context: TContextKwargs
     ):
         """
         Extends the create context to run unique constraint checks.
         """
-        async with super()._context_create(session, obj_data, context):
+        if self.optimistic_unique_checks:
+            async with self._translate_integrity_error([obj_data], context):
+                yield
+        else:
             constraints = self._unique_constraints(obj_data, context)
             await self._process_constraints(session, constraints)
             yield
 
-    @asynccontextmanager
+    @hook_stage
     async def _context_update(
             self,
             session: AsyncSession,
@@ -117,7 +194,43 @@ class UniqueConstraintHooksMixin(BaseCreateHooks, BaseUpdateHooks, metaclass=abc
         """
         Extends the update context to run unique constraint checks, excluding the current object.
         """
-        async with super()._context_update(session, obj_id, obj_data, context):
+        if self.optimistic_unique_checks:
+            async with self._translate_integrity_error([obj_data], context):
+                yield
+        else:
             constraints = self._unique_constraints(obj_data, context)
             await self._process_constraints(session, constraints, exclude_id=obj_id)
             yield
+
+    @hook_stage
+    async def _context_create_many(
+            self, session: AsyncSession, objs_data: Sequence[CreateSchemaType], context: TContextKwargs
+    ):
+        """
+        Runs the unique constraint checks of the whole batch as one query.
+        """
+        if self.optimistic_unique_checks:
+            async with self._translate_integrity_error(objs_data, context):
+                yield
+        else:
+            await self._process_constraints_many(session, objs_data, context)
+            yield
+
+    @hook_stage
+    async def _context_update_many(
+            self,
+            session: AsyncSession,
+            objs_data: Mapping[uuid.UUID, UpdateSchemaType],
+            context: TContextKwargs,
+    ):
+        """
+        Runs the unique constraint checks of the whole batch as one query, each excluding its own object.
+        """
+        if self.optimistic_unique_checks:
+            async with self._translate_integrity_error(list(objs_data.values()), context):
+                yield
+        else:
+            await self._process_constraints_many(
+                session, list(objs_data.values()), context, exclude_ids=list(objs_data)
+            )
+            yield
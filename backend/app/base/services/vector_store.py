@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.base.repos.base import CreateSchemaType
 from app.base.services.base import BaseCreateHooks, BaseUpdateHooks, BaseDeleteHooks, TContextKwargs
+from app.base.services.pipeline import hook_stage
 
 
 class VectorStoreHookMixin(
@@ -18,10 +19,10 @@ class VectorStoreHookMixin(
         """Vector store instance associated with the service."""
         pass
 
+    @hook_stage
     async def _context_create(self, session: AsyncSession, obj_data: CreateSchemaType, context: TContextKwargs):
-        async with super()._context_create(session, obj_data, context):
-            # Vector store 생성 로직 추가 가능
-            yield
+        # Vector store 생성 로직 추가 가능
+        yield
 
 
 class SearchServiceMixin:
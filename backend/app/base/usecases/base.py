@@ -1,9 +1,30 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Awaitable, Callable, ClassVar, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database.retry import RetryPolicy
+from app.core.database.transaction import AsyncTransaction
+
+T = TypeVar("T")
 
 
 class BaseUseCase(ABC):
+    # Safe to re-run from the start: a transaction that failed on lock contention or a serialization
+    # failure is retried instead of failing the request. Leave False when execute has effects outside
+    # the database (external APIs, vector stores, ...). The CRUD usecases leave it False; a feature opts
+    # in on its own usecases once it knows its service only touches the database.
+    idempotent: ClassVar[bool] = False
+    # None uses AsyncTransaction.RETRY_POLICY.
+    retry_policy: ClassVar[Optional[RetryPolicy]] = None
+
     @abstractmethod
     async def execute(self, *args, **kwargs) -> Any:
         """Execute the use case. Must be implemented by subclasses."""
         ...
+
+    async def _run_in_transaction(self, func: Callable[[AsyncSession], Awaitable[T]], read_only: bool = False) -> T:
+        """Run ``func(session)`` in its own transaction (or the enclosing unit of work), retrying if idempotent."""
+        return await AsyncTransaction.run(
+            func, idempotent=self.idempotent, retry_policy=self.retry_policy, read_only=read_only
+        )
@@ -1,7 +1,8 @@
 from uuid import UUID
-from typing import Any, Union, TypeVar, Generic, Optional
+from typing import Any, Union, TypeVar, Generic, Optional, Sequence, Mapping, AsyncIterator
 
 from app.base.repos.base import ModelType, CreateSchemaType, UpdateSchemaType
+from app.base.repos.count import CountStrategy
 from app.base.schemas.paginated import PaginatedList
 from app.base.services.base import (
     BaseCreateServiceMixin, BaseGetServiceMixin, BaseGetMultiServiceMixin, BaseUpdateServiceMixin,
@@ -24,9 +25,25 @@ class BaseGetUseCase(BaseUseCase, Generic[TService, ModelType, TContextKwargs]):
     def __init__(self, service: TService):
         self.service = service
 
-    async def execute(self, obj_id: UUID, context: Optional[TContextKwargs] = None) -> Optional[ModelType]:
-        async with AsyncTransaction() as session:
-            return await self.service.get(session, obj_id, context=context)
+    async def execute(
+            self, obj_id: UUID, context: Optional[TContextKwargs] = None, fields: Optional[Sequence[str]] = None
+    ) -> Optional[ModelType]:
+        return await self._run_in_transaction(
+            lambda session: self.service.get(session, obj_id, context=context, fields=fields), read_only=True
+        )
+
+
+class BaseGetManyUseCase(BaseUseCase, Generic[TService, ModelType, TContextKwargs]):
+    def __init__(self, service: TService):
+        self.service = service
+
+    async def execute(
+            self, obj_ids: Sequence[UUID], context: Optional[TContextKwargs] = None,
+            fields: Optional[Sequence[str]] = None,
+    ) -> list[ModelType]:
+        return await self._run_in_transaction(
+            lambda session: self.service.get_many(session, obj_ids, context=context, fields=fields), read_only=True
+        )
 
 
 class BaseGetMultiUseCase(BaseUseCase, Generic[TService, ModelType, TContextKwargs]):
@@ -34,21 +51,50 @@ class BaseGetMultiUseCase(BaseUseCase, Generic[TService, ModelType, TContextKwar
         self.service = service
 
     async def execute(
-            self, offset: int, limit: int, order_by=None, where=None, context: Optional[TContextKwargs] = None
+            self, offset: int = 0, limit: int = 100, order_by=None, where=None,
+            context: Optional[TContextKwargs] = None, cursor: Optional[str] = None,
+            count_strategy: Optional[CountStrategy] = None, fields: Optional[Sequence[str]] = None,
     ) -> PaginatedList[ModelType]:
-        async with AsyncTransaction() as session:
-            return await self.service.get_multi(
-                session, offset=offset, limit=limit, order_by=order_by, where=where, context=context
-            )
+        return await self._run_in_transaction(
+            lambda session: self.service.get_multi(
+                session, offset=offset, limit=limit, order_by=order_by, where=where, context=context, cursor=cursor,
+                count_strategy=count_strategy, fields=fields,
+            ),
+            read_only=True,
+        )
+
+
+class BaseStreamUseCase(BaseUseCase, Generic[TService, ModelType, TContextKwargs]):
+    """Streams every matching row; the transaction stays open until the iterator is exhausted or closed."""
+
+    def __init__(self, service: TService):
+        self.service = service
+
+    async def execute(
+            self, order_by=None, where=None, context: Optional[TContextKwargs] = None, batch_size: int = 1000,
+    ) -> AsyncIterator[ModelType]:
+        async with AsyncTransaction(read_only=True) as session:
+            async for obj in self.service.stream(
+                    session, order_by=order_by, where=where, context=context, batch_size=batch_size
+            ):
+                yield obj
 
 
 class BaseCreateUseCase(BaseUseCase, Generic[TService, ModelType, CreateSchemaType, TContextKwargs]):
+    """
+    Creates one object. Features may set ``idempotent = True`` when the service only writes to the database.
+
+    A retry is then safe: only contention errors are retried, and those are raised before the commit
+    took effect, so nothing of the failed attempt persists. Its own transaction is rolled back, or in
+    the write queue its SAVEPOINT or the whole group transaction. The re-run flushes a new object, whose
+    primary key default (uuid4) is drawn again, so the create inserts exactly one row.
+    """
+
     def __init__(self, service: TService):
         self.service = service
 
     async def execute(self, obj_data: CreateSchemaType, context: Optional[TContextKwargs] = None) -> ModelType:
-        async with AsyncTransaction() as session:
-            return await self.service.create(session, obj_data, context=context)
+        return await self._run_in_transaction(lambda session: self.service.create(session, obj_data, context=context))
 
 
 class BaseUpdateUseCase(BaseUseCase, Generic[TService, ModelType, UpdateSchemaType, TContextKwargs]):
@@ -58,8 +104,9 @@ class BaseUpdateUseCase(BaseUseCase, Generic[TService, ModelType, UpdateSchemaTy
     async def execute(
             self, obj_id: UUID, obj_data: UpdateSchemaType, context: Optional[TContextKwargs] = None
     ) -> ModelType:
-        async with AsyncTransaction() as session:
-            return await self.service.update(session, obj_id, obj_data, context=context)
+        return await self._run_in_transaction(
+            lambda session: self.service.update(session, obj_id, obj_data, context=context)
+        )
 
 
 class BaseDeleteUseCase(BaseUseCase, Generic[TService, ModelType, TContextKwargs]):
@@ -67,5 +114,38 @@ class BaseDeleteUseCase(BaseUseCase, Generic[TService, ModelType, TContextKwargs
         self.service = service
 
     async def execute(self, obj_id: UUID, context: Optional[TContextKwargs] = None):
-        async with AsyncTransaction() as session:
-            return await self.service.delete(session, obj_id, context=context)
+        return await self._run_in_transaction(lambda session: self.service.delete(session, obj_id, context=context))
+
+
+class BaseCreateManyUseCase(BaseUseCase, Generic[TService, ModelType, CreateSchemaType, TContextKwargs]):
+    def __init__(self, service: TService):
+        self.service = service
+
+    async def execute(
+            self, objs_data: Sequence[CreateSchemaType], context: Optional[TContextKwargs] = None
+    ) -> list[ModelType]:
+        return await self._run_in_transaction(
+            lambda session: self.service.create_many(session, objs_data, context=context)
+        )
+
+
+class BaseUpdateManyUseCase(BaseUseCase, Generic[TService, ModelType, UpdateSchemaType, TContextKwargs]):
+    def __init__(self, service: TService):
+        self.service = service
+
+    async def execute(
+            self, objs_data: Mapping[UUID, UpdateSchemaType], context: Optional[TContextKwargs] = None
+    ) -> list[Optional[ModelType]]:
+        return await self._run_in_transaction(
+            lambda session: self.service.update_many(session, objs_data, context=context)
+        )
+
+
+class BaseDeleteManyUseCase(BaseUseCase, Generic[TService, ModelType, TContextKwargs]):
+    def __init__(self, service: TService):
+        self.service = service
+
+    async def execute(self, obj_ids: Sequence[UUID], context: Optional[TContextKwargs] = None) -> int:
+        return await self._run_in_transaction(
+            lambda session: self.service.delete_many(session, obj_ids, context=context)
+        )
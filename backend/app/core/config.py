@@ -1,5 +1,6 @@
 import functools
 import os
+from typing import Literal
 
 from pydantic import SecretStr, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -33,6 +34,49 @@ if os.path.exists(get_env_filename()):
 
 class AppSettings(BaseSettings):
     DATABASE_URL: str = Field(default=f"sqlite+aiosqlite:///{get_repo_path()}/.test.db")
+    # Connection pool, per engine (the primary and each replica). Ignored by single-connection pools
+    # such as in-memory SQLite's.
+    DATABASE_POOL_SIZE: int = Field(default=5, ge=1)
+    DATABASE_POOL_MAX_OVERFLOW: int = Field(default=10, ge=0)
+    DATABASE_POOL_TIMEOUT_SECONDS: float = Field(default=30.0, gt=0)
+    # Replace connections older than this (-1: never), so idle ones are not dropped under us by the server.
+    DATABASE_POOL_RECYCLE_SECONDS: int = Field(default=1800, ge=-1)
+    # Ping before every checkout, so a connection the server dropped is replaced instead of failing the request.
+    # Costs one round trip per transaction; may be turned off where connections are reliable (e.g. SQLite).
+    DATABASE_POOL_PRE_PING: bool = True
+    # Connections to open at startup, so the first requests do not pay for connecting (capped at POOL_SIZE).
+    DATABASE_POOL_WARMUP_CONNECTIONS: int = Field(default=0, ge=0)
+    # SQLite profile, run on every new connection of a SQLite engine (see app.core.database.sqlite).
+    DATABASE_SQLITE_JOURNAL_MODE: Literal["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"] = "WAL"
+    DATABASE_SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    # Page cache per connection (0: SQLite's default of 2 MiB).
+    DATABASE_SQLITE_CACHE_SIZE_KIB: int = Field(default=65536, ge=0)
+    DATABASE_SQLITE_MMAP_SIZE_BYTES: int = Field(default=256 * 1024 * 1024, ge=0)
+    DATABASE_SQLITE_TEMP_STORE: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
+    DATABASE_SQLITE_BUSY_TIMEOUT_MS: int = Field(default=5000, ge=0)
+    # Run PRAGMA optimize this often (0: never, not even on connect).
+    DATABASE_SQLITE_OPTIMIZE_INTERVAL_SECONDS: float = Field(default=3600.0, ge=0)
+    # Log statements that run at least this long, with their parameters redacted (0: never).
+    DATABASE_SLOW_QUERY_SECONDS: float = Field(default=0.5, ge=0)
+    # Diagnostics: record the statement shapes run on the primary and serve their query plans,
+    # full scans and index advice at /api/health/query-plans (see app.core.database.explain).
+    DATABASE_EXPLAIN_PLANS: bool = False
+    # Grants access to debug endpoints (query plans, pool statistics) to requests sending it in X-Debug-Token;
+    # unset, they are disabled.
+    DEBUG_TOKEN: SecretStr | None = None
+    # SQLite files only: run write transactions of usecases one at a time on a dedicated connection,
+    # committing up to MAX_BATCH queued idempotent ones together (see app.core.database.writer).
+    DATABASE_SQLITE_WRITE_QUEUE: bool = False
+    DATABASE_SQLITE_WRITE_QUEUE_MAX_BATCH: int = Field(default=32, ge=1)
+    # Read replicas (JSON list), used by read-only transactions; empty means every query goes to DATABASE_URL.
+    DATABASE_REPLICA_URLS: list[str] = Field(default_factory=list)
+    # After a write commits, reads stay on the primary for this many seconds (replication lag window).
+    DATABASE_REPLICA_STICKINESS_SECONDS: float = Field(default=5.0, ge=0)
+    # Runs (first + retries) of an idempotent transaction that failed on lock contention or a serialization failure.
+    DATABASE_RETRY_MAX_ATTEMPTS: int = Field(default=3, ge=1)
+    # Backoff before retry n is uniform in [0, min(MAX_DELAY, BASE_DELAY * 2 ** (n - 1))].
+    DATABASE_RETRY_BASE_DELAY_SECONDS: float = Field(default=0.05, ge=0)
+    DATABASE_RETRY_MAX_DELAY_SECONDS: float = Field(default=1.0, ge=0)
 
     model_config = SettingsConfigDict(
         env_ignore_empty=True,
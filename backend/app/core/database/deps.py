@@ -1,10 +1,30 @@
-from typing import AsyncGenerator
+from typing import Annotated, AsyncGenerator
 
+from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database.engine import default_async_session_maker
+from app.core.database.transaction import UnitOfWork
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with default_async_session_maker() as session:
         yield session
+
+
+async def get_unit_of_work() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Request-scoped unit of work: the usecases of the request join it and it commits once.
+
+    Opt-in, per endpoint: an endpoint that runs several usecases which must succeed or fail together
+    declares ``_: UnitOfWorkDep``, like recording a mistake with its new vocabulary item. Endpoints
+    running a single usecase leave it out, so their read-only transactions keep going to replicas and
+    their writes keep their own retries and write queue (joined transactions re-raise contention
+    errors to the unit, which does not retry).
+    """
+    async with UnitOfWork() as session:
+        yield session
+
+
+# scope="function" commits before the response is sent, so a failed commit is reported to the client.
+UnitOfWorkDep = Annotated[AsyncSession, Depends(get_unit_of_work, scope="function")]
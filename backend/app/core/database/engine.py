@@ -1,8 +1,50 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import asyncio
+from typing import Any, Optional
 
-from app.core.config import get_app_settings
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import QueuePool
 
-async_engine = create_async_engine(str(get_app_settings().DATABASE_URL), pool_pre_ping=True)
+from app.core.config import AppSettings, get_app_settings
+from app.core.database.explain import PlanCollector
+from app.core.database.instrumentation import install_query_instrumentation
+from app.core.database.pool import InstrumentedAsyncQueuePool, warm_up
+from app.core.database.retry import RetryPolicy
+from app.core.database.routing import RoutingSessionMaker
+from app.core.database.sqlite import (
+    install_sqlite_profile, install_immediate_transactions, install_rollback_after_failed_commit, start_optimizer,
+)
+from app.core.database.writer import WriteScheduler
+
+
+def engine_options(url: str, settings: AppSettings) -> dict[str, Any]:
+    """``create_async_engine`` keyword arguments for ``url`` from the pool settings."""
+    options: dict[str, Any] = {"pool_pre_ping": settings.DATABASE_POOL_PRE_PING}
+    parsed = make_url(url)
+    # Sizing only applies to queue pools; e.g. in-memory SQLite gets a single-connection StaticPool.
+    if issubclass(parsed.get_dialect().get_pool_class(parsed), QueuePool):
+        options.update(
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=settings.DATABASE_POOL_SIZE,
+            max_overflow=settings.DATABASE_POOL_MAX_OVERFLOW,
+            pool_timeout=settings.DATABASE_POOL_TIMEOUT_SECONDS,
+            pool_recycle=settings.DATABASE_POOL_RECYCLE_SECONDS,
+        )
+    return options
+
+
+def create_engine_from_settings(url: str) -> AsyncEngine:
+    engine = create_async_engine(url, **engine_options(url, get_app_settings()))
+    install_sqlite_profile(engine, get_app_settings())
+    install_rollback_after_failed_commit(engine)
+    install_query_instrumentation(engine)
+    return engine
+
+
+# Engines are built at import time, not in the lifespan: the session makers below, AsyncTransaction and the
+# write queue bind them when imported. Building one does not connect; the app lifespan warms their pools up
+# (start_engines) and disposes them (dispose_engines), after which they reconnect lazily if used again.
+async_engine = create_engine_from_settings(str(get_app_settings().DATABASE_URL))
 
 default_async_session_maker = async_sessionmaker(
     async_engine,
@@ -11,3 +53,91 @@ default_async_session_maker = async_sessionmaker(
     autocommit=False,
     autoflush=False,
 )
+
+# Statement shapes of the primary, explained on demand, when plan capture is enabled.
+plan_collector = PlanCollector(async_engine) if get_app_settings().DATABASE_EXPLAIN_PLANS else None
+if plan_collector is not None:
+    plan_collector.install()
+
+replica_async_engines = [create_engine_from_settings(url) for url in get_app_settings().DATABASE_REPLICA_URLS]
+
+session_router = RoutingSessionMaker(
+    [
+        async_sessionmaker(
+            engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False,
+        )
+        for engine in replica_async_engines
+    ],
+    stickiness=get_app_settings().DATABASE_REPLICA_STICKINESS_SECONDS,
+)
+
+
+def create_write_engine(url: str, settings: AppSettings) -> Optional[AsyncEngine]:
+    """The single-connection engine of the SQLite write queue, or None when the queue is disabled or unusable."""
+    options = engine_options(url, settings)
+    # An in-memory database is private to its engine, so a second engine would not see the same data.
+    if not settings.DATABASE_SQLITE_WRITE_QUEUE or make_url(url).get_backend_name() != "sqlite" \
+            or "pool_size" not in options:
+        return None
+    engine = create_async_engine(url, **{**options, "pool_size": 1, "max_overflow": 0})
+    install_sqlite_profile(engine, settings)
+    install_immediate_transactions(engine)
+    install_rollback_after_failed_commit(engine)
+    install_query_instrumentation(engine)
+    return engine
+
+
+write_async_engine = create_write_engine(str(get_app_settings().DATABASE_URL), get_app_settings())
+
+write_scheduler = WriteScheduler(
+    async_sessionmaker(
+        write_async_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    ),
+    max_batch=get_app_settings().DATABASE_SQLITE_WRITE_QUEUE_MAX_BATCH,
+) if write_async_engine is not None else None
+
+# Background tasks started with the engines (periodic SQLite PRAGMA optimize).
+_engine_tasks: list[asyncio.Task] = []
+
+default_retry_policy = RetryPolicy(
+    max_attempts=get_app_settings().DATABASE_RETRY_MAX_ATTEMPTS,
+    base_delay=get_app_settings().DATABASE_RETRY_BASE_DELAY_SECONDS,
+    max_delay=get_app_settings().DATABASE_RETRY_MAX_DELAY_SECONDS,
+)
+
+
+def all_engines() -> list[AsyncEngine]:
+    """The primary engine, the replica engines and the write queue's engine, if any."""
+    return [async_engine, *replica_async_engines, *([write_async_engine] if write_async_engine else [])]
+
+
+async def start_engines() -> None:
+    """Pre-open ``DATABASE_POOL_WARMUP_CONNECTIONS`` connections in every pool and start background tasks."""
+    settings = get_app_settings()
+    for engine in all_engines():
+        if settings.DATABASE_POOL_WARMUP_CONNECTIONS:
+            await warm_up(engine, settings.DATABASE_POOL_WARMUP_CONNECTIONS)
+        task = start_optimizer(engine, settings)
+        if task is not None:
+            _engine_tasks.append(task)
+
+
+async def dispose_engines() -> None:
+    """Drain the write queue, stop background tasks and close every pooled connection.
+
+    Engines reconnect lazily if used again.
+    """
+    if write_scheduler is not None:
+        await write_scheduler.stop()
+    while _engine_tasks:
+        _engine_tasks.pop().cancel()
+    for engine in all_engines():
+        await engine.dispose()
@@ -0,0 +1,216 @@
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Issue kinds found in query plans.
+FULL_SCAN = "full_scan"
+TEMP_SORT = "temp_sort"
+
+# Statements whose plan is worth a look; writes without a WHERE (INSERT) and transaction control are skipped.
+_EXPLAINED_VERBS = ("SELECT", "UPDATE", "DELETE", "WITH")
+
+# Per dialect, the prefix that makes a statement return its plan instead of running.
+EXPLAIN_PREFIXES: dict[str, str] = {
+    "sqlite": "EXPLAIN QUERY PLAN ",
+    "postgresql": "EXPLAIN ",
+}
+
+# "SCAN t USING [COVERING] INDEX i" walks an index, in order; older versions print "SCAN TABLE t".
+_SQLITE_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)$")
+_SQLITE_TEMP_SORT = re.compile(r"USE TEMP B-TREE FOR (ORDER BY|GROUP BY|DISTINCT)")
+_POSTGRESQL_SEQ_SCAN = re.compile(r"Seq Scan on (\w+)")
+_POSTGRESQL_SORT = re.compile(r"^\s*(?:->\s*)?(?:Incremental )?Sort\b")
+
+_CLAUSE_END = r"(?=\s+(?:GROUP BY|ORDER BY|LIMIT|OFFSET|FOR UPDATE|RETURNING)\b|$)"
+
+# A bound parameter in the paramstyles of the supported drivers: ?, $1, %(name)s, :name.
+_PARAM = r"(?:\?|\$\d+|%\(\w+\)s|:\w+)"
+_PARAM_OR_TUPLE = rf"(?:{_PARAM}|\({_PARAM}(?:,\s*{_PARAM})*\))"
+# An expanded IN list, one parameter (or tuple of parameters) per value.
+_EXPANDED_IN = re.compile(rf"\bIN \({_PARAM_OR_TUPLE}(?:,\s*{_PARAM_OR_TUPLE})*\)")
+
+
+@dataclass(frozen=True)
+class PlanIssue:
+    """Something in a query plan that gets slower as the table grows."""
+
+    kind: str
+    table: Optional[str]
+    detail: str
+
+
+@dataclass
+class StatementPlan:
+    """The plan of one statement shape, what is wrong with it and which index may help."""
+
+    statement: str
+    plan: list[str]
+    issues: list[PlanIssue] = field(default_factory=list)
+    advice: list[str] = field(default_factory=list)
+
+
+def statement_shape(statement: str) -> str:
+    """The statement with expanded IN lists collapsed, so IN lists of any length are one shape."""
+    return _EXPANDED_IN.sub("IN (...)", statement)
+
+
+def plan_lines(dialect_name: str, rows: list[Any]) -> list[str]:
+    # SQLite rows are (id, parent, notused, detail); PostgreSQL returns one text line per row.
+    return [row[3] if dialect_name == "sqlite" else row[0] for row in rows]
+
+
+def find_issues(dialect_name: str, plan: list[str]) -> list[PlanIssue]:
+    """Full table scans and sorts through a temporary structure in a plan."""
+    issues = []
+    for line in plan:
+        if dialect_name == "sqlite":
+            scan = _SQLITE_SCAN.match(line.strip())
+            sort = _SQLITE_TEMP_SORT.search(line)
+        else:
+            scan = _POSTGRESQL_SEQ_SCAN.search(line)
+            sort = _POSTGRESQL_SORT.match(line)
+        if scan:
+            issues.append(PlanIssue(FULL_SCAN, scan.group(1), line.strip()))
+        if sort:
+            issues.append(PlanIssue(TEMP_SORT, None, line.strip()))
+    return issues
+
+
+def _clause(statement: str, keyword: str) -> str:
+    match = re.search(rf"\b{keyword}\s+(.*?){_CLAUSE_END}", statement, re.DOTALL)
+    return match.group(1) if match else ""
+
+
+def _unique(items: list[str]) -> list[str]:
+    return list(dict.fromkeys(items))
+
+
+def index_advice(statement: str, issues: list[PlanIssue]) -> list[str]:
+    """Indexes that would let the statement avoid its issues, guessed from its WHERE and ORDER BY.
+
+    Equality columns come first, then a single range column, then the ordering columns, which is
+    the column order a B-tree index serves both the filter and the sort in.
+    """
+    advice = []
+    where = _clause(statement, "WHERE")
+    order_by = _clause(statement, "ORDER BY")
+    tables = [issue.table for issue in issues if issue.table]
+    if not tables and any(issue.kind == TEMP_SORT for issue in issues):
+        tables = re.findall(r"\b(\w+)\.\w+", order_by)
+    for table in _unique(tables):
+        columns = rf"\b{table}\.(\w+)"
+        equal = re.findall(rf"{columns}\s*(?:=|IN\b|IS\b)", where)
+        ranges = re.findall(rf"{columns}\s*(?:<|>|BETWEEN\b)", where)
+        like = re.findall(rf"{columns}\s+(?:NOT\s+)?I?LIKE\s+'%'", where)
+        ordered = re.findall(columns, order_by)
+        if like:
+            advice.append(
+                f"{table}: LIKE with a leading wildcard on {', '.join(_unique(like))} cannot use a B-tree index; "
+                f"consider full-text search (SQLite FTS5, PostgreSQL pg_trgm)"
+            )
+        index = _unique([*equal, *ranges[:1], *ordered])
+        if index:
+            advice.append(f"CREATE INDEX ix_{table}_{'_'.join(index)} ON {table} ({', '.join(index)})")
+    return advice
+
+
+class PlanCollector:
+    """Records each distinct statement shape an engine runs and explains it on demand.
+
+    The first statement and parameters seen for a shape are kept to explain it with. Plans are
+    captured afterwards, on a connection of their own, so the statements themselves run undisturbed.
+    At most ``max_statements`` shapes are kept, the least recently run ones are dropped first.
+
+    Example:
+
+        collector = PlanCollector(engine)
+        collector.install()
+        ...  # run the application or the tests
+        print(format_report(await collector.explain()))
+    """
+
+    def __init__(self, engine: AsyncEngine, max_statements: int = 1000) -> None:
+        self.engine = engine
+        self.max_statements = max_statements
+        # shape -> (statement, parameters), least recently run first.
+        self._statements: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+        self._plans: dict[str, StatementPlan] = {}
+
+    def install(self) -> None:
+        if not event.contains(self.engine.sync_engine, "before_cursor_execute", self._record):
+            event.listen(self.engine.sync_engine, "before_cursor_execute", self._record)
+
+    def remove(self) -> None:
+        if event.contains(self.engine.sync_engine, "before_cursor_execute", self._record):
+            event.remove(self.engine.sync_engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if executemany or not statement.lstrip().upper().startswith(_EXPLAINED_VERBS):
+            return
+        shape = statement_shape(statement)
+        if shape in self._statements:
+            self._statements.move_to_end(shape)
+            return
+        self._statements[shape] = (statement, parameters)
+        if len(self._statements) > self.max_statements:
+            dropped, _ = self._statements.popitem(last=False)
+            self._plans.pop(dropped, None)
+
+    async def explain(self) -> list[StatementPlan]:
+        """Plans of every shape recorded so far; each shape is explained once."""
+        dialect_name = self.engine.dialect.name
+        prefix = EXPLAIN_PREFIXES.get(dialect_name)
+        pending = [(shape, *sample) for shape, sample in self._statements.items() if shape not in self._plans]
+        if pending and prefix is not None:
+            async with self.engine.connect() as conn:
+                for shape, statement, parameters in pending:
+                    try:
+                        rows = (await conn.exec_driver_sql(prefix + statement, parameters)).all()
+                    except DBAPIError as e:
+                        # E.g. a table created and dropped by the statement's own transaction.
+                        plan = StatementPlan(shape, [f"EXPLAIN failed: {e.orig}"])
+                        await conn.rollback()
+                    else:
+                        lines = plan_lines(dialect_name, rows)
+                        issues = find_issues(dialect_name, lines)
+                        plan = StatementPlan(shape, lines, issues, index_advice(shape, issues))
+                    if shape in self._statements:  # not dropped meanwhile
+                        self._plans[shape] = plan
+        return list(self._plans.values())
+
+
+_INDEX_ADVICE = re.compile(r"^CREATE INDEX \w+ ON (\w+) \((.*)\)$")
+
+
+def _merge_advice(advice: list[str]) -> list[str]:
+    # An index whose columns lead another index on the same table is served by that one.
+    indexes = {item: match.groups() for item in advice if (match := _INDEX_ADVICE.match(item))}
+    return [
+        item for item in advice
+        if item not in indexes or not any(
+            other != item and table == indexes[item][0] and columns.startswith(indexes[item][1] + ", ")
+            for other, (table, columns) in indexes.items()
+        )
+    ]
+
+
+def format_report(plans: list[StatementPlan]) -> str:
+    """A readable report of the plans with issues and the indexes that may fix them."""
+    flagged = [plan for plan in plans if plan.issues]
+    lines = [f"{len(flagged)} of {len(plans)} statement shapes scan a full table or sort in a temporary structure"]
+    for plan in flagged:
+        lines.append("")
+        lines.append(" ".join(plan.statement.split()))
+        lines.extend(f"  plan: {line}" for line in plan.plan)
+        lines.extend(f"  advice: {advice}" for advice in plan.advice)
+    advice = _merge_advice(_unique([advice for plan in flagged for advice in plan.advice]))
+    if advice:
+        lines.append("")
+        lines.append("Index advice:")
+        lines.extend(f"  {item}" for item in advice)
+    return "\n".join(lines)
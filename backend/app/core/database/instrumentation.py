@@ -0,0 +1,82 @@
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import get_app_settings
+from app.core.logger import get_request_id, logger
+
+# Response headers carrying a request's totals.
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Time-Ms"
+
+# conn.info key: start times of the statements in flight on the connection (a stack, for nested executes).
+_START_TIMES_KEY = "query_start_times"
+
+
+@dataclass
+class QueryStats:
+    """Statements run and time spent in the database on behalf of one request."""
+
+    count: int = 0
+    seconds: float = 0.0
+
+
+# Stats of the requests in flight, by request ID (see app.core.logger.request_id_var).
+_request_stats: dict[str, QueryStats] = {}
+
+
+@contextmanager
+def track_queries(request_id: str) -> Iterator[QueryStats]:
+    """Aggregate the statements run under ``request_id`` on instrumented engines while the block runs."""
+    stats = _request_stats[request_id] = QueryStats()
+    try:
+        yield stats
+    finally:
+        _request_stats.pop(request_id, None)
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """The parameters' shape with every value replaced, so logs never carry user data."""
+    if isinstance(parameters, dict):
+        return {key: "?" for key in parameters}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            return f"<{len(parameters)} parameter sets>"  # executemany
+        return tuple("?" for _ in parameters)
+    return parameters
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info[_START_TIMES_KEY].pop()
+    request_id = get_request_id()
+    stats = _request_stats.get(request_id) if request_id else None
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+    threshold = get_app_settings().DATABASE_SLOW_QUERY_SECONDS
+    if threshold and elapsed >= threshold:
+        logger.warning(f"Slow query ({elapsed * 1000:.1f} ms): {statement} {redact_parameters(parameters)}")
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute; drop its start time.
+    conn = exception_context.connection
+    if conn is not None and conn.info.get(_START_TIMES_KEY):
+        conn.info[_START_TIMES_KEY].pop()
+
+
+def install_query_instrumentation(engine: AsyncEngine) -> None:
+    """Count and time every statement the engine runs, and log slow ones; idempotent."""
+    sync_engine = engine.sync_engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(sync_engine, "handle_error", _handle_error)
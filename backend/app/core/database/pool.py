@@ -0,0 +1,62 @@
+import time
+from contextlib import AsyncExitStack
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` that records how long checkouts wait for a connection.
+
+    The wait covers queueing for a free connection and opening a new one within ``max_overflow``;
+    a pool that is too small for the workers shows up as a growing ``max_wait_seconds``.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            waited = time.perf_counter() - start
+            self.checkouts += 1
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+
+def pool_status(engine: AsyncEngine) -> dict[str, Any]:
+    """Live statistics of the engine's pool (sizes are only known for queue pools)."""
+    pool: Pool = engine.pool
+    status: dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        status.update(
+            checkouts=pool.checkouts,
+            total_wait_seconds=pool.total_wait_seconds,
+            max_wait_seconds=pool.max_wait_seconds,
+        )
+    return status
+
+
+async def warm_up(engine: AsyncEngine, connections: int) -> int:
+    """Open up to ``connections`` pooled connections at once and return them to the pool.
+
+    Capped at the pool size, so warming never leaves overflow connections behind. Returns the number opened.
+    """
+    connections = min(connections, engine.pool.size() if isinstance(engine.pool, QueuePool) else 1)
+    async with AsyncExitStack() as stack:
+        for _ in range(connections):
+            await stack.enter_async_context(engine.connect())
+    return max(connections, 0)
@@ -0,0 +1,68 @@
+import asyncio
+import random
+from typing import Any, Awaitable, Callable, Optional
+
+from sqlalchemy.exc import DBAPIError
+
+# Per dialect, whether a DBAPI error is transient contention: re-running the whole transaction may succeed.
+RetryClassifier = Callable[[BaseException], bool]
+
+
+def _sqlite_is_retryable(orig: BaseException) -> bool:
+    # SQLITE_BUSY / SQLITE_LOCKED once busy_timeout has run out.
+    message = str(orig).lower()
+    return "database is locked" in message or "database table is locked" in message
+
+
+def _postgresql_is_retryable(orig: BaseException) -> bool:
+    # serialization_failure, deadlock_detected. asyncpg and psycopg set sqlstate, psycopg2 pgcode.
+    return (getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)) in {"40001", "40P01"}
+
+
+def _mysql_is_retryable(orig: BaseException) -> bool:
+    # ER_LOCK_WAIT_TIMEOUT, ER_LOCK_DEADLOCK.
+    return bool(orig.args) and orig.args[0] in {1205, 1213}
+
+
+DEFAULT_CLASSIFIERS: dict[str, RetryClassifier] = {
+    "sqlite": _sqlite_is_retryable,
+    "postgresql": _postgresql_is_retryable,
+    "mysql": _mysql_is_retryable,
+    "mariadb": _mysql_is_retryable,
+}
+
+
+class RetryPolicy:
+    """When and how often to re-run a transaction that failed on lock contention.
+
+    Only errors the dialect's classifier reports as transient are retried, at most ``max_attempts``
+    runs in total. Waits grow exponentially from ``base_delay`` up to ``max_delay`` with full jitter
+    (a uniform draw between 0 and the cap), so writers that collided do not collide again in step.
+    """
+
+    def __init__(
+            self,
+            max_attempts: int = 3,
+            base_delay: float = 0.05,
+            max_delay: float = 1.0,
+            classifiers: Optional[dict[str, RetryClassifier]] = None,
+            sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+            rand: Callable[[], float] = random.random,
+    ) -> None:
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._classifiers = DEFAULT_CLASSIFIERS if classifiers is None else classifiers
+        self._sleep = sleep
+        self._rand = rand
+
+    def is_retryable(self, exc: BaseException, dialect_name: str) -> bool:
+        classifier = self._classifiers.get(dialect_name)
+        return isinstance(exc, DBAPIError) and classifier is not None and classifier(exc.orig)
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after the given (1-based) failed attempt."""
+        return self._rand() * min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+
+    async def backoff(self, attempt: int) -> None:
+        await self._sleep(self.delay(attempt))
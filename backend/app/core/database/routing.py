@@ -0,0 +1,43 @@
+import itertools
+import time
+from typing import Callable, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+
+class RoutingSessionMaker:
+    """Chooses the session maker of a transaction: replicas for reads, the primary for writes.
+
+    Replicas are used round-robin. Reads stay on the primary for ``stickiness`` seconds after the last
+    committed write, so a client reading right after its own write does not hit a lagging replica.
+    The window is tracked per process, which errs on the side of the primary.
+    """
+
+    def __init__(
+            self,
+            replica_session_makers: Sequence[async_sessionmaker] = (),
+            stickiness: float = 5.0,
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._replicas = list(replica_session_makers)
+        self._next_replica = itertools.cycle(self._replicas) if self._replicas else None
+        self._stickiness = stickiness
+        self._clock = clock
+        self._last_write_at: Optional[float] = None
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self._replicas)
+
+    def mark_write(self) -> None:
+        """Record a committed write, starting the read-your-writes window."""
+        self._last_write_at = self._clock()
+
+    def is_sticky(self) -> bool:
+        return self._last_write_at is not None and self._clock() - self._last_write_at < self._stickiness
+
+    def reader(self) -> Optional[async_sessionmaker]:
+        """The replica session maker for the next read, or None when reads must go to the primary."""
+        if self._next_replica is None or self.is_sticky():
+            return None
+        return next(self._next_replica)
@@ -0,0 +1,105 @@
+import asyncio
+from typing import Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import AppSettings
+from app.core.logger import logger
+
+
+def sqlite_pragmas(settings: AppSettings) -> list[str]:
+    """PRAGMA statements of the SQLite profile, in the order they run on every new connection."""
+    pragmas = []
+    if settings.DATABASE_SQLITE_JOURNAL_MODE:
+        # WAL lets readers run alongside the single writer instead of blocking behind it.
+        pragmas.append(f"PRAGMA journal_mode={settings.DATABASE_SQLITE_JOURNAL_MODE}")
+    if settings.DATABASE_SQLITE_SYNCHRONOUS:
+        # NORMAL is durable against application crashes in WAL mode; only a power loss may drop the last commits.
+        pragmas.append(f"PRAGMA synchronous={settings.DATABASE_SQLITE_SYNCHRONOUS}")
+    if settings.DATABASE_SQLITE_CACHE_SIZE_KIB:
+        pragmas.append(f"PRAGMA cache_size=-{settings.DATABASE_SQLITE_CACHE_SIZE_KIB}")  # negative: KiB, not pages
+    if settings.DATABASE_SQLITE_MMAP_SIZE_BYTES:
+        pragmas.append(f"PRAGMA mmap_size={settings.DATABASE_SQLITE_MMAP_SIZE_BYTES}")
+    if settings.DATABASE_SQLITE_TEMP_STORE:
+        pragmas.append(f"PRAGMA temp_store={settings.DATABASE_SQLITE_TEMP_STORE}")
+    pragmas.append(f"PRAGMA busy_timeout={settings.DATABASE_SQLITE_BUSY_TIMEOUT_MS}")
+    if settings.DATABASE_SQLITE_OPTIMIZE_INTERVAL_SECONDS:
+        # Recommended when opening a long-lived connection: analyze only what looks out of date, bounded.
+        pragmas.append("PRAGMA optimize=0x10002")
+    return pragmas
+
+
+def install_sqlite_profile(engine: AsyncEngine, settings: AppSettings) -> None:
+    """Run the profile's PRAGMAs on every connection the engine opens; a no-op for other dialects."""
+    if engine.dialect.name != "sqlite":
+        return
+    pragmas = sqlite_pragmas(settings)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _apply_profile(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def install_immediate_transactions(engine: AsyncEngine) -> None:
+    """Begin every transaction with ``BEGIN IMMEDIATE``, emitted by SQLAlchemy instead of the driver.
+
+    The driver's implicit BEGIN (only before the first DML) makes SAVEPOINTs unreliable: a RELEASE
+    can commit. IMMEDIATE also takes the write lock up front, so a writer never fails on upgrading
+    a read lock midway through its transaction.
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin_immediate(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def install_rollback_after_failed_commit(engine: AsyncEngine) -> None:
+    """Roll back a transaction left open by a failed COMMIT when its connection returns to the pool; SQLite only.
+
+    A COMMIT that fails with "database is locked" leaves the SQLite transaction open, while SQLAlchemy
+    considers it ended and skips the rollback on return. The next checkout would then run inside it:
+    a retried transaction would commit the failed attempt's writes too, and a ``BEGIN IMMEDIATE``
+    would fail with "cannot start a transaction within a transaction".
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine.sync_engine, "reset")
+    def _rollback_open_transaction(dbapi_connection, connection_record, reset_state):
+        driver_connection = getattr(dbapi_connection, "driver_connection", dbapi_connection)
+        if reset_state.transaction_was_reset and reset_state.asyncio_safe and driver_connection.in_transaction:
+            dbapi_connection.rollback()
+
+
+async def optimize(engine: AsyncEngine) -> None:
+    """Run ``PRAGMA optimize``, refreshing query planner statistics that have drifted."""
+    async with engine.connect() as conn:
+        await conn.execute(text("PRAGMA optimize"))
+
+
+async def optimize_periodically(engine: AsyncEngine, interval: float) -> None:
+    """Run ``optimize`` every ``interval`` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await optimize(engine)
+        except Exception as e:
+            logger.warning(f"PRAGMA optimize failed: {e}")
+
+
+def start_optimizer(engine: AsyncEngine, settings: AppSettings) -> Optional[asyncio.Task]:
+    """The periodic ``PRAGMA optimize`` task for a SQLite engine, or None when disabled or not SQLite."""
+    interval = settings.DATABASE_SQLITE_OPTIMIZE_INTERVAL_SECONDS
+    if engine.dialect.name != "sqlite" or not interval:
+        return None
+    return asyncio.create_task(optimize_periodically(engine, interval))
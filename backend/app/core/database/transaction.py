@@ -1,8 +1,37 @@
-from typing import Optional
+from contextvars import ContextVar, Token
+from typing import Any, Awaitable, Callable, Optional, TypeVar
 
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError, InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
 
-from app.core.database.engine import default_async_session_maker
+from app.base.exceptions.basic import ServiceUnavailableException
+from app.core.database.engine import default_async_session_maker, session_router, default_retry_policy, write_scheduler
+from app.core.database.retry import RetryPolicy
+from app.core.database.routing import RoutingSessionMaker
+from app.core.database.writer import WriteScheduler
+
+T = TypeVar("T")
+
+# Session of the innermost open UnitOfWork in the current task, joined by AsyncTransaction.
+_current_unit_of_work: ContextVar[Optional[AsyncSession]] = ContextVar("current_unit_of_work", default=None)
+
+# session.info key marking a session opened by a read-only AsyncTransaction.
+READ_ONLY_KEY = "read_only"
+
+# Per dialect, connection execution options that start the transaction as read-only. SQLite needs
+# none: its default BEGIN is already DEFERRED, taking no lock until the first read.
+READ_ONLY_EXECUTION_OPTIONS: dict[str, dict] = {
+    "postgresql": {"postgresql_readonly": True},
+}
+
+
+@event.listens_for(Session, "before_flush")
+def _reject_read_only_flush(session: Session, flush_context, instances) -> None:
+    # A read-only transaction is never committed, so a flushed write would be silently lost.
+    if session.info.get(READ_ONLY_KEY):
+        raise InvalidRequestError("Cannot flush changes in a read-only transaction.")
 
 
 class AsyncTransaction:
@@ -12,40 +41,184 @@ class AsyncTransaction:
     commits when no exception occurred or rolls back otherwise. The session is
     always closed at the end.
 
+    Read-only transactions are routed to a read replica when one is configured
+    (see ``RoutingSessionMaker``); other transactions use the primary and start
+    the read-your-writes window when they commit. A read-only transaction is
+    never committed: closing the session ends it with a rollback. It starts as a
+    read-only transaction where the dialect supports one (PostgreSQL), runs
+    without autoflush and refuses to flush.
+
+    Inside a ``UnitOfWork`` the transaction joins the unit's session instead
+    (unless an explicit ``session_maker`` is given): it neither commits, rolls
+    back nor closes, and leaves that to the unit of work.
+
     Example:
 
         async with AsyncTransaction() as session:
             await session.execute(...)
+
+        async with AsyncTransaction(read_only=True) as session:
+            await session.execute(select(...))
+
+        # Re-run on lock contention; the function must be safe to run more than once.
+        await AsyncTransaction.run(lambda session: session.execute(...), idempotent=True)
     """
 
     DEFAULT_SESSION_MAKER = default_async_session_maker
+    SESSION_ROUTER: RoutingSessionMaker = session_router
+    RETRY_POLICY: RetryPolicy = default_retry_policy
+    # Single-writer queue for the write transactions of ``run`` (SQLite, when enabled); None runs them on the pool.
+    WRITE_SCHEDULER: Optional[WriteScheduler] = write_scheduler
 
-    def __init__(self, session_maker: Optional[async_sessionmaker] = None) -> None:
+    def __init__(self, session_maker: Optional[async_sessionmaker] = None, read_only: bool = False) -> None:
         """Initialize AsyncTransaction with an async session maker.
 
         Args:
             session_maker: Optional async_sessionmaker to create sessions. If not
-                provided, uses ``app.core.database.async_session``.
+                provided, uses ``DEFAULT_SESSION_MAKER`` (the primary) or, for
+                read-only transactions, a replica chosen by ``SESSION_ROUTER``.
+            read_only: Whether the transaction only reads and may use a replica.
         """
+        self._read_only = read_only
+        self._may_join = session_maker is None
         self._session_maker: async_sessionmaker = (
-                session_maker or self.DEFAULT_SESSION_MAKER
+                session_maker
+                or (self.SESSION_ROUTER.reader() if read_only else None)
+                or self.DEFAULT_SESSION_MAKER
         )
         self._session: Optional[AsyncSession] = None
+        self._joined = False
+
+    @classmethod
+    async def run(
+            cls,
+            func: Callable[[AsyncSession], Awaitable[T]],
+            idempotent: bool = False,
+            retry_policy: Optional[RetryPolicy] = None,
+            **kwargs: Any,
+    ) -> T:
+        """Run ``func(session)`` in a transaction and return its result.
+
+        A transaction that fails on transient contention (see ``RetryPolicy``) is re-run from the
+        start with backoff when ``idempotent``. Otherwise, or once the attempts run out, the error
+        becomes a ``ServiceUnavailableException`` (503): nothing was committed and the client may
+        retry. A transaction that joined a ``UnitOfWork`` re-raises as is and leaves it to the unit.
+
+        With a ``WRITE_SCHEDULER``, write transactions that would open their own session on the
+        primary are queued to it instead; idempotent ones may share a commit with other queued ones.
+
+        Args:
+            func: Does the work; called once per attempt with a fresh session.
+            idempotent: Whether ``func`` is safe to re-run (no effects outside the transaction).
+            retry_policy: Overrides ``RETRY_POLICY``.
+            **kwargs: Passed to the constructor (``session_maker``, ``read_only``).
+        """
+        policy = retry_policy or cls.RETRY_POLICY
+        scheduler = cls._write_scheduler_for(**kwargs)
+        attempt = 1
+        while True:
+            transaction: Optional[AsyncTransaction] = None
+            try:
+                if scheduler is not None:
+                    result = await scheduler.submit(func, groupable=idempotent)
+                    cls.SESSION_ROUTER.mark_write()
+                    return result
+                transaction = cls(**kwargs)
+                async with transaction as session:
+                    return await func(session)
+            except DBAPIError as exc:
+                joined = transaction is not None and transaction._joined
+                dialect_name = scheduler.dialect_name if scheduler is not None else transaction._dialect_name()
+                if joined or not policy.is_retryable(exc, dialect_name):
+                    raise
+                if not idempotent or attempt >= policy.max_attempts:
+                    raise ServiceUnavailableException(
+                        "The database is busy, please try again.",
+                        log_message=f"Gave up after {attempt} attempt(s): {exc.orig}",
+                    ) from exc
+            await policy.backoff(attempt)
+            attempt += 1
+
+    @classmethod
+    def _write_scheduler_for(
+            cls,
+            session_maker: Optional[async_sessionmaker] = None,
+            read_only: bool = False,
+    ) -> Optional[WriteScheduler]:
+        if read_only or session_maker is not None or _current_unit_of_work.get() is not None:
+            return None
+        return cls.WRITE_SCHEDULER
+
+    def _dialect_name(self) -> str:
+        return self._session.bind.dialect.name if self._session is not None else ""
 
     async def __aenter__(self) -> AsyncSession:
-        """Create and return a new AsyncSession instance."""
+        """Return the enclosing unit of work's session, or create a new AsyncSession instance."""
+        if self._may_join:
+            outer = _current_unit_of_work.get()
+            if outer is not None:
+                self._joined = True
+                return outer
         self._session = self._session_maker()
+        if self._read_only:
+            await self._begin_read_only(self._session)
         return self._session
 
+    @staticmethod
+    async def _begin_read_only(session: AsyncSession) -> None:
+        session.autoflush = False
+        session.info[READ_ONLY_KEY] = True
+        options = READ_ONLY_EXECUTION_OPTIONS.get(session.bind.dialect.name)
+        if options:
+            await session.connection(execution_options=options)
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Commit or rollback based on exception, then close the session."""
         if self._session is None:
             return
 
         try:
-            if exc_type is None:
+            if self._read_only:
+                # Nothing to commit; close() rolls the transaction back as it releases the connection.
+                pass
+            elif exc_type is None:
                 await self._session.commit()
+                self.SESSION_ROUTER.mark_write()
             else:
                 await self._session.rollback()
         finally:
             await self._session.close()
+
+
+class UnitOfWork(AsyncTransaction):
+    """Transaction shared by every ``AsyncTransaction`` opened inside it in the same task.
+
+    Composed usecases (two usecases in one endpoint, a chain of agent tools) then run on one
+    session and connection and commit once, when the outermost unit of work exits. A nested
+    unit of work joins the outer one like any other transaction. The session must not be used
+    by concurrent tasks, so do not ``asyncio.gather`` usecases inside a unit of work.
+
+    Reads inside a unit of work use its (primary) session, which also sees its uncommitted writes.
+
+    Example:
+
+        async with UnitOfWork():
+            profile = await create_profile.execute(profile_in)
+            await create_vocabulary.execute(vocabulary_in, context={"parent_id": profile.id})
+    """
+
+    def __init__(self, session_maker: Optional[async_sessionmaker] = None) -> None:
+        super().__init__(session_maker)
+        self._token: Optional[Token] = None
+
+    async def __aenter__(self) -> AsyncSession:
+        session = await super().__aenter__()
+        if self._session is not None:
+            self._token = _current_unit_of_work.set(session)
+        return session
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._token is not None:
+            _current_unit_of_work.reset(self._token)
+            self._token = None
+        await super().__aexit__(exc_type, exc_val, exc_tb)
@@ -0,0 +1,129 @@
+import asyncio
+import contextvars
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+T = TypeVar("T")
+
+WriteFunc = Callable[[AsyncSession], Awaitable[Any]]
+
+
+class _WriteJob:
+    __slots__ = ("func", "future", "groupable", "context")
+
+    def __init__(self, func: WriteFunc, future: asyncio.Future, groupable: bool) -> None:
+        self.func = func
+        self.future = future
+        self.groupable = groupable
+        self.context = contextvars.copy_context()
+
+    async def __call__(self, session: AsyncSession) -> Any:
+        # In the submitter's context, so its request ID applies to the job's logs and statements.
+        return await asyncio.create_task(self.func(session), context=self.context)
+
+
+class WriteScheduler:
+    """Runs write transactions one at a time on a dedicated connection, group-committing queued ones.
+
+    SQLite allows a single writer; concurrent write transactions on pooled connections only wait
+    for each other's lock (busy_timeout) or fail. Funneling them through one queue makes them wait
+    in line instead, and lets jobs that queued up meanwhile share one transaction and one commit:
+
+    - Each grouped job runs in its own SAVEPOINT, so a job that raises is rolled back alone and
+      gets its exception; the others still commit.
+    - Only ``groupable`` jobs are grouped (idempotent ones: if the shared commit fails, every job
+      in the group fails and may simply be re-run). Other jobs get a transaction of their own.
+    - Submitters get their result once the commit succeeded.
+
+    The session maker must open sessions on a single connection that begins transactions itself
+    (see ``install_immediate_transactions``); SAVEPOINTs are unreliable with the driver's implicit
+    BEGIN. The worker task starts with the first job on the running loop.
+    """
+
+    def __init__(self, session_maker: async_sessionmaker, max_batch: int = 32) -> None:
+        self._session_maker = session_maker
+        self.max_batch = max(1, max_batch)
+        self._queue: Optional[asyncio.Queue[_WriteJob]] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.transactions = 0
+        self.jobs = 0
+
+    @property
+    def dialect_name(self) -> str:
+        return self._session_maker.kw["bind"].dialect.name
+
+    async def submit(self, func: Callable[[AsyncSession], Awaitable[T]], groupable: bool = False) -> T:
+        """Queue ``func(session)`` and return its result once its transaction committed."""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            # A fresh context: the worker serves every submitter, not the one that happened to start it.
+            self._worker = asyncio.create_task(self._run(), context=contextvars.Context())
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_WriteJob(func, future, groupable))
+        return await future
+
+    async def stop(self) -> None:
+        """Let the queued jobs finish, then stop the worker."""
+        if self._worker is None:
+            return
+        await self._queue.join()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    async def _run(self) -> None:
+        carried: Optional[_WriteJob] = None
+        while True:
+            batch = [carried or await self._queue.get()]
+            carried = None
+            while batch[0].groupable and len(batch) < self.max_batch and not self._queue.empty():
+                job = self._queue.get_nowait()
+                if not job.groupable:
+                    carried = job  # runs alone, next
+                    break
+                batch.append(job)
+            try:
+                await self._run_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _run_batch(self, batch: list[_WriteJob]) -> None:
+        # Submitters that were cancelled while queued no longer wait for a result; skip their work.
+        batch = [job for job in batch if not job.future.done()]
+        if not batch:
+            return
+        outcomes: list[tuple[_WriteJob, bool, Any]] = []
+        try:
+            async with self._session_maker() as session:
+                async with session.begin():
+                    if len(batch) == 1:
+                        outcomes.append((batch[0], True, await batch[0](session)))
+                    else:
+                        for job in batch:
+                            try:
+                                async with session.begin_nested():
+                                    outcomes.append((job, True, await job(session)))
+                            except Exception as e:
+                                outcomes.append((job, False, e))
+        except Exception as e:
+            # Nothing committed: the whole transaction failed, or the only job raised.
+            for job in batch:
+                if not job.future.done():
+                    job.future.set_exception(e)
+            return
+        finally:
+            self.transactions += 1
+            self.jobs += len(batch)
+
+        for job, ok, value in outcomes:
+            if job.future.done():
+                continue
+            if ok:
+                job.future.set_result(value)
+            else:
+                job.future.set_exception(value)
@@ -0,0 +1,52 @@
+from contextlib import ExitStack
+
+from fastapi import FastAPI
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.database.instrumentation import QUERY_COUNT_HEADER, QUERY_TIME_HEADER, QueryStats, track_queries
+from app.core.logger import get_request_id, logger
+
+
+class QueryStatsMiddleware:
+    """
+    Middleware to report the SQL statements run for each request.
+
+    Pure ASGI, so a streamed body (e.g. the NDJSON exports) stays part of its request: statements
+    are tracked until the last body chunk is sent, when the request's totals are logged. The response
+    headers leave before the body, so they only count the statements run until the response started.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        request_id = get_request_id()
+        if scope["type"] != "http" or request_id is None:
+            await self.app(scope, receive, send)
+            return
+
+        with ExitStack() as tracking:
+            stats = tracking.enter_context(track_queries(request_id))
+
+            async def send_with_stats(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers[QUERY_COUNT_HEADER] = str(stats.count)
+                    headers[QUERY_TIME_HEADER] = _milliseconds(stats)
+                await send(message)
+                if message["type"] == "http.response.body" and not message.get("more_body", False):
+                    # Done once the body is complete; work after it (background tasks) is not the request's.
+                    tracking.close()
+                    logger.debug(f"SQL: {stats.count} statement(s), {_milliseconds(stats)} ms")
+
+            await self.app(scope, receive, send_with_stats)
+
+
+def _milliseconds(stats: QueryStats) -> str:
+    return f"{stats.seconds * 1000:.2f}"
+
+
+def add_middleware(app: FastAPI):
+    """Add query stats middleware to FastAPI app; it must run inside the request ID middleware"""
+    app.add_middleware(QueryStatsMiddleware)
@@ -2,19 +2,22 @@ import uuid
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Body, status
+from fastapi.responses import StreamingResponse
 
 from app.base.deps.params.page import PaginationParam
 from app.base.exceptions.basic import NotFoundException
+from app.base.responses import ndjson_response, NDJSON_MEDIA_TYPE
 from app.base.schemas.paginated import PaginatedList
+from app.features.feedback.models import FeedbackLogModel
 from app.features.feedback.schemas import FeedbackRead, FeedbackUpdate, FeedbackCreate
 from app.features.feedback.usecases.crud import (
-    CreateFeedbackUseCase, GetMultiFeedbackUseCase, GetFeedbackUseCase,
+    CreateFeedbackUseCase, GetMultiFeedbackUseCase, GetFeedbackUseCase, StreamFeedbackUseCase,
     UpdateFeedbackUseCase, DeleteFeedbackUseCase
 )
 
 router = APIRouter(
-    prefix="/user-profiles/{user_profile_id}/vocabularies",
-    tags=["Vocabularies"],
+    prefix="/user-profiles/{user_profile_id}/feedbacks",
+    tags=["Feedbacks"],
 )
 
 
@@ -29,7 +32,7 @@ async def create_feedback(
 
 
 @router.get("", response_model=PaginatedList[FeedbackRead])
-async def get_vocabularies(
+async def get_feedbacks(
         use_case: Annotated[GetMultiFeedbackUseCase, Depends()],
         user_profile_id: uuid.UUID,
         pagination: PaginationParam,
@@ -38,6 +41,17 @@ async def get_vocabularies(
     return await use_case.execute(**pagination, context=context)
 
 
+@router.get("/export", response_class=StreamingResponse,
+            responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}})
+async def export_feedbacks(
+        use_case: Annotated[StreamFeedbackUseCase, Depends()],
+        user_profile_id: uuid.UUID,
+):
+    context = {"parent_id": user_profile_id}
+    rows = use_case.execute(order_by=[FeedbackLogModel.timestamp.asc(), FeedbackLogModel.id.asc()], context=context)
+    return await ndjson_response(rows, FeedbackRead)
+
+
 @router.get("/{feedback_id}", response_model=FeedbackRead)
 async def get_feedback(
         use_case: Annotated[GetFeedbackUseCase, Depends()],
@@ -1,7 +1,8 @@
 import datetime
+import uuid
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import String, Text, DateTime
+from sqlalchemy import String, Text, DateTime, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.base.models.mixin import Base, UUIDMixin
@@ -21,7 +22,7 @@ class FeedbackLogModel(Base, UUIDMixin):
     timestamp: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True), default=datetime.datetime.now
     )
-    profile_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    profile_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey("user_profile.id"), nullable=True)
 
     # Relationships
     profile: Mapped["UserProfileModel"] = relationship(back_populates="feedback_logs")
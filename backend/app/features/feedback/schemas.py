@@ -1,8 +1,9 @@
+import uuid
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
-from app.base.schemas.mixin import UUIDSchemaMixin, TimestampSchemaMixin
+from app.base.schemas.mixin import UUIDSchemaMixin
 
 
 class FeedbackCreate(BaseModel):
@@ -22,12 +23,13 @@ class FeedbackUpdate(BaseModel):
     context: str | None = None
 
 
-class FeedbackRead(UUIDSchemaMixin, TimestampSchemaMixin, BaseModel):
+class FeedbackRead(UUIDSchemaMixin, BaseModel):
     """Schema for reading a feedback log."""
 
     feedback_type: str
     content: str
     context: str | None = None
+    timestamp: datetime
+    profile_id: uuid.UUID | None = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
@@ -5,7 +5,6 @@ from app.base.services.base import (
     BaseCreateServiceMixin, BaseGetServiceMixin, BaseGetMultiServiceMixin,
     BaseUpdateServiceMixin, BaseDeleteServiceMixin
 )
-from app.base.services.exists_check_hook import ExistsCheckHooksMixin
 from app.base.services.nested_resource_hook import NestedResourceHooksMixin, NestedResourceContextKwargs
 from app.features.feedback.models import FeedbackLogModel
 from app.features.feedback.repos import FeedbackRepository
@@ -19,7 +18,6 @@ class FeedbackContextKwargs(NestedResourceContextKwargs):
 
 class FeedbackService(
     NestedResourceHooksMixin,
-    ExistsCheckHooksMixin,
     BaseCreateServiceMixin[FeedbackRepository, FeedbackLogModel, FeedbackCreate, FeedbackContextKwargs],
     BaseGetMultiServiceMixin[FeedbackRepository, FeedbackLogModel, FeedbackContextKwargs],
     BaseGetServiceMixin[FeedbackRepository, FeedbackLogModel, FeedbackContextKwargs],
@@ -27,7 +25,8 @@ class FeedbackService(
     BaseDeleteServiceMixin[FeedbackRepository, FeedbackLogModel, FeedbackContextKwargs],
 ):
     context_model = FeedbackContextKwargs
-    fk_name = "user_profile_id"
+    fk_name = "profile_id"
+    fuse_ownership_checks = True
 
     def __init__(
             self,
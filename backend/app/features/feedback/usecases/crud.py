@@ -7,6 +7,7 @@ from app.features.feedback.services import FeedbackService, FeedbackContextKwarg
 from app.base.usecases.crud import (
     BaseGetUseCase,
     BaseGetMultiUseCase,
+    BaseStreamUseCase,
     BaseCreateUseCase,
     BaseUpdateUseCase,
     BaseDeleteUseCase
@@ -14,25 +15,40 @@ from app.base.usecases.crud import (
 
 
 class GetFeedbackUseCase(BaseGetUseCase[FeedbackService, FeedbackLogModel, FeedbackContextKwargs]):
+    idempotent = True
+
     def __init__(self, service: Annotated[FeedbackService, Depends()]) -> None:
         super().__init__(service)
 
 
 class GetMultiFeedbackUseCase(BaseGetMultiUseCase[FeedbackService, FeedbackLogModel, FeedbackContextKwargs]):
+    idempotent = True
+
+    def __init__(self, service: Annotated[FeedbackService, Depends()]) -> None:
+        super().__init__(service)
+
+
+class StreamFeedbackUseCase(BaseStreamUseCase[FeedbackService, FeedbackLogModel, FeedbackContextKwargs]):
     def __init__(self, service: Annotated[FeedbackService, Depends()]) -> None:
         super().__init__(service)
 
 
 class CreateFeedbackUseCase(BaseCreateUseCase[FeedbackService, FeedbackLogModel, FeedbackCreate, FeedbackContextKwargs]):
+    idempotent = True
+
     def __init__(self, service: Annotated[FeedbackService, Depends()]) -> None:
         super().__init__(service)
 
 
 class UpdateFeedbackUseCase(BaseUpdateUseCase[FeedbackService, FeedbackLogModel, FeedbackUpdate, FeedbackContextKwargs]):
+    idempotent = True
+
     def __init__(self, service: Annotated[FeedbackService, Depends()]) -> None:
         super().__init__(service)
 
 
 class DeleteFeedbackUseCase(BaseDeleteUseCase[FeedbackService, FeedbackLogModel, FeedbackContextKwargs]):
+    idempotent = True
+
     def __init__(self, service: Annotated[FeedbackService, Depends()]) -> None:
         super().__init__(service)
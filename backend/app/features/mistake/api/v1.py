@@ -2,19 +2,25 @@ import uuid
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Body, status
+from fastapi.responses import StreamingResponse
 
+from app.base.deps.params.ids import IdsParam
 from app.base.deps.params.page import PaginationParam
 from app.base.exceptions.basic import NotFoundException
+from app.base.responses import ndjson_response, NDJSON_MEDIA_TYPE
 from app.base.schemas.paginated import PaginatedList
-from app.features.mistake.schemas import MistakeRead, MistakeUpdate, MistakeCreate
+from app.core.database.deps import UnitOfWorkDep
+from app.features.mistake.models import MistakeModel
+from app.features.mistake.schemas import MistakeRead, MistakeUpdate, MistakeCreate, MistakeWithVocabularyCreate
 from app.features.mistake.usecases.crud import (
-    CreateMistakeUseCase, GetMultiMistakeUseCase, GetMistakeUseCase,
+    CreateMistakeUseCase, GetManyMistakeUseCase, GetMultiMistakeUseCase, GetMistakeUseCase, StreamMistakeUseCase,
     UpdateMistakeUseCase, DeleteMistakeUseCase
 )
+from app.features.vocabulary.usecases.crud import CreateVocabularyUseCase
 
 router = APIRouter(
-    prefix="/user-profiles/{user_profile_id}/vocabularies",
-    tags=["Vocabularies"],
+    prefix="/user-profiles/{user_profile_id}/mistakes",
+    tags=["Mistakes"],
 )
 
 
@@ -28,16 +34,47 @@ async def create_mistake(
     return await use_case.execute(mistake_in, context=context)
 
 
+@router.post("/with-vocabulary", status_code=status.HTTP_201_CREATED, response_model=MistakeRead)
+async def create_mistake_with_vocabulary(
+        _: UnitOfWorkDep,
+        create_vocabulary: Annotated[CreateVocabularyUseCase, Depends()],
+        create_mistake: Annotated[CreateMistakeUseCase, Depends()],
+        user_profile_id: uuid.UUID,
+        obj_in: MistakeWithVocabularyCreate = Body(),
+):
+    """Record a mistake about a word not in the vocabulary yet; both are created in one transaction, or neither."""
+    context = {"parent_id": user_profile_id}
+    vocabulary = await create_vocabulary.execute(obj_in.vocabulary, context=context)
+    mistake_in = obj_in.mistake.model_copy(update={"vocabulary_id": vocabulary.id})
+    return await create_mistake.execute(mistake_in, context=context)
+
+
 @router.get("", response_model=PaginatedList[MistakeRead])
-async def get_vocabularies(
+async def get_mistakes(
         use_case: Annotated[GetMultiMistakeUseCase, Depends()],
+        get_many_use_case: Annotated[GetManyMistakeUseCase, Depends()],
         user_profile_id: uuid.UUID,
         pagination: PaginationParam,
+        ids: IdsParam,
 ):
     context = {"parent_id": user_profile_id}
+    if ids is not None:
+        items = await get_many_use_case.execute(ids, context=context)
+        return PaginatedList.from_items(items, limit=len(ids))
     return await use_case.execute(**pagination, context=context)
 
 
+@router.get("/export", response_class=StreamingResponse,
+            responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}})
+async def export_mistakes(
+        use_case: Annotated[StreamMistakeUseCase, Depends()],
+        user_profile_id: uuid.UUID,
+):
+    context = {"parent_id": user_profile_id}
+    rows = use_case.execute(order_by=[MistakeModel.timestamp.asc(), MistakeModel.id.asc()], context=context)
+    return await ndjson_response(rows, MistakeRead)
+
+
 @router.get("/{mistake_id}", response_model=MistakeRead)
 async def get_mistake(
         use_case: Annotated[GetMistakeUseCase, Depends()],
@@ -1,9 +1,10 @@
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
-from app.base.schemas.mixin import UUIDSchemaMixin, TimestampSchemaMixin
+from app.base.schemas.mixin import UUIDSchemaMixin
+from app.features.vocabulary.schemas import VocabularyCreate
 
 
 class MistakeCreate(BaseModel):
@@ -17,6 +18,13 @@ class MistakeCreate(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now)
 
 
+class MistakeWithVocabularyCreate(BaseModel):
+    """Schema for recording a mistake together with the new vocabulary item it is about."""
+
+    mistake: MistakeCreate
+    vocabulary: VocabularyCreate
+
+
 class MistakeUpdate(BaseModel):
     """Schema for updating a mistake record."""
 
@@ -27,12 +35,15 @@ class MistakeUpdate(BaseModel):
     vocabulary_id: uuid.UUID | None = None
 
 
-class MistakeRead(UUIDSchemaMixin, TimestampSchemaMixin, BaseModel):
+class MistakeRead(UUIDSchemaMixin, BaseModel):
     """Schema for reading a mistake record."""
 
-    feedback_type: str
-    content: str
-    context: str | None = None
+    original_sentence: str
+    corrected_sentence: str
+    error_type: str
+    explanation: str | None = None
+    vocabulary_id: uuid.UUID | None = None
+    timestamp: datetime
+    user_profile_id: uuid.UUID
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
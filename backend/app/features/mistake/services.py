@@ -5,7 +5,6 @@ from app.base.services.base import (
     BaseCreateServiceMixin, BaseGetServiceMixin, BaseGetMultiServiceMixin,
     BaseUpdateServiceMixin, BaseDeleteServiceMixin
 )
-from app.base.services.exists_check_hook import ExistsCheckHooksMixin
 from app.base.services.nested_resource_hook import NestedResourceHooksMixin, NestedResourceContextKwargs
 from app.features.mistake.models import MistakeModel
 from app.features.mistake.repos import MistakeRepository
@@ -19,7 +18,6 @@ class MistakeContextKwargs(NestedResourceContextKwargs):
 
 class MistakeService(
     NestedResourceHooksMixin,
-    ExistsCheckHooksMixin,
     BaseCreateServiceMixin[MistakeRepository, MistakeModel, MistakeCreate, MistakeContextKwargs],
     BaseGetMultiServiceMixin[MistakeRepository, MistakeModel, MistakeContextKwargs],
     BaseGetServiceMixin[MistakeRepository, MistakeModel, MistakeContextKwargs],
@@ -28,6 +26,7 @@ class MistakeService(
 ):
     context_model = MistakeContextKwargs
     fk_name = "user_profile_id"
+    fuse_ownership_checks = True
 
     def __init__(
             self,
@@ -6,7 +6,9 @@ from app.features.mistake.schemas import MistakeCreate, MistakeUpdate
 from app.features.mistake.services import MistakeService, MistakeContextKwargs
 from app.base.usecases.crud import (
     BaseGetUseCase,
+    BaseGetManyUseCase,
     BaseGetMultiUseCase,
+    BaseStreamUseCase,
     BaseCreateUseCase,
     BaseUpdateUseCase,
     BaseDeleteUseCase
@@ -14,25 +16,47 @@ from app.base.usecases.crud import (
 
 
 class GetMistakeUseCase(BaseGetUseCase[MistakeService, MistakeModel, MistakeContextKwargs]):
+    idempotent = True
+
+    def __init__(self, service: Annotated[MistakeService, Depends()]) -> None:
+        super().__init__(service)
+
+
+class GetManyMistakeUseCase(BaseGetManyUseCase[MistakeService, MistakeModel, MistakeContextKwargs]):
+    idempotent = True
+
     def __init__(self, service: Annotated[MistakeService, Depends()]) -> None:
         super().__init__(service)
 
 
 class GetMultiMistakeUseCase(BaseGetMultiUseCase[MistakeService, MistakeModel, MistakeContextKwargs]):
+    idempotent = True
+
+    def __init__(self, service: Annotated[MistakeService, Depends()]) -> None:
+        super().__init__(service)
+
+
+class StreamMistakeUseCase(BaseStreamUseCase[MistakeService, MistakeModel, MistakeContextKwargs]):
     def __init__(self, service: Annotated[MistakeService, Depends()]) -> None:
         super().__init__(service)
 
 
 class CreateMistakeUseCase(BaseCreateUseCase[MistakeService, MistakeModel, MistakeCreate, MistakeContextKwargs]):
+    idempotent = True
+
     def __init__(self, service: Annotated[MistakeService, Depends()]) -> None:
         super().__init__(service)
 
 
 class UpdateMistakeUseCase(BaseUpdateUseCase[MistakeService, MistakeModel, MistakeUpdate, MistakeContextKwargs]):
+    idempotent = True
+
     def __init__(self, service: Annotated[MistakeService, Depends()]) -> None:
         super().__init__(service)
 
 
 class DeleteMistakeUseCase(BaseDeleteUseCase[MistakeService, MistakeModel, MistakeContextKwargs]):
+    idempotent = True
+
     def __init__(self, service: Annotated[MistakeService, Depends()]) -> None:
         super().__init__(service)
@@ -11,6 +11,7 @@ from app.base.services.base import (
     BaseDeleteServiceMixin,
     BaseContextKwargs,
 )
+from app.base.services.cached_read_hook import CachedReadHooksMixin
 from app.features.user_profile.models import UserProfileModel
 from app.features.user_profile.repos import UserProfileRepository
 from app.features.user_profile.schemas import UserProfileCreate, UserProfileUpdate
@@ -21,6 +22,7 @@ class UserProfileContextKwargs(BaseContextKwargs):
 
 
 class UserProfileService(
+    CachedReadHooksMixin,
     BaseGetServiceMixin[UserProfileModel, UserProfileRepository, UserProfileContextKwargs],
     BaseGetMultiServiceMixin[UserProfileModel, UserProfileRepository, UserProfileContextKwargs],
     BaseCreateServiceMixin[UserProfileModel, UserProfileRepository, UserProfileCreate, UserProfileContextKwargs],
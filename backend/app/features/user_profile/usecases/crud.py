@@ -10,43 +10,52 @@ from app.base.usecases.crud import (
     BaseUpdateUseCase,
     BaseDeleteUseCase,
 )
-from app.core.database.transaction import AsyncTransaction
 from app.features.user_profile.models import UserProfileModel
 from app.features.user_profile.schemas import UserProfileCreate, UserProfileUpdate
 from app.features.user_profile.services import UserProfileService, UserProfileContextKwargs
 
 
 class GetUserProfileUseCase(BaseGetUseCase[UserProfileService, UserProfileModel, UserProfileContextKwargs]):
+    idempotent = True
+
     def __init__(self, service: Annotated[UserProfileService, Depends()]):
         super().__init__(service)
 
 
 class GetUserProfileListUseCase(BaseGetMultiUseCase[UserProfileService, UserProfileModel, UserProfileContextKwargs]):
+    idempotent = True
+
     def __init__(self, service: Annotated[UserProfileService, Depends()]):
         super().__init__(service)
 
 
 class CreateUserProfileUseCase(BaseCreateUseCase[UserProfileService, UserProfileModel, UserProfileCreate, UserProfileContextKwargs]):
+    idempotent = True
+
     def __init__(self, service: Annotated[UserProfileService, Depends()]):
         super().__init__(service)
 
 
 class UpdateUserProfileUseCase(BaseUpdateUseCase[UserProfileService, UserProfileModel, UserProfileUpdate, UserProfileContextKwargs]):
+    idempotent = True
+
     def __init__(self, service: Annotated[UserProfileService, Depends()]):
         super().__init__(service)
 
 
 class DeleteUserProfileUseCase(BaseDeleteUseCase[UserProfileService, UserProfileModel, UserProfileContextKwargs]):
+    idempotent = True
+
     def __init__(self, service: Annotated[UserProfileService, Depends()]):
         super().__init__(service)
 
 
 class GetOrCreateUserProfileUseCase(BaseUseCase):
     """Use case for getting or creating the user profile."""
+    idempotent = True
 
     def __init__(self, service: Annotated[UserProfileService, Depends()]):
         self.service = service
 
     async def execute(self) -> UserProfileModel:
-        async with AsyncTransaction() as session:
-            return await self.service.get_or_create(session)
+        return await self._run_in_transaction(self.service.get_or_create)
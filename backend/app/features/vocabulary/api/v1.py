@@ -1,15 +1,20 @@
 import uuid
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, Body, status
+from fastapi.responses import StreamingResponse
 
-from app.base.deps.params.page import PaginationParam
-from app.base.exceptions.basic import NotFoundException
+from app.base.deps.params.fields import FieldsParam
+from app.base.deps.params.ids import IdsParam, MAX_IDS
+from app.base.deps.params.page import CursorPaginationParam
+from app.base.exceptions.basic import BadRequestException, NotFoundException
+from app.base.responses import ndjson_response, NDJSON_MEDIA_TYPE
 from app.base.schemas.paginated import PaginatedList
-from app.features.vocabulary.schemas import VocabularyRead, VocabularyUpdate, VocabularyCreate
+from app.features.vocabulary.models import VocabularyModel
+from app.features.vocabulary.schemas import VocabularyRead, VocabularyUpdate, VocabularyCreate, VocabularyPartialRead
 from app.features.vocabulary.usecases.crud import (
-    CreateVocabularyUseCase, GetMultiVocabularyUseCase, GetVocabularyUseCase,
-    UpdateVocabularyUseCase, DeleteVocabularyUseCase
+    CreateVocabularyUseCase, GetManyVocabularyUseCase, GetMultiVocabularyUseCase, GetVocabularyUseCase,
+    StreamVocabularyUseCase, UpdateVocabularyUseCase, DeleteVocabularyUseCase, UpdateManyVocabularyUseCase
 )
 
 router = APIRouter(
@@ -28,27 +33,61 @@ async def create_vocabulary(
     return await use_case.execute(vocabulary_in, context=context)
 
 
-@router.get("", response_model=PaginatedList[VocabularyRead])
+@router.get("", response_model=PaginatedList[VocabularyPartialRead], response_model_exclude_unset=True)
 async def get_vocabularies(
         use_case: Annotated[GetMultiVocabularyUseCase, Depends()],
+        get_many_use_case: Annotated[GetManyVocabularyUseCase, Depends()],
         user_profile_id: uuid.UUID,
-        pagination: PaginationParam,
+        pagination: CursorPaginationParam,
+        fields: FieldsParam,
+        ids: IdsParam,
 ):
     context = {"parent_id": user_profile_id}
-    return await use_case.execute(**pagination, context=context)
+    if ids is not None:
+        if pagination["cursor"] is not None or pagination["offset"] or pagination["count_strategy"] is not None:
+            raise BadRequestException("ids replaces pagination; it cannot be combined with cursor, offset or count.")
+        items = await get_many_use_case.execute(ids, context=context, fields=fields)
+        page = PaginatedList.from_items(items, limit=len(ids))
+    else:
+        page = await use_case.execute(**pagination, context=context, fields=fields)
+    return page.model_copy(update={
+        "items": [VocabularyPartialRead.model_validate_fields(item, fields) for item in page.items],
+    })
 
 
-@router.get("/{vocabulary_id}", response_model=VocabularyRead)
+@router.patch("", response_model=list[Optional[VocabularyRead]])
+async def update_vocabularies(
+        use_case: Annotated[UpdateManyVocabularyUseCase, Depends()],
+        user_profile_id: uuid.UUID,
+        vocabularies_in: Annotated[dict[uuid.UUID, VocabularyUpdate], Body(max_length=MAX_IDS)],
+):
+    context = {"parent_id": user_profile_id}
+    return await use_case.execute(vocabularies_in, context=context)
+
+
+@router.get("/export", response_class=StreamingResponse,
+            responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}})
+async def export_vocabularies(
+        use_case: Annotated[StreamVocabularyUseCase, Depends()],
+        user_profile_id: uuid.UUID,
+):
+    context = {"parent_id": user_profile_id}
+    rows = use_case.execute(order_by=[VocabularyModel.created_at.asc(), VocabularyModel.id.asc()], context=context)
+    return await ndjson_response(rows, VocabularyRead)
+
+
+@router.get("/{vocabulary_id}", response_model=VocabularyPartialRead, response_model_exclude_unset=True)
 async def get_vocabulary(
         use_case: Annotated[GetVocabularyUseCase, Depends()],
         user_profile_id: uuid.UUID,
         vocabulary_id: uuid.UUID,
+        fields: FieldsParam,
 ):
     context = {"parent_id": user_profile_id}
-    vocabulary = await use_case.execute(vocabulary_id, context=context)
+    vocabulary = await use_case.execute(vocabulary_id, context=context, fields=fields)
     if not vocabulary:
         raise NotFoundException()
-    return vocabulary
+    return VocabularyPartialRead.model_validate_fields(vocabulary, fields)
 
 
 @router.put("/{vocabulary_id}", response_model=VocabularyRead)
@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from typing import Sequence
 
-from sqlalchemy import select, or_
+from sqlalchemy import select, or_, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.base.repos.base import BaseRepository
@@ -24,18 +24,18 @@ class VocabularyRepository(BaseRepository[VocabularyModel, VocabularyCreate, Voc
     async def get_due_for_review(self, session: AsyncSession, limit: int = 20) -> Sequence[VocabularyModel]:
         """Get vocabulary items due for review."""
         now = datetime.now(timezone.utc)
-        stmt = (
+        stmt = self._cached_statement("due_for_review", lambda: (
             select(self.model)
             .where(
                 or_(
                     self.model.next_review_at.is_(None),
-                    self.model.next_review_at <= now
+                    self.model.next_review_at <= bindparam("now")
                 )
             )
             .order_by(self.model.next_review_at.asc().nullsfirst())
-            .limit(limit)
-        )
-        result = await session.execute(stmt)
+            .limit(bindparam("limit"))
+        ))
+        result = await session.execute(stmt, {"now": now, "limit": limit})
         return result.scalars().all()
 
     async def search(self, session: AsyncSession, query: str) -> Sequence[VocabularyModel]:
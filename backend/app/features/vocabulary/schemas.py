@@ -4,6 +4,7 @@ import uuid
 
 from pydantic import BaseModel, Field, ConfigDict
 from app.base.schemas.mixin import UUIDSchemaMixin, TimestampSchemaMixin
+from app.base.schemas.partial import partial_schema
 
 
 class VocabularyCreate(BaseModel):
@@ -56,3 +57,5 @@ class VocabularyRead(UUIDSchemaMixin, TimestampSchemaMixin, BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+VocabularyPartialRead = partial_schema(VocabularyRead, "VocabularyPartialRead")
+"""Schema for reading a sparse fieldset (``?fields=``) of a vocabulary item."""
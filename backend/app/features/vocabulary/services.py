@@ -1,12 +1,14 @@
-from typing import Annotated
+from typing import Annotated, AsyncIterator, Tuple, Union
 from fastapi import Depends
+from sqlalchemy.sql.expression import ColumnElement
 
 from app.base.services.base import (
     BaseCreateServiceMixin, BaseGetServiceMixin, BaseGetMultiServiceMixin,
     BaseUpdateServiceMixin, BaseDeleteServiceMixin
 )
-from app.base.services.exists_check_hook import ExistsCheckHooksMixin
+from app.base.services.cached_read_hook import CachedReadHooksMixin, default_read_cache
 from app.base.services.nested_resource_hook import NestedResourceHooksMixin, NestedResourceContextKwargs
+from app.base.services.unique_constraints_hook import UniqueConstraintHooksMixin
 from app.features.vocabulary.models import VocabularyModel
 from app.features.vocabulary.repos import VocabularyRepository
 from app.features.vocabulary.schemas import VocabularyCreate, VocabularyUpdate
@@ -19,7 +21,8 @@ class VocabularyContextKwargs(NestedResourceContextKwargs):
 
 class VocabularyService(
     NestedResourceHooksMixin,
-    ExistsCheckHooksMixin,
+    CachedReadHooksMixin,
+    UniqueConstraintHooksMixin,
     BaseCreateServiceMixin[VocabularyRepository, VocabularyModel, VocabularyCreate, VocabularyContextKwargs],
     BaseGetMultiServiceMixin[VocabularyRepository, VocabularyModel, VocabularyContextKwargs],
     BaseGetServiceMixin[VocabularyRepository, VocabularyModel, VocabularyContextKwargs],
@@ -28,6 +31,11 @@ class VocabularyService(
 ):
     context_model = VocabularyContextKwargs
     fk_name = "user_profile_id"
+    # get/update/delete carry "user_profile_id = ?" in their own statement; no separate ownership SELECT.
+    fuse_ownership_checks = True
+    parent_exists_cache = default_read_cache
+    # vocabulary.item has a UNIQUE index, so let the database enforce it.
+    optimistic_unique_checks = True
 
     def __init__(
             self,
@@ -44,3 +52,11 @@ class VocabularyService(
     @property
     def parent_repo(self) -> UserProfileRepository:
         return self._parent_repo
+
+    async def _unique_constraints(
+            self,
+            obj_data: Union[VocabularyCreate, VocabularyUpdate],
+            context: VocabularyContextKwargs,
+    ) -> AsyncIterator[Tuple[ColumnElement[bool], str]]:
+        if obj_data.item is not None:
+            yield VocabularyModel.item == obj_data.item, "Vocabulary item already exists."
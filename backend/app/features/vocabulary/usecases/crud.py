@@ -6,33 +6,81 @@ from app.features.vocabulary.schemas import VocabularyCreate, VocabularyUpdate
 from app.features.vocabulary.services import VocabularyService, VocabularyContextKwargs
 from app.base.usecases.crud import (
     BaseGetUseCase,
+    BaseGetManyUseCase,
     BaseGetMultiUseCase,
+    BaseStreamUseCase,
     BaseCreateUseCase,
     BaseUpdateUseCase,
-    BaseDeleteUseCase
+    BaseDeleteUseCase,
+    BaseCreateManyUseCase,
+    BaseUpdateManyUseCase,
+    BaseDeleteManyUseCase,
 )
 
 
 class GetVocabularyUseCase(BaseGetUseCase[VocabularyService, VocabularyModel, VocabularyContextKwargs]):
+    idempotent = True
+
+    def __init__(self, service: Annotated[VocabularyService, Depends()]) -> None:
+        super().__init__(service)
+
+
+class GetManyVocabularyUseCase(BaseGetManyUseCase[VocabularyService, VocabularyModel, VocabularyContextKwargs]):
+    idempotent = True
+
     def __init__(self, service: Annotated[VocabularyService, Depends()]) -> None:
         super().__init__(service)
 
 
 class GetMultiVocabularyUseCase(BaseGetMultiUseCase[VocabularyService, VocabularyModel, VocabularyContextKwargs]):
+    idempotent = True
+
+    def __init__(self, service: Annotated[VocabularyService, Depends()]) -> None:
+        super().__init__(service)
+
+
+class StreamVocabularyUseCase(BaseStreamUseCase[VocabularyService, VocabularyModel, VocabularyContextKwargs]):
     def __init__(self, service: Annotated[VocabularyService, Depends()]) -> None:
         super().__init__(service)
 
 
 class CreateVocabularyUseCase(BaseCreateUseCase[VocabularyService, VocabularyModel, VocabularyCreate, VocabularyContextKwargs]):
+    idempotent = True
+
     def __init__(self, service: Annotated[VocabularyService, Depends()]) -> None:
         super().__init__(service)
 
 
 class UpdateVocabularyUseCase(BaseUpdateUseCase[VocabularyService, VocabularyModel, VocabularyUpdate, VocabularyContextKwargs]):
+    idempotent = True
+
     def __init__(self, service: Annotated[VocabularyService, Depends()]) -> None:
         super().__init__(service)
 
 
 class DeleteVocabularyUseCase(BaseDeleteUseCase[VocabularyService, VocabularyModel, VocabularyContextKwargs]):
+    idempotent = True
+
+    def __init__(self, service: Annotated[VocabularyService, Depends()]) -> None:
+        super().__init__(service)
+
+
+class CreateManyVocabularyUseCase(BaseCreateManyUseCase[VocabularyService, VocabularyModel, VocabularyCreate, VocabularyContextKwargs]):
+    idempotent = True
+
+    def __init__(self, service: Annotated[VocabularyService, Depends()]) -> None:
+        super().__init__(service)
+
+
+class UpdateManyVocabularyUseCase(BaseUpdateManyUseCase[VocabularyService, VocabularyModel, VocabularyUpdate, VocabularyContextKwargs]):
+    idempotent = True
+
+    def __init__(self, service: Annotated[VocabularyService, Depends()]) -> None:
+        super().__init__(service)
+
+
+class DeleteManyVocabularyUseCase(BaseDeleteManyUseCase[VocabularyService, VocabularyModel, VocabularyContextKwargs]):
+    idempotent = True
+
     def __init__(self, service: Annotated[VocabularyService, Depends()]) -> None:
         super().__init__(service)
@@ -4,19 +4,24 @@ from fastapi import FastAPI
 from starlette.responses import RedirectResponse
 from app.router import router
 from app.base.exceptions.handler import set_exception_handler
+from app.core.database.engine import start_engines, dispose_engines
 from app.core.logger import logger
 from app.core.middlewares import (
     cors_middleware,
 )
-from app.core.middlewares import request_id_middleware
+from app.core.middlewares import request_id_middleware, query_stats_middleware
 
 
 def get_lifespan():
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         logger.info("Starting app lifespan")
-        yield
-        logger.info("End of app lifespan")
+        await start_engines()
+        try:
+            yield
+        finally:
+            await dispose_engines()
+            logger.info("End of app lifespan")
 
     return lifespan
 
@@ -38,6 +43,8 @@ def create_app():
     async def root():
         return RedirectResponse(url="/docs")
 
+    # Middlewares added later wrap the earlier ones: query stats need the request ID set first.
+    query_stats_middleware.add_middleware(app)
     request_id_middleware.add_middleware(app)
     cors_middleware.add_middleware(app)
 
@@ -1,7 +1,15 @@
 from starlette.responses import Response
 
 from fastapi import APIRouter
+from app.base.deps.debug import DebugAccess
+from app.base.exceptions.basic import NotFoundException
+from app.core.database.engine import async_engine, replica_async_engines, plan_collector
+from app.core.database.explain import format_report
+from app.core.database.pool import pool_status
 from app.features.user_profile.api import v1_user_profile_router
+from app.features.vocabulary.api import v1_vocabulary_router
+from app.features.mistake.api import v1_mistake_router
+from app.features.feedback.api import v1_feedback_router
 
 router = APIRouter(prefix="/api")
 v1_router = APIRouter(prefix="/v1")
@@ -12,7 +20,31 @@ async def health():
     return Response(status_code=204)
 
 
+@router.get("/health/db-pool", dependencies=[DebugAccess])
+async def db_pool_health():
+    """Live connection pool statistics of the primary and replica engines, for sizing workers (debug token)."""
+    return {
+        "primary": pool_status(async_engine),
+        "replicas": [pool_status(engine) for engine in replica_async_engines],
+    }
+
+
+@router.get("/health/query-plans", dependencies=[DebugAccess])
+async def query_plans_health():
+    """Plans of the statement shapes run on the primary so far, with full scans and index advice (debug token)."""
+    if plan_collector is None:
+        raise NotFoundException("Query plan capture is disabled; set DATABASE_EXPLAIN_PLANS to enable it.")
+    plans = await plan_collector.explain()
+    return {
+        "report": format_report(plans),
+        "plans": plans,
+    }
+
+
 # Feature routers
 v1_router.include_router(v1_user_profile_router)
+v1_router.include_router(v1_vocabulary_router)
+v1_router.include_router(v1_mistake_router)
+v1_router.include_router(v1_feedback_router)
 
 router.include_router(v1_router)
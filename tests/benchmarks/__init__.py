@@ -0,0 +1,6 @@
+"""
+Micro-benchmarks (not collected by pytest).
+
+Run from the tests directory, e.g.:
+    PYTHONPATH=../backend python -m benchmarks.bench_statements
+"""
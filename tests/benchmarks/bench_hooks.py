@@ -0,0 +1,72 @@
+"""
+Per-call overhead of service hook chains: cooperative ``super()`` context hooks (before) versus
+``hook_stage`` hooks flattened into the class's hook pipeline (after), for 0 to 3 hook mixins.
+
+Each hook does nothing but yield and the repository returns immediately, so the numbers are the
+cost of the hook machinery around ``service.create`` alone. bench_services shows the same for the
+real VocabularyService stack.
+"""
+
+import asyncio
+import timeit
+from contextlib import asynccontextmanager
+
+from app.base.services.base import BaseContextKwargs, BaseCreateHooks, BaseCreateServiceMixin
+from app.base.services.pipeline import hook_stage
+
+NUMBER = 20000
+
+
+class _Repo:
+    async def create(self, session, obj_in, **extra_fields):
+        return obj_in
+
+
+def _cooperative_mixin():
+    class Mixin(BaseCreateHooks):
+        @asynccontextmanager
+        async def _context_create(self, session, obj_data, context):
+            async with super()._context_create(session, obj_data, context):
+                yield
+
+    return Mixin
+
+
+def _stage_mixin():
+    class Mixin(BaseCreateHooks):
+        @hook_stage
+        async def _context_create(self, session, obj_data, context):
+            yield
+
+    return Mixin
+
+
+def _service(mixins):
+    class Service(*mixins, BaseCreateServiceMixin):
+        context_model = BaseContextKwargs
+        repo = _Repo()
+
+    return Service()
+
+
+async def _per_call_us(service) -> float:
+    context = service._ensure_context({}, service.context_model)
+    best = float("inf")
+    for _ in range(5):
+        start = timeit.default_timer()
+        for _ in range(NUMBER):
+            await service.create(None, None, context=context)
+        best = min(best, (timeit.default_timer() - start) / NUMBER * 1e6)
+    return best
+
+
+async def main() -> None:
+    print(f"{'create, hook mixins':<28}{'before (us)':>14}{'after (us)':>14}")
+    for depth in range(4):
+        before = _service([_cooperative_mixin() for _ in range(depth)])
+        after = _service([_stage_mixin() for _ in range(depth)])
+        print(f"{depth:<28}{await _per_call_us(before):>14.2f}{await _per_call_us(after):>14.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
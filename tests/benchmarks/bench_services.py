@@ -0,0 +1,109 @@
+"""
+Per-call overhead of service methods on the VocabularyService hook stack (nested resource, unique
+constraints), without the database: the repository is replaced by one returning a fixed row, so
+the numbers are context validation plus hook chains only.
+
+"before" is _ensure_context as it was, looking a TypeAdapter up through an lru_cache'd classmethod
+on every call; "after" is the current code, with the validator compiled per context model.
+"""
+
+import asyncio
+import timeit
+import uuid
+from functools import lru_cache
+
+from pydantic import TypeAdapter, ValidationError
+
+from app.features.user_profile.repos import UserProfileRepository
+from app.features.vocabulary.models import VocabularyModel
+from app.features.vocabulary.repos import VocabularyRepository
+from app.features.vocabulary.schemas import VocabularyUpdate
+from app.features.vocabulary.services import VocabularyContextKwargs, VocabularyService
+from app.router import router  # noqa: F401  (imports every feature model)
+
+NUMBER = 20000
+
+
+class _RowRepository(VocabularyRepository):
+    """Answers every by-primary-key call with the same row."""
+
+    def __init__(self, row: VocabularyModel):
+        self.row = row
+
+    async def get_by_pk(self, session, pk, fields=None, where=()):
+        return self.row
+
+    async def update_by_pk(self, session, pk, obj_in, return_updated_obj=True, where=(), **update_fields):
+        return self.row
+
+    async def delete_by_pk(self, session, pk, soft_delete=False, where=()):
+        return True
+
+
+class _Session:
+    """Stands in for the AsyncSession; with the repository replaced, hooks only read and write its info."""
+
+    def __init__(self):
+        self.info = {}
+
+
+class _Before:
+    """_ensure_context as it was, looking the TypeAdapter up through an lru_cache'd classmethod."""
+
+    @classmethod
+    @lru_cache
+    def _get_adapter(cls, cast_to):
+        return TypeAdapter(cast_to)
+
+    @classmethod
+    def _ensure_context(cls, context, cast_to):
+        if context is None:
+            context = {}
+        try:
+            return cls._get_adapter(cast_to).validate_python(context)
+        except ValidationError as e:
+            raise ValueError(f"Invalid context provided: {e}") from e
+
+
+def _per_call_us(func) -> float:
+    return min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+
+def bench_ensure_context() -> None:
+    raw = {"parent_id": str(uuid.uuid4())}
+    cases = {
+        "before": lambda: _Before._ensure_context(raw, VocabularyContextKwargs),
+        "after": lambda: VocabularyService._ensure_context(raw, VocabularyContextKwargs),
+    }
+    print(f"{'_ensure_context':<28}{'per call (us)':>14}")
+    for name, func in cases.items():
+        print(f"{name:<28}{_per_call_us(func):>14.2f}")
+
+
+async def bench_service_calls() -> None:
+    profile_id = uuid.uuid4()
+    row = VocabularyModel(id=uuid.uuid4(), user_profile_id=profile_id, item="apple", meaning="fruit")
+    service = VocabularyService(_RowRepository(row), UserProfileRepository())
+    obj_data = VocabularyUpdate(meaning="a fruit")
+    context = {"parent_id": str(profile_id)}
+    session = _Session()
+
+    calls = {
+        "get": lambda: service.get(session, row.id, context=context),
+        "update": lambda: service.update(session, row.id, obj_data, context=context),
+        "delete": lambda: service.delete(session, row.id, context=context),
+    }
+    print(f"\n{'service call (no DB)':<28}{'per call (us)':>14}")
+    for name, call in calls.items():
+        best = float("inf")
+        for _ in range(5):
+            start = timeit.default_timer()
+            for _ in range(NUMBER // 4):
+                await call()
+            best = min(best, (timeit.default_timer() - start) / (NUMBER // 4) * 1e6)
+        print(f"{name:<28}{best:>14.2f}")
+
+
+if __name__ == "__main__":
+    bench_ensure_context()
+    asyncio.run(bench_service_calls())
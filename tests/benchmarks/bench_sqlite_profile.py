@@ -0,0 +1,83 @@
+"""
+Concurrent read/write throughput on the vocabulary endpoints with SQLite in its default
+rollback-journal mode (before) versus the connection profile from AppSettings (after: WAL,
+synchronous=NORMAL, larger cache, mmap, busy_timeout).
+
+CLIENTS clients hit the app in process for DURATION seconds; each request is a page of the
+vocabulary list or, with probability WRITE_RATIO, an update of one vocabulary, against a SQLite
+file. With a single event loop the app's own per-request work caps throughput, so the gain shows
+most on disks where fsync is slow (the default journal mode syncs on every commit).
+"""
+
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.base.models.mixin import Base
+from app.core.config import AppSettings
+from app.core.database.engine import engine_options
+from app.core.database.sqlite import install_sqlite_profile
+from app.core.database.transaction import AsyncTransaction
+from app.main import create_app
+
+CLIENTS = 32
+DURATION = 5.0
+VOCABULARIES = 200
+WRITE_RATIO = 0.5
+
+
+async def _client_loop(client: AsyncClient, base: str, ids: list[str], deadline: float, counts: dict) -> None:
+    while time.perf_counter() < deadline:
+        if random.random() < WRITE_RATIO:
+            response = await client.put(f"{base}/{random.choice(ids)}", json={"meaning": str(random.random())})
+            kind = "writes"
+        else:
+            response = await client.get(base, params={"limit": 20, "offset": random.randrange(VOCABULARIES - 20)})
+            kind = "reads"
+        counts[kind if response.status_code < 400 else "errors"] += 1
+
+
+async def bench(name: str, profile: bool) -> None:
+    settings = AppSettings(DATABASE_POOL_SIZE=CLIENTS, DATABASE_SQLITE_OPTIMIZE_INTERVAL_SECONDS=0)
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_async_engine(url, **engine_options(url, settings))
+        if profile:
+            install_sqlite_profile(engine, settings)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        AsyncTransaction.DEFAULT_SESSION_MAKER = async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+        )
+
+        async with AsyncClient(transport=ASGITransport(app=create_app()), base_url="http://bench") as client:
+            profile_id = (await client.post("/api/v1/user-profiles", json={})).json()["id"]
+            base = f"/api/v1/user-profiles/{profile_id}/vocabularies"
+            ids = [
+                (await client.post(base, json={"item": f"word-{i}", "meaning": "m"})).json()["id"]
+                for i in range(VOCABULARIES)
+            ]
+
+            counts = {"reads": 0, "writes": 0, "errors": 0}
+            deadline = time.perf_counter() + DURATION
+            await asyncio.gather(*(_client_loop(client, base, ids, deadline, counts) for _ in range(CLIENTS)))
+
+        await engine.dispose()
+    total = counts["reads"] + counts["writes"]
+    print(f"{name:<16}{total / DURATION:>12.0f}{counts['reads'] / DURATION:>12.0f}"
+          f"{counts['writes'] / DURATION:>12.0f}{counts['errors']:>10}")
+
+
+async def main() -> None:
+    print(f"{'sqlite':<16}{'req/s':>12}{'reads/s':>12}{'writes/s':>12}{'errors':>10}")
+    await bench("default", profile=False)
+    await bench("profile", profile=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,115 @@
+"""
+Per-call overhead of hot repository queries: statements rebuilt on every call (before) versus
+statements cached by BaseRepository._cached_statement (after).
+
+"build" measures constructing the statement plus generating its SQL cache key, which is what
+SQLAlchemy pays before it can even look up the compiled form; "execute" runs the query end to end
+against an in-memory SQLite database.
+"""
+
+import asyncio
+import timeit
+from datetime import datetime, timezone
+
+from sqlalchemy import select, or_, literal
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.base.models.mixin import Base
+from app.features.vocabulary.models import VocabularyModel
+from app.features.vocabulary.repos import VocabularyRepository
+from app.router import router  # noqa: F401  (imports every feature model)
+
+NUMBER = 2000
+
+
+def _before_select(model):
+    return select(model).where(model.mastery_level == 1).order_by(model.created_at.desc())
+
+
+def _before_exists(model):
+    return select(literal(1)).select_from(model).where(model.mastery_level == 1).limit(1)
+
+
+def _before_due_for_review(model, limit=20):
+    now = datetime.now(timezone.utc)
+    return (
+        select(model)
+        .where(or_(model.next_review_at.is_(None), model.next_review_at <= now))
+        .order_by(model.next_review_at.asc().nullsfirst())
+        .limit(limit)
+    )
+
+
+def _cached(repo, name):
+    # Already built by _execute_once; the factory is never called.
+    return repo._cached_statement(name, lambda: None)
+
+
+def _per_call_us(func) -> float:
+    return min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+
+def bench_build(repo: VocabularyRepository) -> None:
+    model = VocabularyModel
+    # Warm the cache the way the first real call would.
+    asyncio.run(_execute_once(repo))
+    cases = {
+        "_select (default order)": (
+            lambda: _before_select(model)._generate_cache_key(),
+            lambda: repo._select(where=[model.mastery_level == 1])._generate_cache_key(),
+        ),
+        "exists": (
+            lambda: _before_exists(model)._generate_cache_key(),
+            lambda: _cached(repo, "exists").where(model.mastery_level == 1)._generate_cache_key(),
+        ),
+        "get_due_for_review": (
+            lambda: _before_due_for_review(model)._generate_cache_key(),
+            lambda: _cached(repo, "due_for_review")._generate_cache_key(),
+        ),
+    }
+    print(f"{'build + cache key':<28}{'before (us)':>14}{'after (us)':>14}")
+    for name, (before, after) in cases.items():
+        print(f"{name:<28}{_per_call_us(before):>14.2f}{_per_call_us(after):>14.2f}")
+
+
+async def _execute_once(repo: VocabularyRepository) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine)() as session:
+        await repo.get_due_for_review(session)
+        await repo.exists(session)
+    await engine.dispose()
+
+
+async def bench_execute(repo: VocabularyRepository) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(engine)() as session:
+        async def before():
+            return (await session.execute(_before_due_for_review(VocabularyModel))).scalars().all()
+
+        async def after():
+            return await repo.get_due_for_review(session)
+
+        print(f"\n{'execute (async, SQLite)':<28}{'before (us)':>14}{'after (us)':>14}")
+        timings = []
+        for func in (before, after):
+            await func()
+            best = float("inf")
+            for _ in range(5):
+                start = timeit.default_timer()
+                for _ in range(NUMBER // 4):
+                    await func()
+                best = min(best, (timeit.default_timer() - start) / (NUMBER // 4) * 1e6)
+            timings.append(best)
+        print(f"{'get_due_for_review':<28}{timings[0]:>14.2f}{timings[1]:>14.2f}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    vocabulary_repo = VocabularyRepository()
+    bench_build(vocabulary_repo)
+    asyncio.run(bench_execute(vocabulary_repo))
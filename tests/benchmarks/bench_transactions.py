@@ -0,0 +1,57 @@
+"""
+Latency of a read by primary key inside a committed transaction (before) versus a read-only
+AsyncTransaction, which skips the commit and its flush bookkeeping and is rolled back on close
+(after). Runs against a SQLite file and an in-memory database.
+"""
+
+import asyncio
+import tempfile
+import timeit
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.base.models.mixin import Base
+from app.core.database.transaction import AsyncTransaction
+from app.features.user_profile.repos import UserProfileRepository
+from app.features.user_profile.schemas import UserProfileCreate
+from app.router import router  # noqa: F401  (imports every feature model)
+
+NUMBER = 2000
+
+
+async def _per_call_us(session_maker, pk, read_only: bool) -> float:
+    repo = UserProfileRepository()
+    best = float("inf")
+    for _ in range(5):
+        start = timeit.default_timer()
+        for _ in range(NUMBER):
+            async with AsyncTransaction(session_maker, read_only=read_only) as session:
+                await repo.get_by_pk(session, pk)
+        best = min(best, (timeit.default_timer() - start) / NUMBER * 1e6)
+    return best
+
+
+async def bench(name: str, url: str) -> None:
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+    async with AsyncTransaction(session_maker) as session:
+        pk = (await UserProfileRepository().create(session, UserProfileCreate())).id
+
+    before = await _per_call_us(session_maker, pk, read_only=False)
+    after = await _per_call_us(session_maker, pk, read_only=True)
+    print(f"{name:<28}{before:>14.1f}{after:>16.1f}")
+    await engine.dispose()
+
+
+async def main() -> None:
+    print(f"{'get_by_pk transaction':<28}{'commit (us)':>14}{'read-only (us)':>16}")
+    with tempfile.TemporaryDirectory() as tmp:
+        await bench("sqlite file", f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}")
+    await bench("sqlite memory", "sqlite+aiosqlite:///:memory:")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+"""
+Concurrent vocabulary updates against a SQLite file (WAL profile) with every writer on its own
+pooled connection (before) versus the single-writer queue (after).
+
+CLIENTS clients update random vocabularies for DURATION seconds. On the pool, writers wait for
+the database lock in busy_timeout's sleep-and-poll loop and pay one commit (one WAL sync) each;
+through the queue they wait in line instead, and updates that queued up meanwhile share a commit.
+"""
+
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.base.models.mixin import Base
+from app.core.config import AppSettings
+from app.core.database.engine import create_write_engine, engine_options
+from app.core.database.sqlite import install_sqlite_profile
+from app.core.database.transaction import AsyncTransaction
+from app.core.database.writer import WriteScheduler
+from app.main import create_app
+
+CLIENTS = 64
+DURATION = 5.0
+VOCABULARIES = 200
+
+
+async def _client_loop(client: AsyncClient, base: str, ids: list[str], deadline: float, counts: dict) -> None:
+    while time.perf_counter() < deadline:
+        response = await client.put(f"{base}/{random.choice(ids)}", json={"meaning": str(random.random())})
+        counts["writes" if response.status_code < 400 else "errors"] += 1
+
+
+async def bench(name: str, queue: bool) -> None:
+    settings = AppSettings(
+        DATABASE_POOL_SIZE=CLIENTS, DATABASE_SQLITE_OPTIMIZE_INTERVAL_SECONDS=0, DATABASE_SQLITE_WRITE_QUEUE=True
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_async_engine(url, **engine_options(url, settings))
+        install_sqlite_profile(engine, settings)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        AsyncTransaction.DEFAULT_SESSION_MAKER = async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+        )
+        write_engine = create_write_engine(url, settings) if queue else None
+        AsyncTransaction.WRITE_SCHEDULER = WriteScheduler(
+            async_sessionmaker(write_engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+        ) if write_engine is not None else None
+
+        async with AsyncClient(transport=ASGITransport(app=create_app()), base_url="http://bench") as client:
+            profile_id = (await client.post("/api/v1/user-profiles", json={})).json()["id"]
+            base = f"/api/v1/user-profiles/{profile_id}/vocabularies"
+            ids = [
+                (await client.post(base, json={"item": f"word-{i}", "meaning": "m"})).json()["id"]
+                for i in range(VOCABULARIES)
+            ]
+
+            counts = {"writes": 0, "errors": 0}
+            deadline = time.perf_counter() + DURATION
+            await asyncio.gather(*(_client_loop(client, base, ids, deadline, counts) for _ in range(CLIENTS)))
+
+        commits = ""
+        if AsyncTransaction.WRITE_SCHEDULER is not None:
+            scheduler = AsyncTransaction.WRITE_SCHEDULER
+            await scheduler.stop()
+            commits = f"{scheduler.jobs / max(scheduler.transactions, 1):>14.1f}"
+            await write_engine.dispose()
+        await engine.dispose()
+    print(f"{name:<16}{counts['writes'] / DURATION:>12.0f}{counts['errors']:>10}{commits}")
+
+
+async def main() -> None:
+    print(f"{'writers':<16}{'writes/s':>12}{'errors':>10}{'jobs/commit':>14}")
+    await bench("pool", queue=False)
+    await bench("queue", queue=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
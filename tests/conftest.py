@@ -37,6 +37,20 @@ def pytest_addoption(parser):
         default="sqlite",
         help="Select database type for tests (sqlite, postgres)",
     )
+    parser.addoption(
+        "--explain-plans",
+        action="store_true",
+        default=False,
+        help="Explain every statement shape run on the test database and report full scans and index advice",
+    )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Print the query plan report of --explain-plans."""
+    report = config.stash.get(plan_report_key, None)
+    if report is not None:
+        terminalreporter.write_sep("=", "query plans")
+        terminalreporter.write_line(report)
 
 
 @pytest.fixture(scope="session")
@@ -55,6 +69,10 @@ from tests.fixtures.db import (
     async_engine,
     session_maker_fixture,
     session_fixture,
+    sql_statements_fixture,
+    query_budget_fixture,
+    suite_plan_collector_fixture,
+    plan_report_key,
 )
 
 # HTTP Client fixtures
@@ -0,0 +1,196 @@
+"""E2E tests for the vocabulary endpoints: each operation touches each row at most once."""
+
+import re
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.fixture
+async def profile_id(client: AsyncClient) -> str:
+    response = await client.post("/api/v1/user-profiles", json={})
+    return response.json()["id"]
+
+
+@pytest.fixture
+async def vocabulary_id(client: AsyncClient, profile_id: str) -> str:
+    response = await client.post(f"/api/v1/user-profiles/{profile_id}/vocabularies",
+                                 json={"item": "apple", "meaning": "fruit"})
+    return response.json()["id"]
+
+
+def _tables(statements: list[str]) -> list[str]:
+    """Reduce statements to "VERB table" for readable assertions."""
+    summary = []
+    for statement in statements:
+        verb = statement.split()[0]
+        match = re.search(r"\b(?:FROM|INTO|UPDATE)\s+(\w+)", statement)
+        summary.append(f"{verb} {match.group(1)}")
+    return summary
+
+
+class TestVocabularyQueryCount:
+    """Exact statements per endpoint; ownership is part of the get/update/delete statement itself."""
+
+    async def test_create(self, client, profile_id, sql_statements):
+        response = await client.post(f"/api/v1/user-profiles/{profile_id}/vocabularies",
+                                     json={"item": "pear", "meaning": "fruit"})
+
+        assert response.status_code == 201
+        # Parent existence is a SELECT 1 ... LIMIT 1, not a full row load.
+        assert _tables(sql_statements) == ["SELECT user_profile", "INSERT vocabulary"]
+
+    async def test_list(self, client, profile_id, vocabulary_id, sql_statements):
+        response = await client.get(f"/api/v1/user-profiles/{profile_id}/vocabularies")
+
+        assert response.status_code == 200
+        # The profile was already checked when the vocabulary was created; that check is cached.
+        assert _tables(sql_statements) == ["SELECT vocabulary", "SELECT vocabulary"]
+
+    async def test_get(self, client, profile_id, vocabulary_id, sql_statements):
+        response = await client.get(f"/api/v1/user-profiles/{profile_id}/vocabularies/{vocabulary_id}")
+
+        assert response.status_code == 200
+        assert _tables(sql_statements) == ["SELECT vocabulary"]
+        assert "user_profile_id = ?" in sql_statements[0]
+
+    async def test_repeated_get_is_served_from_cache(self, client, profile_id, vocabulary_id, sql_statements):
+        url = f"/api/v1/user-profiles/{profile_id}/vocabularies/{vocabulary_id}"
+        first = await client.get(url)
+        sql_statements.clear()
+
+        second = await client.get(url)
+
+        assert second.json() == first.json()
+        assert sql_statements == []
+
+    async def test_get_after_update_is_fresh(self, client, profile_id, vocabulary_id):
+        url = f"/api/v1/user-profiles/{profile_id}/vocabularies/{vocabulary_id}"
+        await client.get(url)
+
+        await client.put(url, json={"meaning": "a fruit"})
+
+        assert (await client.get(url)).json()["meaning"] == "a fruit"
+
+    async def test_update(self, client, profile_id, vocabulary_id, sql_statements):
+        response = await client.put(f"/api/v1/user-profiles/{profile_id}/vocabularies/{vocabulary_id}",
+                                    json={"meaning": "a fruit"})
+
+        assert response.status_code == 200
+        assert _tables(sql_statements) == ["UPDATE vocabulary"]
+        assert "user_profile_id = ?" in sql_statements[0]
+
+    async def test_update_many(self, client, profile_id, vocabulary_id, sql_statements):
+        base = f"/api/v1/user-profiles/{profile_id}/vocabularies"
+        pear_id = (await client.post(base, json={"item": "pear", "meaning": "m"})).json()["id"]
+        missing_id = "00000000-0000-0000-0000-000000000000"
+        sql_statements.clear()
+
+        response = await client.patch(base, json={
+            vocabulary_id: {"mastery_level": 3}, missing_id: {"mastery_level": 3}, pear_id: {"mastery_level": 3},
+        })
+
+        assert response.status_code == 200
+        assert [item and (item["item"], item["mastery_level"]) for item in response.json()] == [
+            ("apple", 3), None, ("pear", 3),
+        ]
+        # Equal payloads share one statement.
+        assert _tables(sql_statements) == ["UPDATE vocabulary"]
+
+    async def test_delete(self, client, profile_id, vocabulary_id, sql_statements):
+        response = await client.delete(f"/api/v1/user-profiles/{profile_id}/vocabularies/{vocabulary_id}")
+
+        assert response.status_code == 204
+        assert _tables(sql_statements) == ["DELETE vocabulary"]
+        assert "user_profile_id = ?" in sql_statements[0]
+
+
+class TestVocabularyOwnership:
+    """A vocabulary reached through another profile's URL behaves as if it did not exist."""
+
+    @pytest.fixture
+    async def other_profile_id(self, client: AsyncClient) -> str:
+        response = await client.post("/api/v1/user-profiles", json={})
+        return response.json()["id"]
+
+    @pytest.mark.parametrize("method, body", [("GET", None), ("PUT", {"meaning": "stolen"}), ("DELETE", None)])
+    async def test_wrong_parent_is_not_found(self, client, profile_id, other_profile_id, vocabulary_id, method, body):
+        url = f"/api/v1/user-profiles/{other_profile_id}/vocabularies/{vocabulary_id}"
+
+        response = await client.request(method, url, json=body)
+
+        assert response.status_code == 404
+        original = await client.get(f"/api/v1/user-profiles/{profile_id}/vocabularies/{vocabulary_id}")
+        assert original.status_code == 200
+        assert original.json()["meaning"] == "fruit"
+
+
+class TestVocabularyQueryBudget:
+    """Statement budgets that do not grow with the number of rows returned."""
+
+    async def test_list_of_many(self, client, profile_id, query_budget):
+        base = f"/api/v1/user-profiles/{profile_id}/vocabularies"
+        for i in range(5):
+            await client.post(base, json={"item": f"word-{i}", "meaning": "m"})
+
+        response = await client.get(base)
+
+        assert len(response.json()["items"]) == 5
+        query_budget(response, 2)
+
+
+class TestVocabularyPaging:
+    """The list endpoint pages by cursor or, for existing clients, by offset."""
+
+    @pytest.fixture
+    async def items(self, client, profile_id) -> list[str]:
+        base = f"/api/v1/user-profiles/{profile_id}/vocabularies"
+        for i in range(5):
+            await client.post(base, json={"item": f"word-{i}", "meaning": "m"})
+        response = await client.get(base)
+        return [item["item"] for item in response.json()["items"]]
+
+    async def test_offset(self, client, profile_id, items):
+        response = await client.get(f"/api/v1/user-profiles/{profile_id}/vocabularies",
+                                    params={"offset": 3, "limit": 2})
+
+        assert response.status_code == 200
+        assert [item["item"] for item in response.json()["items"]] == items[3:5]
+
+    async def test_cursor(self, client, profile_id, items):
+        base = f"/api/v1/user-profiles/{profile_id}/vocabularies"
+        first = (await client.get(base, params={"limit": 2})).json()
+
+        response = await client.get(base, params={"cursor": first["next_cursor"], "limit": 2})
+
+        assert [item["item"] for item in response.json()["items"]] == items[2:4]
+        assert first["total_count"] == 5
+        assert response.json()["total_count"] is None
+
+    async def test_offset_and_cursor_together_are_rejected(self, client, profile_id, items):
+        base = f"/api/v1/user-profiles/{profile_id}/vocabularies"
+        first = (await client.get(base, params={"limit": 2})).json()
+
+        response = await client.get(base, params={"cursor": first["next_cursor"], "offset": 2})
+
+        assert response.status_code == 400
+
+
+class TestVocabularyIds:
+    """?ids= fetches the given rows instead of a page, with the same sparse fieldset support."""
+
+    async def test_fields_are_projected(self, client, profile_id, vocabulary_id, sql_statements):
+        response = await client.get(f"/api/v1/user-profiles/{profile_id}/vocabularies",
+                                    params={"ids": vocabulary_id, "fields": "item"})
+
+        assert response.status_code == 200
+        assert response.json()["items"] == [{"id": vocabulary_id, "item": "apple"}]
+        select_vocabulary = [s for s in sql_statements if _tables([s]) == ["SELECT vocabulary"]]
+        assert select_vocabulary and all("vocabulary.meaning" not in s for s in select_vocabulary)
+
+    @pytest.mark.parametrize("params", [{"cursor": "abc"}, {"offset": 1}, {"count": "none"}])
+    async def test_paging_parameters_are_rejected(self, client, profile_id, vocabulary_id, params):
+        response = await client.get(f"/api/v1/user-profiles/{profile_id}/vocabularies",
+                                    params={"ids": vocabulary_id, **params})
+
+        assert response.status_code == 400
@@ -1,6 +1,66 @@
+import pytest
 from httpx import AsyncClient
 
+import app.base.deps.debug
+import app.router
+from app.core.config import AppSettings
+from app.core.database.explain import PlanCollector
+
 
 async def test_health(client: AsyncClient):
     response = await client.get("/api/health")
     assert response.status_code == 204
+
+
+@pytest.fixture
+def debug_token(monkeypatch):
+    monkeypatch.setattr(app.base.deps.debug, "get_app_settings", lambda: AppSettings(DEBUG_TOKEN="secret"))
+    return "secret"
+
+
+async def test_db_pool_health(client: AsyncClient, debug_token):
+    response = await client.get("/api/health/db-pool", headers={"X-Debug-Token": debug_token})
+    assert response.status_code == 200
+    assert set(response.json()) == {"primary", "replicas"}
+    assert "pool" in response.json()["primary"]
+
+
+async def test_db_pool_health_disabled_by_default(client: AsyncClient):
+    response = await client.get("/api/health/db-pool")
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize("headers", [{}, {"X-Debug-Token": "wrong"}])
+async def test_db_pool_health_requires_the_debug_token(client: AsyncClient, debug_token, headers):
+    response = await client.get("/api/health/db-pool", headers=headers)
+    assert response.status_code == 403
+
+
+async def test_query_plans_disabled_by_default(client: AsyncClient):
+    response = await client.get("/api/health/query-plans")
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize("headers", [{}, {"X-Debug-Token": "wrong"}])
+async def test_query_plans_require_the_debug_token(client: AsyncClient, async_engine, monkeypatch, debug_token, headers):
+    monkeypatch.setattr(app.router, "plan_collector", PlanCollector(async_engine))
+
+    response = await client.get("/api/health/query-plans", headers=headers)
+    assert response.status_code == 403
+
+
+async def test_query_plans(client: AsyncClient, async_engine, monkeypatch, debug_token):
+    collector = PlanCollector(async_engine)
+    collector.install()
+    monkeypatch.setattr(app.router, "plan_collector", collector)
+    try:
+        profile_id = (await client.post("/api/v1/user-profiles", json={})).json()["id"]
+        await client.get(f"/api/v1/user-profiles/{profile_id}/vocabularies")
+
+        response = await client.get("/api/health/query-plans", headers={"X-Debug-Token": debug_token})
+    finally:
+        collector.remove()
+
+    assert response.status_code == 200
+    assert "CREATE INDEX ix_vocabulary_user_profile_id" in response.json()["report"]
+    assert any(plan["issues"] for plan in response.json()["plans"])
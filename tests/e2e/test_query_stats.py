@@ -0,0 +1,77 @@
+"""E2E tests for the per-request SQL statement totals in the response headers."""
+
+import pytest
+from fastapi.responses import StreamingResponse
+from httpx import AsyncClient
+from sqlalchemy import text
+
+from app.core.database.instrumentation import install_query_instrumentation
+from app.core.database.transaction import AsyncTransaction
+from app.core.logger import logger
+
+
+@pytest.fixture(autouse=True)
+def _instrumented(async_engine):
+    install_query_instrumentation(async_engine)
+
+
+async def test_responses_report_their_sql_statements(client: AsyncClient):
+    response = await client.post("/api/v1/user-profiles", json={})
+
+    assert response.status_code == 201
+    assert int(response.headers["X-DB-Query-Count"]) >= 1
+    assert float(response.headers["X-DB-Time-Ms"]) > 0
+
+
+async def test_requests_without_statements_report_zero(client: AsyncClient):
+    response = await client.get("/api/health")
+
+    assert response.headers["X-DB-Query-Count"] == "0"
+
+
+@pytest.fixture
+def debug_messages():
+    messages = []
+    sink = logger.add(messages.append, level="DEBUG", format="{message}")
+    yield messages
+    logger.remove(sink)
+
+
+@pytest.fixture
+def app(app):
+    """The application with an endpoint that runs statements while its body streams."""
+
+    @app.get("/api/streamed-statements")
+    async def streamed_statements():
+        async def body():
+            for _ in range(3):
+                async with AsyncTransaction(read_only=True) as session:
+                    await session.execute(text("SELECT 1"))
+                yield b"row\n"
+
+        return StreamingResponse(body())
+
+    return app
+
+
+async def test_streamed_export_reports_statements_before_the_body(client: AsyncClient, debug_messages):
+    profile_id = (await client.post("/api/v1/user-profiles", json={})).json()["id"]
+    await client.post(f"/api/v1/user-profiles/{profile_id}/vocabularies", json={"item": "apple", "meaning": "m"})
+    debug_messages.clear()
+
+    response = await client.get(f"/api/v1/user-profiles/{profile_id}/vocabularies/export")
+
+    assert response.status_code == 200
+    assert response.text.count("\n") == 1
+    count = int(response.headers["X-DB-Query-Count"])
+    assert count >= 1
+    assert f"SQL: {count} statement(s)" in "".join(debug_messages)
+
+
+async def test_statements_while_streaming_are_tracked_until_the_last_chunk(client: AsyncClient, debug_messages):
+    response = await client.get("/api/streamed-statements")
+
+    assert response.text == "row\n" * 3
+    # The headers left before the body ran its statements; the logged totals include them.
+    assert response.headers["X-DB-Query-Count"] == "0"
+    assert "SQL: 3 statement(s)" in "".join(debug_messages)
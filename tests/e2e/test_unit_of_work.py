@@ -0,0 +1,62 @@
+"""E2E tests for UnitOfWorkDep: an endpoint that opts in runs its usecases in one transaction."""
+
+import pytest
+from sqlalchemy import event, func, select
+
+from app.base.exceptions.basic import BadRequestException
+from app.features.mistake.models import MistakeModel
+from app.features.mistake.repos import MistakeRepository
+from app.features.vocabulary.models import VocabularyModel
+
+MISTAKE_WITH_VOCABULARY = {
+    "mistake": {"original_sentence": "I goed home", "corrected_sentence": "I went home", "error_type": "verb"},
+    "vocabulary": {"item": "went", "meaning": "past of go"},
+}
+
+
+@pytest.fixture
+def commits(async_engine):
+    """Commits on the test engine, in order."""
+    recorded = []
+
+    def record(conn):
+        recorded.append(conn)
+
+    event.listen(async_engine.sync_engine, "commit", record)
+    yield recorded
+    event.remove(async_engine.sync_engine, "commit", record)
+
+
+@pytest.fixture
+async def profile_id(client) -> str:
+    return (await client.post("/api/v1/user-profiles", json={})).json()["id"]
+
+
+async def _count(async_engine, model) -> int:
+    async with async_engine.connect() as conn:
+        return await conn.scalar(select(func.count()).select_from(model))
+
+
+async def test_usecases_share_one_transaction(client, async_engine, profile_id, commits):
+    response = await client.post(f"/api/v1/user-profiles/{profile_id}/mistakes/with-vocabulary",
+                                 json=MISTAKE_WITH_VOCABULARY)
+
+    assert response.status_code == 201
+    assert len(commits) == 1
+    vocabulary = (await client.get(f"/api/v1/user-profiles/{profile_id}/vocabularies")).json()["items"]
+    assert [item["item"] for item in vocabulary] == ["went"]
+    assert response.json()["vocabulary_id"] == vocabulary[0]["id"]
+
+
+async def test_failing_usecase_rolls_back_the_others(client, async_engine, profile_id, monkeypatch):
+    async def failing_create(self, session, obj_in, **fields):
+        raise BadRequestException("rejected")
+
+    monkeypatch.setattr(MistakeRepository, "create", failing_create)
+
+    response = await client.post(f"/api/v1/user-profiles/{profile_id}/mistakes/with-vocabulary",
+                                 json=MISTAKE_WITH_VOCABULARY)
+
+    assert response.status_code == 400
+    assert await _count(async_engine, VocabularyModel) == 0
+    assert await _count(async_engine, MistakeModel) == 0
@@ -7,6 +7,7 @@ from tests.fixtures.db import (
     async_engine,
     session_maker_fixture,
     session_fixture,
+    sql_statements_fixture,
 )
 from tests.fixtures.clients import (
     AsyncClientWithJson,
@@ -21,6 +22,7 @@ __all__ = [
     "async_engine",
     "session_maker_fixture",
     "session_fixture",
+    "sql_statements_fixture",
     # Client fixtures
     "AsyncClientWithJson",
     "app_fixture",
@@ -5,9 +5,12 @@ Supports SQLite (in-memory) and PostgreSQL (via testcontainers).
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import StaticPool
+from sqlalchemy import StaticPool, event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
+from app.base.services.cached_read_hook import default_read_cache
+from app.core.database.explain import PlanCollector, format_report
+from app.core.database.instrumentation import QUERY_COUNT_HEADER, install_query_instrumentation
 from app.core.database.transaction import AsyncTransaction
 
 
@@ -41,6 +44,23 @@ async def async_engine():
     await engine.dispose()
 
 
+# Query plan report of the run, set with --explain-plans and printed in the terminal summary.
+plan_report_key = pytest.StashKey[str]()
+
+
+@pytest_asyncio.fixture(name="suite_plan_collector", scope="session", loop_scope="session", autouse=True)
+async def suite_plan_collector_fixture(request, async_engine):
+    """With --explain-plans, explain every statement shape the suite runs on the test engine."""
+    if not request.config.getoption("--explain-plans"):
+        yield None
+        return
+    collector = PlanCollector(async_engine)
+    collector.install()
+    yield collector
+    request.config.stash[plan_report_key] = format_report(await collector.explain())
+    collector.remove()
+
+
 @pytest_asyncio.fixture(name="session_maker")
 async def session_maker_fixture(async_engine, monkeypatch: pytest.MonkeyPatch):
     """Create session maker and patch AsyncTransaction."""
@@ -52,6 +72,7 @@ async def session_maker_fixture(async_engine, monkeypatch: pytest.MonkeyPatch):
         autoflush=False,
     )
     monkeypatch.setattr(AsyncTransaction, "DEFAULT_SESSION_MAKER", session_maker)
+    default_read_cache.clear()
     yield session_maker
 
 
@@ -62,6 +83,40 @@ async def session_fixture(session_maker):
         yield session
         await session.rollback()
 
+@pytest.fixture(name="sql_statements")
+def sql_statements_fixture(async_engine):
+    """Record every SQL statement executed on the test engine (e.g. to assert query counts)."""
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.fixture(name="query_budget")
+def query_budget_fixture(async_engine):
+    """Assert that a response's request ran at most a given number of SQL statements (catches N+1 queries).
+
+    Example:
+
+        response = await client.get(url)
+        query_budget(response, 2)
+    """
+    install_query_instrumentation(async_engine)
+
+    def check(response, max_queries: int) -> None:
+        count = int(response.headers[QUERY_COUNT_HEADER])
+        assert count <= max_queries, (
+            f"{response.request.method} {response.request.url.path} ran {count} SQL statements, "
+            f"over its budget of {max_queries}"
+        )
+
+    return check
+
+
 # Optional: PostgreSQL support with testcontainers
 # Uncomment and install testcontainers-postgres if needed
 #
@@ -0,0 +1,378 @@
+"""Integration tests for app.base.repos.base against a real database."""
+
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.exc import InvalidRequestError
+
+from app.base.repos.count import CountStrategy
+from app.features.user_profile.models import UserProfileModel
+from app.features.user_profile.repos import UserProfileRepository
+from app.features.user_profile.schemas import UserProfileCreate
+from app.features.vocabulary.repos import VocabularyRepository
+
+
+@pytest.fixture
+def repo():
+    return UserProfileRepository()
+
+
+@pytest.fixture
+async def profiles(session, repo):
+    """Seven profiles created within the same second, so the default ordering has ties."""
+    return [
+        await repo.create(session, UserProfileCreate(proficiency_level=f"A{i % 3}"))
+        for i in range(7)
+    ]
+
+
+class TestCursorPagination:
+    """Keyset pagination must visit every row exactly once, in the offset order."""
+
+    @pytest.mark.parametrize("order_by", [
+        (),
+        [UserProfileModel.proficiency_level.asc()],
+        [UserProfileModel.proficiency_level.desc(), UserProfileModel.native_language.asc()],
+    ])
+    async def test_forward_and_backward_pages_match_full_listing(self, session, repo, profiles, order_by):
+        expected = [p.id for p in (await repo.get_multi(session, limit=None, order_by=order_by)).items]
+
+        page = await repo.get_multi(session, limit=3, order_by=order_by)
+        seen = [p.id for p in page.items]
+        while page.next_cursor:
+            page = await repo.get_multi(session, limit=3, order_by=order_by, cursor=page.next_cursor)
+            seen += [p.id for p in page.items]
+        assert seen == expected
+        assert page.last is True
+
+        backward = [p.id for p in page.items]
+        while page.prev_cursor:
+            page = await repo.get_multi(session, limit=3, order_by=order_by, cursor=page.prev_cursor)
+            backward = [p.id for p in page.items] + backward
+        assert backward == expected
+        assert page.first is True
+
+    async def test_cursor_survives_deleted_anchor_row(self, session, repo, profiles):
+        order_by = [UserProfileModel.proficiency_level.asc()]
+        first_page = await repo.get_multi(session, limit=3, order_by=order_by)
+        await repo.delete_by_pk(session, first_page.items[-1].id)
+
+        page = await repo.get_multi(session, limit=3, order_by=order_by, cursor=first_page.next_cursor)
+
+        expected = [p.id for p in (await repo.get_multi(session, limit=None, order_by=order_by)).items]
+        assert [p.id for p in page.items] == expected[2:5]
+
+
+class TestCountStrategy:
+    """Every count strategy except none must agree with the exact count."""
+
+    @pytest.mark.parametrize("strategy", [CountStrategy.WINDOW, CountStrategy.CACHED])
+    async def test_strategies_match_exact_count(self, session, repo, profiles, strategy):
+        repo.count_cache.clear()
+        where = [UserProfileModel.proficiency_level == "A0"]
+        exact = await repo.get_multi(session, limit=2, where=where)
+
+        page = await repo.get_multi(session, limit=2, where=where, count_strategy=strategy)
+
+        assert page.total_count == exact.total_count == 3
+        assert [p.id for p in page.items] == [p.id for p in exact.items]
+
+    async def test_cached_count_is_evicted_by_writes(self, session, repo, profiles):
+        repo.count_cache.clear()
+        where = [UserProfileModel.proficiency_level == "A0"]
+
+        async def cached_count():
+            return (await repo.get_multi(session, limit=1, where=where, count_strategy=CountStrategy.CACHED)).total_count
+
+        assert await cached_count() == 3
+        await repo.create(session, UserProfileCreate(proficiency_level="A0"))
+        assert await cached_count() == 4
+        await repo.create_many(session, [UserProfileCreate(proficiency_level="A0")])
+        assert await cached_count() == 5
+        await repo.update_where(session, where, {"proficiency_level": "B1"})
+        assert await cached_count() == 0
+
+    async def test_cached_count_survives_writes_to_other_tables(self, session, repo, profiles):
+        repo.count_cache.clear()
+        await repo.get_multi(session, limit=1, count_strategy=CountStrategy.CACHED)
+
+        await VocabularyRepository().create_many(
+            session, [{"user_profile_id": profiles[0].id, "item": "went", "meaning": "past of go"}]
+        )
+
+        assert len(repo.count_cache) == 1
+
+    async def test_window_past_last_page_falls_back_to_exact_count(self, session, repo, profiles):
+        page = await repo.get_multi(session, offset=50, limit=2, count_strategy=CountStrategy.WINDOW)
+
+        assert page.items == []
+        assert page.total_count == 7
+
+
+class TestBulkCreate:
+    """create_many / upsert_many issue multi-row INSERTs and hydrate ORM objects from RETURNING."""
+
+    async def test_create_many_returns_objects_in_input_order(self, session, repo, monkeypatch):
+        monkeypatch.setattr(UserProfileRepository, "max_bind_params", {"sqlite": 7 * 2})
+        levels = [f"L{i}" for i in range(5)]
+
+        created = await repo.create_many(session, [UserProfileCreate(proficiency_level=lv) for lv in levels])
+
+        assert [p.proficiency_level for p in created] == levels
+        assert all(p.id is not None and p.created_at is not None for p in created)
+        assert await repo.get_by_pk(session, created[0].id) is created[0]
+
+    async def test_upsert_many_updates_existing_and_inserts_new(self, session, repo, profiles):
+        existing = profiles[0]
+        new_id = uuid.uuid4()
+
+        result = await repo.upsert_many(
+            session,
+            [{"id": new_id, "native_language": "Japanese"}, {"id": existing.id, "native_language": "German"}],
+            conflict_cols=["id"],
+        )
+
+        assert [p.id for p in result] == [new_id, existing.id]
+        assert existing.native_language == "German"
+        assert existing.proficiency_level == "A0"
+
+    async def test_upsert_many_without_update_columns_skips_conflicts(self, session, repo, profiles):
+        result = await repo.upsert_many(session, [{"id": profiles[0].id}], conflict_cols=["id"])
+
+        assert result == []
+
+
+class TestReturning:
+    """create / update_by_pk hydrate ORM objects from RETURNING rows."""
+
+    async def test_create_returns_server_defaults(self, session, repo):
+        profile = await repo.create(session, UserProfileCreate(native_language="French"))
+
+        assert profile.created_at is not None
+        assert await repo.get_by_pk(session, profile.id) is profile
+
+    async def test_update_by_pk_refreshes_identity_map(self, session, repo, profiles):
+        profile = profiles[0]
+
+        updated = await repo.update_by_pk(session, profile.id, {"native_language": "Spanish"})
+
+        assert updated is profile
+        assert profile.native_language == "Spanish"
+
+    async def test_update_by_pk_missing_row_returns_none(self, session, repo):
+        assert await repo.update_by_pk(session, uuid.uuid4(), {"native_language": "Spanish"}) is None
+
+
+class TestSetBased:
+    """update_where / delete_where change many rows with one statement."""
+
+    async def test_update_where_updates_matching_rows(self, session, repo, profiles):
+        ids = await repo.update_where(session, UserProfileModel.proficiency_level == "A1",
+                                      {"target_language": "German"}, returning_ids=True)
+
+        expected = {p.id for p in profiles if p.proficiency_level == "A1"}
+        assert set(ids) == expected
+        rows = await repo.get_all(session, where=[UserProfileModel.target_language == "German"])
+        assert {p.id for p in rows} == expected
+
+    async def test_delete_by_pks_chunks_and_counts(self, session, repo, profiles, monkeypatch):
+        monkeypatch.setattr(repo, "max_bind_params", {"sqlite": 2})
+
+        count = await repo.delete_by_pks(session, [p.id for p in profiles[:5]] + [uuid.uuid4()])
+
+        assert count == 5
+        assert {p.id for p in await repo.get_all(session)} == {p.id for p in profiles[5:]}
+
+    async def test_delete_where_returns_count(self, session, repo, profiles):
+        count = await repo.delete_where(session, [UserProfileModel.proficiency_level == "A0"])
+
+        assert count == 3
+        assert len(await repo.get_all(session)) == 4
+
+
+class TestFields:
+    """Sparse fieldsets load only the requested columns (plus keys) and never lazy load the rest."""
+
+    async def test_get_multi_loads_requested_fields(self, session, repo, profiles):
+        session.expunge_all()
+
+        page = await repo.get_multi(session, limit=3, fields=["proficiency_level"])
+
+        unloaded = sa_inspect(page.items[0]).unloaded
+        assert "proficiency_level" not in unloaded
+        assert "native_language" in unloaded
+        assert page.next_cursor is not None
+        with pytest.raises(InvalidRequestError):
+            _ = page.items[0].native_language
+
+        next_page = await repo.get_multi(session, limit=3, cursor=page.next_cursor, fields=["proficiency_level"])
+        assert not {p.id for p in next_page.items} & {p.id for p in page.items}
+
+    async def test_get_by_pk_loads_requested_fields(self, session, repo, profiles):
+        session.expunge_all()
+
+        obj = await repo.get_by_pk(session, profiles[0].id, fields=["target_language"])
+
+        assert obj.target_language == profiles[0].target_language
+        assert "native_language" in sa_inspect(obj).unloaded
+
+
+class TestStream:
+    """stream() yields every row in order, in batches, releasing them from the session."""
+
+    async def test_stream_matches_listing_and_expunges(self, session, repo, profiles):
+        order_by = [UserProfileModel.proficiency_level.asc(), UserProfileModel.id.asc()]
+        expected = [p.id for p in await repo.get_all(session, order_by=order_by)]
+
+        seen = []
+        async for obj in repo.stream(session, order_by=order_by, batch_size=2):
+            seen.append(obj)
+
+        assert [p.id for p in seen] == expected
+        assert not any(obj in session for obj in seen)
+
+    async def test_stream_filters(self, session, repo, profiles):
+        rows = [obj async for obj in repo.stream(session, where=[UserProfileModel.proficiency_level == "A0"])]
+
+        assert {p.id for p in rows} == {p.id for p in profiles if p.proficiency_level == "A0"}
+
+
+class TestGetByPks:
+    """get_by_pks batches primary key lookups; BatchLoader coalesces concurrent loads."""
+
+    async def test_preserves_order_and_reports_missing(self, session, repo, profiles):
+        session.expunge_all()
+        missing = uuid.uuid4()
+        pks = [profiles[3].id, missing, profiles[0].id, profiles[3].id]
+
+        objs = await repo.get_by_pks(session, pks)
+
+        assert [obj.id if obj else None for obj in objs] == [profiles[3].id, None, profiles[0].id, profiles[3].id]
+        assert objs[0] is objs[3]
+
+    async def test_identity_map_hits_skip_the_query(self, session, repo, profiles):
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            objs = await repo.get_by_pks(session, [p.id for p in profiles])
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        assert objs == profiles
+        assert statements == []
+
+    async def test_chunks_under_bind_parameter_limit(self, session, repo, profiles, monkeypatch):
+        session.expunge_all()
+        monkeypatch.setattr(repo, "max_bind_params", {"sqlite": 3})
+
+        objs = await repo.get_by_pks(session, [p.id for p in profiles])
+
+        assert [obj.id for obj in objs] == [p.id for p in profiles]
+
+    async def test_loader_coalesces_concurrent_loads(self, session, repo, profiles, monkeypatch):
+        session.expunge_all()
+        calls = []
+        get_by_pks = repo.get_by_pks
+
+        async def spy(session_, pks, *args, **kwargs):
+            calls.append(list(pks))
+            return await get_by_pks(session_, pks, *args, **kwargs)
+
+        monkeypatch.setattr(repo, "get_by_pks", spy)
+        loader = repo.loader(session)
+
+        first, second, again = await asyncio.gather(
+            loader.load(profiles[0].id), loader.load(profiles[1].id), loader.load(profiles[0].id)
+        )
+        assert (first.id, second.id) == (profiles[0].id, profiles[1].id)
+        assert again is first
+        assert len(calls) == 1
+
+        assert await loader.load(profiles[1].id) is second
+        assert len(calls) == 1
+        assert repo.loader(session) is loader
+
+    async def test_loader_forgets_misses_after_inserts(self, session, repo, profiles):
+        loader = repo.loader(session)
+        new_ids = [uuid.uuid4(), uuid.uuid4()]
+        assert await loader.load_many(new_ids) == [None, None]
+        kept = await loader.load(profiles[0].id)
+
+        await repo.create_many(session, [{"id": new_ids[0]}])
+        await repo.upsert_many(session, [{"id": new_ids[1]}], conflict_cols=["id"])
+
+        assert [p.id for p in await loader.load_many(new_ids)] == new_ids
+        assert await loader.load(profiles[0].id) is kept
+
+    async def test_loader_forgets_rows_after_bulk_writes(self, session, repo, profiles):
+        loader = repo.loader(session)
+        assert await loader.load(profiles[0].id) is not None
+
+        await repo.delete_where(session, [UserProfileModel.id == profiles[0].id])
+        assert await loader.load(profiles[0].id) is None
+
+        await repo.upsert_many(session, [{"id": profiles[0].id}], conflict_cols=["id"])
+        assert (await loader.load(profiles[0].id)).id == profiles[0].id
+
+        await repo.delete_by_pks(session, [profiles[0].id])
+        assert await loader.load(profiles[0].id) is None
+
+
+class TestFirstExisting:
+    """first_existing reports the first matching condition with a single CASE WHEN EXISTS query."""
+
+    async def test_returns_first_matching_index(self, session, repo, profiles):
+        conditions = [
+            UserProfileModel.proficiency_level == "C2",
+            UserProfileModel.proficiency_level == "A1",
+            UserProfileModel.proficiency_level == "A0",
+        ]
+        assert await repo.first_existing(session, conditions) == 1
+
+    async def test_returns_none_without_match(self, session, repo, profiles):
+        assert await repo.first_existing(session, [UserProfileModel.proficiency_level == "C2"]) is None
+        assert await repo.first_existing(session, []) is None
+
+    async def test_conditions_over_the_parameter_limit_are_chunked(self, session, repo, profiles, monkeypatch):
+        # Each condition costs 3 parameters (its value, the EXISTS literal, the THEN index): 2 per query.
+        monkeypatch.setattr(repo, "max_bind_params", {"sqlite": 6})
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(session.bind.sync_engine, "before_cursor_execute", record)
+        try:
+            conditions = [UserProfileModel.proficiency_level == level for level in ("C2", "C1", "B2", "A1", "A0")]
+            assert await repo.first_existing(session, conditions) == 3
+        finally:
+            event.remove(session.bind.sync_engine, "before_cursor_execute", record)
+        assert len(statements) == 2  # stops at the chunk with the first match
+
+
+class TestExtraPkFilters:
+    """get_by_pk / update_by_pk / delete_by_pk fuse extra predicates into their single statement."""
+
+    async def test_non_matching_predicate_reports_missing(self, session, repo, profiles):
+        profile = profiles[1]  # proficiency_level "A1"
+        wrong = UserProfileModel.proficiency_level == "A0"
+
+        assert await repo.get_by_pk(session, profile.id, where=wrong) is None
+        assert await repo.update_by_pk(session, profile.id, {"native_language": "Dutch"}, where=wrong) is None
+        assert await repo.delete_by_pk(session, profile.id, where=[wrong]) is False
+        assert (await repo.get_by_pk(session, profile.id)).native_language != "Dutch"
+
+    async def test_matching_predicate_applies(self, session, repo, profiles):
+        profile = profiles[1]
+        right = UserProfileModel.proficiency_level == "A1"
+
+        assert await repo.get_by_pk(session, profile.id, where=right) is profile
+        updated = await repo.update_by_pk(session, profile.id, {"native_language": "Dutch"}, where=right)
+        assert updated is profile and profile.native_language == "Dutch"
+        assert await repo.delete_by_pk(session, profile.id, where=right) is True
@@ -0,0 +1,34 @@
+"""Fixtures for transaction tests that commit, which the shared in-memory database must not see."""
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.core.database.transaction import AsyncTransaction
+from tests.fixtures.db import get_base
+
+
+@pytest.fixture
+async def file_session_maker(tmp_path, monkeypatch):
+    """A SQLite file of its own, used by AsyncTransaction for the duration of the test."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'transactions'}.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(get_base().metadata.create_all)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(AsyncTransaction, "DEFAULT_SESSION_MAKER", session_maker)
+    yield session_maker
+    await engine.dispose()
+
+
+@pytest.fixture
+def commits():
+    """Sessions committed during the test, in order."""
+    recorded = []
+
+    def record(session):
+        recorded.append(session)
+
+    event.listen(Session, "after_commit", record)
+    yield recorded
+    event.remove(Session, "after_commit", record)
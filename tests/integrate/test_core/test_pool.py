@@ -0,0 +1,54 @@
+"""Integration tests for pool warm-up, pool statistics and the engine lifespan on a SQLite file."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import AppSettings
+from app.core.database import engine as engine_module
+from app.core.database.engine import engine_options
+from app.core.database.pool import pool_status, warm_up
+from app.main import create_app
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'pool'}.db"
+    engine = create_async_engine(url, **engine_options(url, AppSettings(DATABASE_POOL_SIZE=2)))
+    yield engine
+    await engine.dispose()
+
+
+class TestPool:
+    async def test_warm_up_opens_connections_up_to_pool_size(self, engine):
+        assert await warm_up(engine, 5) == 2
+
+        status = pool_status(engine)
+        assert (status["checked_in"], status["checked_out"], status["overflow"]) == (2, 0, 0)
+
+    async def test_status_tracks_checkouts_and_waits(self, engine):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            assert pool_status(engine)["checked_out"] == 1
+
+        status = pool_status(engine)
+        assert status["pool"] == "InstrumentedAsyncQueuePool"
+        assert status["checked_out"] == 0 and status["checkouts"] == 1
+        assert 0 < status["max_wait_seconds"] <= status["total_wait_seconds"]
+
+    async def test_static_pool_reports_its_type(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        assert await warm_up(engine, 3) == 1
+        assert pool_status(engine) == {"pool": "StaticPool"}
+        await engine.dispose()
+
+
+class TestLifespan:
+    async def test_app_lifespan_warms_up_and_disposes_engines(self, engine, monkeypatch):
+        monkeypatch.setattr(engine_module, "all_engines", lambda: [engine])
+        monkeypatch.setattr(engine_module, "get_app_settings", lambda: AppSettings(DATABASE_POOL_WARMUP_CONNECTIONS=2))
+        app = create_app()
+
+        async with app.router.lifespan_context(app):
+            assert pool_status(engine)["checked_in"] == 2
+        assert pool_status(engine)["checked_in"] == 0
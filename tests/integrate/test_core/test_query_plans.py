@@ -0,0 +1,46 @@
+"""Query plans of the vocabulary repository: which statements may scan the table or sort in a temporary B-tree.
+
+A change that makes an indexed statement scan (a new ORDER BY in ``_select``, a filter on an
+unindexed column) fails here; a fix that removes a known issue too, so the expectation gets updated.
+"""
+
+import uuid
+
+import pytest
+
+from app.core.database.explain import FULL_SCAN, TEMP_SORT, PlanCollector, format_report
+from app.features.vocabulary.repos import VocabularyRepository
+
+
+@pytest.fixture
+def plan_collector(async_engine):
+    collector = PlanCollector(async_engine)
+    collector.install()
+    yield collector
+    collector.remove()
+
+
+QUERIES = {
+    "get_by_pk": (lambda repo, session: repo.get_by_pk(session, uuid.uuid4()), set()),
+    "get_by_item": (lambda repo, session: repo.get_by_item(session, "apple"), set()),
+    "get_by_mastery_level": (lambda repo, session: repo.get_by_mastery_level(session, 2), set()),
+    "get_due_for_review": (lambda repo, session: repo.get_due_for_review(session), set()),
+    # Known: "contains" is LIKE '%...%', which no B-tree index serves; needs full-text search.
+    "search": (lambda repo, session: repo.search(session, "app"), {FULL_SCAN}),
+    # Known: user_profile_id has no index yet; the report advises (user_profile_id, created_at, id).
+    "list_by_profile": (
+        lambda repo, session: repo.get_multi(session, where=[repo.model.user_profile_id == uuid.uuid4()]),
+        {FULL_SCAN, TEMP_SORT},
+    ),
+}
+
+
+@pytest.mark.parametrize("name", QUERIES)
+async def test_vocabulary_query_plans(name, session, plan_collector):
+    query, expected = QUERIES[name]
+
+    await query(VocabularyRepository(), session)
+    plans = await plan_collector.explain()
+
+    assert plans
+    assert {issue.kind for plan in plans for issue in plan.issues} == expected, format_report(plans)
@@ -0,0 +1,55 @@
+"""Integration tests for read-only AsyncTransactions: never committed, no flushes."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from app.core.database.transaction import AsyncTransaction
+from app.features.user_profile.models import UserProfileModel
+from app.features.user_profile.repos import UserProfileRepository
+from app.features.user_profile.schemas import UserProfileCreate
+from app.features.user_profile.services import UserProfileService
+from app.features.user_profile.usecases.crud import GetUserProfileListUseCase, GetUserProfileUseCase
+
+
+@pytest.fixture
+async def profile(file_session_maker):
+    async with AsyncTransaction() as session:
+        return await UserProfileRepository().create(session, UserProfileCreate())
+
+
+class TestReadOnlyTransaction:
+    async def test_read_usecases_do_not_commit(self, profile, commits):
+        service = UserProfileService(UserProfileRepository())
+
+        assert (await GetUserProfileUseCase(service).execute(profile.id)).id == profile.id
+        assert (await GetUserProfileListUseCase(service).execute()).total_count == 1
+        assert commits == []
+
+    async def test_flush_is_rejected(self, file_session_maker):
+        with pytest.raises(InvalidRequestError, match="read-only"):
+            async with AsyncTransaction(read_only=True) as session:
+                session.add(UserProfileModel())
+                await session.flush()
+
+        async with AsyncTransaction(read_only=True) as session:
+            assert not await UserProfileRepository().exists(session)
+
+    async def test_session_is_closed_after_error(self, file_session_maker):
+        with pytest.raises(RuntimeError):
+            async with AsyncTransaction(read_only=True) as session:
+                await UserProfileRepository().exists(session)
+                raise RuntimeError("boom")
+
+        assert not session.in_transaction()
+
+    async def test_postgresql_starts_a_read_only_transaction(self):
+        session = MagicMock(connection=AsyncMock(), info={})
+        session.bind.dialect.name = "postgresql"
+        transaction = AsyncTransaction(session_maker=MagicMock(return_value=session), read_only=True)
+
+        assert await transaction.__aenter__() is session
+
+        session.connection.assert_awaited_once_with(execution_options={"postgresql_readonly": True})
+        assert session.autoflush is False
@@ -0,0 +1,77 @@
+"""Integration tests for read/write routing, with a second SQLite file standing in for a replica."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.database.routing import RoutingSessionMaker
+from app.core.database.transaction import AsyncTransaction
+from app.features.user_profile.models import UserProfileModel
+from app.features.user_profile.repos import UserProfileRepository
+from app.features.user_profile.schemas import UserProfileCreate
+from app.features.user_profile.services import UserProfileService
+from app.features.user_profile.usecases.crud import GetUserProfileListUseCase
+from tests.fixtures.db import get_base
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+async def databases(tmp_path):
+    """Primary and replica SQLite files with the same schema; nothing replicates between them."""
+    engines = [create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}.db") for name in ("primary", "replica")]
+    for engine in engines:
+        async with engine.begin() as conn:
+            await conn.run_sync(get_base().metadata.create_all)
+    yield [async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False) for engine in engines]
+    for engine in engines:
+        await engine.dispose()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def routed(databases, clock, monkeypatch):
+    primary, replica = databases
+    monkeypatch.setattr(AsyncTransaction, "DEFAULT_SESSION_MAKER", primary)
+    monkeypatch.setattr(AsyncTransaction, "SESSION_ROUTER", RoutingSessionMaker([replica], stickiness=5, clock=clock))
+    return primary, replica
+
+
+async def _profile_count(session) -> int:
+    return (await session.execute(text("SELECT count(*) FROM user_profile"))).scalar_one()
+
+
+class TestReplicaRouting:
+    """Read-only transactions use the replica unless a write committed within the stickiness window."""
+
+    async def test_writes_go_to_primary_and_reads_to_replica(self, routed, clock):
+        async with AsyncTransaction() as session:
+            await UserProfileRepository().create(session, UserProfileCreate())
+
+        # Within the stickiness window the read sees its own write on the primary.
+        async with AsyncTransaction(read_only=True) as session:
+            assert await _profile_count(session) == 1
+
+        clock.now += 5
+        async with AsyncTransaction(read_only=True) as session:
+            assert await _profile_count(session) == 0
+
+    async def test_read_usecase_uses_replica(self, routed):
+        _, replica = routed
+        async with replica() as session:
+            session.add(UserProfileModel())
+            await session.commit()
+
+        use_case = GetUserProfileListUseCase(UserProfileService(UserProfileRepository()))
+        page = await use_case.execute()
+        assert page.total_count == 1
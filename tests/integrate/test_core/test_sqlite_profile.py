@@ -0,0 +1,41 @@
+"""Integration tests for the SQLite profile applied on connect."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import AppSettings
+from app.core.database.sqlite import install_sqlite_profile, optimize, start_optimizer
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'profile'}.db")
+    yield engine
+    await engine.dispose()
+
+
+async def _pragma(engine, name):
+    async with engine.connect() as conn:
+        return (await conn.execute(text(f"PRAGMA {name}"))).scalar_one()
+
+
+class TestSqliteProfile:
+    async def test_profile_is_applied_to_new_connections(self, engine):
+        install_sqlite_profile(engine, AppSettings(DATABASE_SQLITE_BUSY_TIMEOUT_MS=1234))
+
+        assert await _pragma(engine, "journal_mode") == "wal"
+        assert await _pragma(engine, "synchronous") == 1  # NORMAL
+        assert await _pragma(engine, "cache_size") == -65536
+        assert await _pragma(engine, "temp_store") == 2  # MEMORY
+        assert await _pragma(engine, "busy_timeout") == 1234
+
+    async def test_without_profile_defaults_remain(self, engine):
+        assert await _pragma(engine, "journal_mode") == "delete"
+
+    async def test_optimize(self, engine):
+        await optimize(engine)
+
+        assert start_optimizer(engine, AppSettings(DATABASE_SQLITE_OPTIMIZE_INTERVAL_SECONDS=0)) is None
+        task = start_optimizer(engine, AppSettings())
+        task.cancel()
@@ -0,0 +1,171 @@
+"""Integration tests for AsyncTransaction.run: idempotent transactions are re-run on lock contention."""
+
+import sqlite3
+import uuid
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.base.exceptions.basic import ServiceUnavailableException
+from app.base.usecases.crud import BaseUpdateUseCase
+from app.core.database.retry import RetryPolicy
+from app.core.database.sqlite import install_rollback_after_failed_commit
+from app.core.database.transaction import AsyncTransaction, UnitOfWork
+from app.features.user_profile.models import UserProfileModel
+from app.features.user_profile.repos import UserProfileRepository
+from app.features.user_profile.schemas import UserProfileCreate
+from app.features.user_profile.services import UserProfileService
+from app.features.user_profile.usecases.crud import CreateUserProfileUseCase, UpdateUserProfileUseCase
+from tests.fixtures.db import get_base
+
+
+class RecordingSleep:
+    def __init__(self, on_sleep=None):
+        self.delays = []
+        self.on_sleep = on_sleep
+
+    async def __call__(self, delay):
+        self.delays.append(delay)
+        if self.on_sleep is not None:
+            self.on_sleep()
+
+
+def _locked():
+    return OperationalError("INSERT ...", {}, sqlite3.OperationalError("database is locked"))
+
+
+class FlakyWork:
+    """Fails with the given errors, one per call, then succeeds."""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def __call__(self, session):
+        self.calls += 1
+        await session.execute(text("SELECT 1"))
+        if self.errors:
+            raise self.errors.pop(0)
+        return "done"
+
+
+class LockedService:
+    """Fails every update on lock contention."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def update(self, session, obj_id, obj_data, context=None):
+        self.calls += 1
+        raise _locked()
+
+
+@pytest.fixture
+def sleep():
+    return RecordingSleep()
+
+
+@pytest.fixture
+def policy(sleep):
+    return RetryPolicy(max_attempts=3, base_delay=0.1, sleep=sleep, rand=lambda: 1.0)
+
+
+class TestTransactionRetry:
+    async def test_idempotent_work_is_retried_with_backoff(self, file_session_maker, policy, sleep):
+        work = FlakyWork(_locked(), _locked())
+
+        assert await AsyncTransaction.run(work, idempotent=True, retry_policy=policy) == "done"
+        assert work.calls == 3
+        assert sleep.delays == [0.1, 0.2]
+
+    async def test_gives_up_after_max_attempts(self, file_session_maker, policy):
+        work = FlakyWork(_locked(), _locked(), _locked())
+
+        with pytest.raises(ServiceUnavailableException) as exc_info:
+            await AsyncTransaction.run(work, idempotent=True, retry_policy=policy)
+        assert exc_info.value.status_code == 503
+        assert work.calls == 3
+
+    async def test_non_idempotent_work_is_not_retried(self, file_session_maker, policy):
+        work = FlakyWork(_locked())
+
+        with pytest.raises(ServiceUnavailableException):
+            await AsyncTransaction.run(work, retry_policy=policy)
+        assert work.calls == 1
+
+    async def test_other_errors_are_not_retried(self, file_session_maker, policy):
+        work = FlakyWork(IntegrityError("INSERT ...", {}, sqlite3.IntegrityError("UNIQUE constraint failed")))
+
+        with pytest.raises(IntegrityError):
+            await AsyncTransaction.run(work, idempotent=True, retry_policy=policy)
+        assert work.calls == 1
+
+    async def test_joined_transaction_leaves_retry_to_the_unit_of_work(self, file_session_maker, policy):
+        work = FlakyWork(_locked())
+
+        with pytest.raises(OperationalError):
+            async with UnitOfWork():
+                await AsyncTransaction.run(work, idempotent=True, retry_policy=policy)
+        assert work.calls == 1
+
+    @pytest.mark.parametrize("use_case_class, calls", [(BaseUpdateUseCase, 1), (UpdateUserProfileUseCase, 3)])
+    async def test_write_usecases_are_retried_only_when_the_feature_opts_in(
+            self, file_session_maker, policy, monkeypatch, use_case_class, calls
+    ):
+        service = LockedService()
+        use_case = use_case_class(service)
+        monkeypatch.setattr(use_case, "retry_policy", policy)
+
+        with pytest.raises(ServiceUnavailableException):
+            await use_case.execute(uuid.uuid4(), None)
+        assert service.calls == calls
+
+    async def test_usecase_retries_real_lock_contention(self, tmp_path, monkeypatch):
+        path = tmp_path / "locked.db"
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}", connect_args={"timeout": 0})
+        async with engine.begin() as conn:
+            await conn.run_sync(get_base().metadata.create_all)
+        monkeypatch.setattr(AsyncTransaction, "DEFAULT_SESSION_MAKER",
+                            async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False))
+
+        # Another writer holds the database lock until the first backoff.
+        writer = sqlite3.connect(path, isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        sleep = RecordingSleep(on_sleep=writer.rollback)
+        use_case = CreateUserProfileUseCase(UserProfileService(UserProfileRepository()))
+        monkeypatch.setattr(use_case, "retry_policy", RetryPolicy(sleep=sleep))
+
+        profile = await use_case.execute(UserProfileCreate())
+
+        assert len(sleep.delays) == 1
+        async with AsyncTransaction(read_only=True) as session:
+            assert await UserProfileRepository().exists_by_pk(session, profile.id)
+        writer.close()
+        await engine.dispose()
+
+    async def test_create_retried_after_a_failed_commit_inserts_one_row(self, tmp_path, monkeypatch):
+        path = tmp_path / "locked.db"
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}", connect_args={"timeout": 0})
+        install_rollback_after_failed_commit(engine)
+        async with engine.begin() as conn:
+            await conn.run_sync(get_base().metadata.create_all)
+        monkeypatch.setattr(AsyncTransaction, "DEFAULT_SESSION_MAKER",
+                            async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False))
+
+        # A reader's shared lock lets the INSERT run but fails the COMMIT until the first backoff.
+        reader = sqlite3.connect(path, isolation_level=None)
+        reader.execute("BEGIN")
+        reader.execute("SELECT * FROM user_profile").fetchall()
+        sleep = RecordingSleep(on_sleep=reader.rollback)
+        use_case = CreateUserProfileUseCase(UserProfileService(UserProfileRepository()))
+        monkeypatch.setattr(use_case, "retry_policy", RetryPolicy(sleep=sleep))
+
+        profile = await use_case.execute(UserProfileCreate())
+
+        assert len(sleep.delays) == 1
+        async with AsyncTransaction(read_only=True) as session:
+            assert (await session.scalars(select(UserProfileModel.id))).all() == [profile.id]
+        reader.close()
+        await engine.dispose()
@@ -0,0 +1,116 @@
+"""Integration tests for UnitOfWork: usecases join the enclosing transaction and commit once."""
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select
+
+from app.core.database.deps import UnitOfWorkDep
+from app.core.database.transaction import AsyncTransaction, UnitOfWork
+from app.features.user_profile.models import UserProfileModel
+from app.features.user_profile.repos import UserProfileRepository
+from app.features.user_profile.schemas import UserProfileCreate
+from app.features.user_profile.services import UserProfileService
+from app.features.user_profile.usecases.crud import CreateUserProfileUseCase, GetUserProfileUseCase
+from app.features.vocabulary.repos import VocabularyRepository
+from app.features.vocabulary.schemas import VocabularyCreate
+from app.features.vocabulary.services import VocabularyService
+from app.features.vocabulary.usecases.crud import CreateVocabularyUseCase
+
+
+@pytest.fixture
+def create_profile():
+    return CreateUserProfileUseCase(UserProfileService(UserProfileRepository()))
+
+
+@pytest.fixture
+def get_profile():
+    return GetUserProfileUseCase(UserProfileService(UserProfileRepository()))
+
+
+@pytest.fixture
+def create_vocabulary():
+    return CreateVocabularyUseCase(VocabularyService(VocabularyRepository(), UserProfileRepository()))
+
+
+async def _profile_count(session_maker) -> int:
+    async with session_maker() as session:
+        return (await session.execute(select(func.count()).select_from(UserProfileModel))).scalar_one()
+
+
+class TestUnitOfWork:
+    async def test_usecases_share_one_session_and_commit_once(self, file_session_maker, commits, create_profile,
+                                                              get_profile, create_vocabulary):
+        async with UnitOfWork() as session:
+            profile = await create_profile.execute(UserProfileCreate())
+            vocabulary = await create_vocabulary.execute(VocabularyCreate(item="uow", meaning="m"),
+                                                         context={"parent_id": profile.id})
+            assert await get_profile.execute(profile.id) is profile
+            assert vocabulary in session
+            assert commits == []
+
+        assert len(commits) == 1
+
+    async def test_without_unit_of_work_each_usecase_commits(self, file_session_maker, commits, create_profile):
+        await create_profile.execute(UserProfileCreate())
+        await create_profile.execute(UserProfileCreate())
+
+        assert len(commits) == 2
+
+    async def test_error_rolls_back_every_step(self, file_session_maker, create_profile):
+        before = await _profile_count(file_session_maker)
+
+        with pytest.raises(RuntimeError):
+            async with UnitOfWork():
+                await create_profile.execute(UserProfileCreate())
+                await create_profile.execute(UserProfileCreate())
+                raise RuntimeError("boom")
+
+        assert await _profile_count(file_session_maker) == before
+
+    async def test_nested_unit_of_work_joins_the_outer_one(self, file_session_maker, commits):
+        async with UnitOfWork() as outer:
+            async with UnitOfWork() as inner, AsyncTransaction(read_only=True) as joined:
+                assert inner is outer and joined is outer
+        async with AsyncTransaction() as session:
+            assert session is not outer
+
+        assert len(commits) == 2
+
+    async def test_explicit_file_session_maker_does_not_join(self, file_session_maker):
+        async with UnitOfWork() as outer, AsyncTransaction(file_session_maker) as session:
+            assert session is not outer
+
+
+class TestUnitOfWorkDependency:
+    @pytest.fixture
+    def app(self, create_profile):
+        app = FastAPI()
+
+        @app.post("/profiles")
+        async def create_profiles(session: UnitOfWorkDep, fail: bool = False):
+            first = await create_profile.execute(UserProfileCreate())
+            second = await create_profile.execute(UserProfileCreate())
+            if fail:
+                raise RuntimeError("boom")
+            return {"ids": [str(first.id), str(second.id)], "shared": first in session and second in session}
+
+        return app
+
+    async def test_request_commits_once(self, app, file_session_maker, commits):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post("/profiles")
+
+        assert response.status_code == 200
+        assert response.json()["shared"] is True
+        assert len(commits) == 1
+
+    async def test_request_error_rolls_back(self, app, file_session_maker, commits):
+        before = await _profile_count(file_session_maker)
+        transport = ASGITransport(app=app, raise_app_exceptions=False)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/profiles", params={"fail": True})
+
+        assert response.status_code == 500
+        assert commits == []
+        assert await _profile_count(file_session_maker) == before
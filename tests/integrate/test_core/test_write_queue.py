@@ -0,0 +1,173 @@
+"""Integration tests for the single-writer queue: write transactions of usecases, group-committed."""
+
+import asyncio
+import sqlite3
+
+import pytest
+from sqlalchemy import event, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.database.retry import RetryPolicy
+from app.core.database.sqlite import install_immediate_transactions, install_rollback_after_failed_commit
+from app.core.database.transaction import AsyncTransaction, UnitOfWork
+from app.core.database.writer import WriteScheduler
+from app.features.user_profile.models import UserProfileModel
+from app.features.user_profile.repos import UserProfileRepository
+from app.features.user_profile.schemas import UserProfileCreate
+from app.features.user_profile.services import UserProfileService
+from app.features.user_profile.usecases.crud import CreateUserProfileUseCase, GetUserProfileUseCase
+
+
+@pytest.fixture
+def scheduler_connect_args():
+    return {}
+
+
+@pytest.fixture
+async def scheduler(file_session_maker, scheduler_connect_args, monkeypatch):
+    """A write queue on the test's SQLite file, used by AsyncTransaction.run."""
+    engine = create_async_engine(file_session_maker.kw["bind"].url, pool_size=1, max_overflow=0,
+                                 connect_args=scheduler_connect_args)
+    install_immediate_transactions(engine)
+    install_rollback_after_failed_commit(engine)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT NOT NULL)"))
+    scheduler = WriteScheduler(async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False))
+    monkeypatch.setattr(AsyncTransaction, "WRITE_SCHEDULER", scheduler)
+    yield scheduler
+    await scheduler.stop()
+    await engine.dispose()
+
+
+@pytest.fixture
+def transaction_commits(scheduler):
+    """Commits on the write queue's connection, in order."""
+    recorded = []
+
+    def record(conn):
+        recorded.append(conn)
+
+    event.listen(scheduler._session_maker.kw["bind"].sync_engine, "commit", record)
+    yield recorded
+    event.remove(scheduler._session_maker.kw["bind"].sync_engine, "commit", record)
+
+
+def insert(note_id, body="note"):
+    async def work(session):
+        await session.execute(text("INSERT INTO notes (id, body) VALUES (:id, :body)"), {"id": note_id, "body": body})
+        return note_id
+
+    return work
+
+
+async def note_ids(session_maker):
+    async with session_maker() as session:
+        return [row[0] for row in await session.execute(text("SELECT id FROM notes ORDER BY id"))]
+
+
+class TestWriteScheduler:
+    async def test_queued_idempotent_writes_share_one_commit(self, scheduler, transaction_commits, file_session_maker):
+        results = await asyncio.gather(*(scheduler.submit(insert(i), groupable=True) for i in range(1, 6)))
+
+        assert results == [1, 2, 3, 4, 5]
+        assert len(transaction_commits) == 1
+        assert (scheduler.transactions, scheduler.jobs) == (1, 5)
+        assert await note_ids(file_session_maker) == [1, 2, 3, 4, 5]
+
+    async def test_failing_job_is_rolled_back_alone(self, scheduler, transaction_commits, file_session_maker):
+        async def half_done(session):
+            await insert(10)(session)
+            await insert(1)(session)  # duplicate key
+
+        results = await asyncio.gather(
+            scheduler.submit(insert(1), groupable=True),
+            scheduler.submit(half_done, groupable=True),
+            scheduler.submit(insert(2), groupable=True),
+            return_exceptions=True,
+        )
+
+        assert results[0] == 1 and results[2] == 2
+        assert isinstance(results[1], Exception)
+        assert len(transaction_commits) == 1
+        assert await note_ids(file_session_maker) == [1, 2]
+
+    async def test_non_groupable_jobs_commit_alone(self, scheduler, transaction_commits, file_session_maker):
+        await asyncio.gather(
+            scheduler.submit(insert(1), groupable=True),
+            scheduler.submit(insert(2), groupable=True),
+            scheduler.submit(insert(3)),
+            scheduler.submit(insert(4), groupable=True),
+        )
+
+        assert len(transaction_commits) == 3
+        assert await note_ids(file_session_maker) == [1, 2, 3, 4]
+
+    async def test_single_failing_job_commits_nothing(self, scheduler, transaction_commits, file_session_maker):
+        async def half_done(session):
+            await insert(1)(session)
+            raise ValueError("invalid")
+
+        with pytest.raises(ValueError):
+            await scheduler.submit(half_done)
+
+        assert transaction_commits == []
+        assert await note_ids(file_session_maker) == []
+
+    async def test_stop_drains_the_queue(self, scheduler, file_session_maker):
+        pending = [asyncio.ensure_future(scheduler.submit(insert(i), groupable=True)) for i in range(1, 4)]
+        await asyncio.sleep(0)
+
+        await scheduler.stop()
+
+        assert [job.result() for job in pending] == [1, 2, 3]
+        assert await note_ids(file_session_maker) == [1, 2, 3]
+
+
+class TestTransactionRunQueuesWrites:
+    async def test_usecase_writes_go_through_the_queue(self, scheduler):
+        use_case = CreateUserProfileUseCase(UserProfileService(UserProfileRepository()))
+
+        profiles = await asyncio.gather(*(use_case.execute(UserProfileCreate()) for _ in range(3)))
+
+        assert (scheduler.transactions, scheduler.jobs) == (1, 3)
+        async with AsyncTransaction(read_only=True) as session:
+            for profile in profiles:
+                assert await UserProfileRepository().exists_by_pk(session, profile.id)
+
+    async def test_reads_and_joined_writes_skip_the_queue(self, scheduler):
+        service = UserProfileService(UserProfileRepository())
+
+        async with UnitOfWork():
+            profile = await CreateUserProfileUseCase(service).execute(UserProfileCreate())
+        await GetUserProfileUseCase(service).execute(profile.id)
+
+        assert scheduler.jobs == 0
+
+
+class TestQueuedWritesRetry:
+    @pytest.fixture
+    def scheduler_connect_args(self):
+        return {"timeout": 0}
+
+    async def test_creates_retried_after_a_failed_group_commit_insert_one_row_each(self, scheduler,
+                                                                                  file_session_maker, monkeypatch):
+        # A reader's shared lock lets the group's INSERTs run but fails its COMMIT until the first backoff.
+        reader = sqlite3.connect(file_session_maker.kw["bind"].url.database, isolation_level=None)
+        reader.execute("BEGIN")
+        reader.execute("SELECT * FROM user_profile").fetchall()
+        delays = []
+
+        async def sleep(delay):
+            delays.append(delay)
+            reader.rollback()
+
+        use_case = CreateUserProfileUseCase(UserProfileService(UserProfileRepository()))
+        monkeypatch.setattr(use_case, "retry_policy", RetryPolicy(sleep=sleep))
+
+        profiles = await asyncio.gather(*(use_case.execute(UserProfileCreate()) for _ in range(2)))
+
+        assert len(delays) == 2
+        async with file_session_maker() as session:
+            ids = (await session.scalars(select(UserProfileModel.id))).all()
+        assert sorted(ids) == sorted(profile.id for profile in profiles)
+        reader.close()
@@ -0,0 +1,42 @@
+"""Integration tests for app.features.vocabulary.repos against a real database."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.features.user_profile.repos import UserProfileRepository
+from app.features.user_profile.schemas import UserProfileCreate
+from app.features.vocabulary.repos import VocabularyRepository
+from app.features.vocabulary.schemas import VocabularyCreate
+
+
+@pytest.fixture
+def repo():
+    return VocabularyRepository()
+
+
+@pytest.fixture
+async def vocabularies(session, repo):
+    profile = await UserProfileRepository().create(session, UserProfileCreate())
+    now = datetime.now(timezone.utc)
+    reviews = [None, now - timedelta(days=2), now - timedelta(days=1), now + timedelta(days=1)]
+    return [
+        await repo.create(
+            session, VocabularyCreate(item=f"word{i}", meaning="m", next_review_at=next_review_at),
+            user_profile_id=profile.id,
+        )
+        for i, next_review_at in enumerate(reviews)
+    ]
+
+
+class TestGetDueForReview:
+    """get_due_for_review runs a cached statement with fresh bound parameters on every call."""
+
+    async def test_returns_due_items_in_review_order(self, session, repo, vocabularies):
+        due = await repo.get_due_for_review(session)
+
+        assert [v.item for v in due] == ["word0", "word1", "word2"]
+
+    async def test_limit_is_bound_per_call(self, session, repo, vocabularies):
+        assert len(await repo.get_due_for_review(session, limit=1)) == 1
+        assert len(await repo.get_due_for_review(session, limit=2)) == 2
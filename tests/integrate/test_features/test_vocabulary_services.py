@@ -0,0 +1,328 @@
+"""Integration tests for unique constraint checks, batch operations and read caching in VocabularyService."""
+
+import uuid
+
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.base.exceptions.basic import BadRequestException, NotFoundException
+from app.base.services.cached_read_hook import ReadCache
+from app.core.database.transaction import READ_ONLY_KEY
+from app.features.user_profile.models import UserProfileModel
+from app.features.user_profile.repos import UserProfileRepository
+from app.features.user_profile.schemas import UserProfileCreate
+from app.features.vocabulary.models import VocabularyModel
+from app.features.vocabulary.repos import VocabularyRepository
+from app.features.vocabulary.schemas import VocabularyCreate, VocabularyUpdate
+from app.features.vocabulary.services import VocabularyService
+from tests.fixtures.db import get_base
+
+
+class PreCheckVocabularyService(VocabularyService):
+    optimistic_unique_checks = False
+
+    async def _unique_constraints(self, obj_data, context):
+        if obj_data.meaning is not None:
+            yield VocabularyModel.meaning == obj_data.meaning, "Meaning already exists."
+        async for item in super()._unique_constraints(obj_data, context):
+            yield item
+
+
+@pytest.fixture
+async def profile(session):
+    return await UserProfileRepository().create(session, UserProfileCreate())
+
+
+@pytest.fixture
+async def existing(session, profile):
+    service = VocabularyService(VocabularyRepository(), UserProfileRepository())
+    return await service.create(session, VocabularyCreate(item="apple", meaning="fruit"),
+                                context={"parent_id": profile.id})
+
+
+@pytest.fixture
+def statements(session):
+    recorded = []
+
+    def record(conn, cursor, statement, *args):
+        recorded.append(statement)
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    yield recorded
+    event.remove(engine, "before_cursor_execute", record)
+
+
+class TestUniqueConstraintPreCheck:
+    """All constraints are checked with one query before the write."""
+
+    @pytest.mark.parametrize("obj_data, message", [
+        (VocabularyCreate(item="apple", meaning="other"), "Vocabulary item already exists."),
+        (VocabularyCreate(item="pear", meaning="fruit"), "Meaning already exists."),
+    ])
+    async def test_reports_violated_constraint_in_one_query(self, session, profile, existing, statements,
+                                                            obj_data, message):
+        service = PreCheckVocabularyService(VocabularyRepository(), UserProfileRepository())
+        with pytest.raises(BadRequestException, match=message):
+            await service.create(session, obj_data, context={"parent_id": profile.id})
+
+        assert len([s for s in statements if "EXISTS" in s]) == 1
+
+    async def test_update_excludes_current_object(self, session, profile, existing):
+        service = PreCheckVocabularyService(VocabularyRepository(), UserProfileRepository())
+        updated = await service.update(session, existing.id, VocabularyUpdate(item="apple", meaning="fruit"),
+                                       context={"parent_id": profile.id})
+        assert updated.item == "apple"
+
+
+class TestUniqueConstraintOptimistic:
+    """Optimistic mode skips the pre-check and maps the IntegrityError to the constraint message."""
+
+    async def test_duplicate_insert_maps_integrity_error(self, session, profile, existing, statements):
+        service = VocabularyService(VocabularyRepository(), UserProfileRepository())
+        with pytest.raises(BadRequestException, match="Vocabulary item already exists."):
+            await service.create(session, VocabularyCreate(item="apple", meaning="m"),
+                                 context={"parent_id": profile.id})
+
+        assert not [s for s in statements if "EXISTS" in s]
+
+    async def test_not_null_violation_on_a_constrained_column_is_reraised(self, session, profile):
+        service = VocabularyService(VocabularyRepository(), UserProfileRepository())
+        obj_data = VocabularyCreate(item="pear", meaning="m")
+
+        # "NOT NULL constraint failed: vocabulary.item" names the item column, but is no duplicate.
+        with pytest.raises(IntegrityError, match="NOT NULL"):
+            async with service._translate_integrity_error([obj_data], {}):
+                await session.execute(insert(VocabularyModel).values(
+                    id=uuid.uuid4(), item=None, meaning="m", user_profile_id=profile.id,
+                ))
+
+    async def test_foreign_key_violation_is_reraised(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def enforce_foreign_keys(dbapi_connection, connection_record):
+            dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+        async with engine.begin() as conn:
+            await conn.run_sync(get_base().metadata.create_all)
+        service = VocabularyService(VocabularyRepository(), UserProfileRepository())
+        obj_data = VocabularyCreate(item="pear", meaning="m")
+
+        async with async_sessionmaker(engine)() as session:
+            with pytest.raises(IntegrityError, match="FOREIGN KEY"):
+                async with service._translate_integrity_error([obj_data], {}):
+                    await VocabularyRepository().create(session, obj_data, user_profile_id=uuid.uuid4())
+        await engine.dispose()
+
+
+class OwnershipCheckVocabularyService(VocabularyService):
+    fuse_ownership_checks = False
+
+
+def _service(cls=VocabularyService):
+    return cls(VocabularyRepository(), UserProfileRepository())
+
+
+class TestBatchOperations:
+    """Batch operations run every hook once for the whole batch."""
+
+    @pytest.fixture
+    async def other_profile(self, session):
+        return await UserProfileRepository().create(session, UserProfileCreate())
+
+    async def test_create_many_checks_parent_once(self, session, profile, statements):
+        objs_data = [VocabularyCreate(item=f"item-{i}", meaning="m") for i in range(3)]
+
+        created = await _service().create_many(session, objs_data, context={"parent_id": profile.id})
+
+        assert [obj.item for obj in created] == ["item-0", "item-1", "item-2"]
+        assert {obj.user_profile_id for obj in created} == {profile.id}
+        assert len(statements) == 2  # parent exists + one multi-row INSERT
+
+    async def test_create_many_pre_check_is_one_query(self, session, profile, existing, statements):
+        objs_data = [VocabularyCreate(item="pear", meaning="m"), VocabularyCreate(item="apple", meaning="n")]
+
+        with pytest.raises(BadRequestException, match="Vocabulary item already exists."):
+            await _service(PreCheckVocabularyService).create_many(session, objs_data,
+                                                                 context={"parent_id": profile.id})
+        assert len([s for s in statements if "EXISTS" in s]) == 1
+
+    async def test_create_many_optimistic_maps_integrity_error(self, session, profile, existing):
+        objs_data = [VocabularyCreate(item="pear", meaning="m"), VocabularyCreate(item="apple", meaning="n")]
+
+        with pytest.raises(BadRequestException, match="Vocabulary item already exists."):
+            await _service().create_many(session, objs_data, context={"parent_id": profile.id})
+
+    async def test_update_many_fuses_ownership(self, session, profile, other_profile, existing):
+        foreign = await _service().create(session, VocabularyCreate(item="kiwi", meaning="m"),
+                                          context={"parent_id": other_profile.id})
+
+        updated = await _service(PreCheckVocabularyService).update_many(
+            session, {existing.id: VocabularyUpdate(meaning="red fruit"), foreign.id: VocabularyUpdate(meaning="x")},
+            context={"parent_id": profile.id},
+        )
+
+        assert [obj.meaning if obj else None for obj in updated] == ["red fruit", None]
+        assert foreign.meaning == "m"
+
+    async def test_update_many_shares_one_statement_per_distinct_payload(self, session, profile, existing,
+                                                                          statements):
+        context = {"parent_id": profile.id}
+        pear, plum = [
+            await _service().create(session, VocabularyCreate(item=item, meaning="m"), context=context)
+            for item in ("pear", "plum")
+        ]
+        statements.clear()
+
+        updated = await _service().update_many(session, {
+            pear.id: VocabularyUpdate(mastery_level=2),
+            uuid.uuid4(): VocabularyUpdate(mastery_level=2),
+            existing.id: VocabularyUpdate(meaning="red fruit"),
+            plum.id: VocabularyUpdate(mastery_level=2),
+        }, context=context)
+
+        assert [(obj.item, obj.mastery_level, obj.meaning) if obj else None for obj in updated] == [
+            ("pear", 2, "m"), None, ("apple", existing.mastery_level, "red fruit"), ("plum", 2, "m"),
+        ]
+        assert len([s for s in statements if s.startswith("UPDATE")]) == 2
+
+    async def test_delete_many_is_one_statement(self, session, profile, other_profile, existing, statements):
+        foreign = await _service().create(session, VocabularyCreate(item="kiwi", meaning="m"),
+                                          context={"parent_id": other_profile.id})
+        statements.clear()
+
+        deleted = await _service().delete_many(session, [existing.id, foreign.id, uuid.uuid4()],
+                                               context={"parent_id": profile.id})
+
+        assert deleted == 1
+        assert len(statements) == 1 and statements[0].startswith("DELETE")
+        assert await VocabularyRepository().exists_by_pk(session, foreign.id)
+
+    async def test_unfused_ownership_is_checked_with_one_query(self, session, profile, other_profile, existing,
+                                                                statements):
+        foreign = await _service().create(session, VocabularyCreate(item="kiwi", meaning="m"),
+                                          context={"parent_id": other_profile.id})
+        session.expunge_all()
+        statements.clear()
+
+        with pytest.raises(NotFoundException):
+            await _service(OwnershipCheckVocabularyService).delete_many(
+                session, [existing.id, foreign.id], context={"parent_id": profile.id}
+            )
+        assert len(statements) == 1 and statements[0].startswith("SELECT")
+
+
+class TestReadCache:
+    """get in read-only transactions is served from the read cache until the row is written."""
+
+    @pytest.fixture
+    async def stored(self, session, profile):
+        # Written through the repository: rows the service wrote in this transaction are not cached.
+        return await VocabularyRepository().create(session, VocabularyCreate(item="fig", meaning="m"),
+                                                   user_profile_id=profile.id)
+
+    @staticmethod
+    async def _read(session, obj_id, parent_id):
+        """A get as a read-only transaction makes it; the test session stays writable around it."""
+        session.info[READ_ONLY_KEY] = True
+        try:
+            return await _service().get(session, obj_id, context={"parent_id": parent_id})
+        finally:
+            del session.info[READ_ONLY_KEY]
+
+    async def test_hit_avoids_sql(self, session, profile, stored, statements):
+        await self._read(session, stored.id, profile.id)
+        session.expunge_all()
+        statements.clear()
+
+        obj = await self._read(session, stored.id, profile.id)
+
+        assert obj.item == "fig"
+        assert statements == []
+
+    async def test_hit_still_checks_ownership(self, session, profile, stored, statements):
+        other = await UserProfileRepository().create(session, UserProfileCreate())
+        await self._read(session, stored.id, profile.id)
+        session.expunge_all()
+        statements.clear()
+
+        assert await self._read(session, stored.id, other.id) is None
+        assert statements == []
+
+    async def test_write_transactions_bypass_the_cache(self, session, profile, stored, statements):
+        await self._read(session, stored.id, profile.id)
+        session.expunge_all()
+        statements.clear()
+
+        obj = await _service().get(session, stored.id, context={"parent_id": profile.id})
+
+        assert obj.item == "fig"
+        assert len(statements) == 1
+        assert ReadCache.key(VocabularyModel, stored.id) in VocabularyService.read_cache
+
+    async def test_update_invalidates(self, session, profile, stored):
+        context = {"parent_id": profile.id}
+        await self._read(session, stored.id, profile.id)
+        await _service().update(session, stored.id, VocabularyUpdate(meaning="red fruit"), context=context)
+        session.expunge_all()
+
+        assert (await self._read(session, stored.id, profile.id)).meaning == "red fruit"
+
+    @pytest.mark.parametrize("write, meaning", [
+        (lambda repo, session, obj: repo.update_where(session, repo.model.item == "fig", {"meaning": "new"}), "new"),
+        (lambda repo, session, obj: repo.update_by_pks(session, {obj.id: {"meaning": "new"}}), "new"),
+        (lambda repo, session, obj: repo.upsert_many(
+            session, [{"id": obj.id, "item": "fig", "meaning": "new", "user_profile_id": obj.user_profile_id}],
+            conflict_cols=["id"],
+        ), "new"),
+        (lambda repo, session, obj: repo.delete_where(session, repo.model.item == "fig"), None),
+        (lambda repo, session, obj: repo.delete_by_pks(session, [obj.id]), None),
+    ], ids=["update_where", "update_by_pks", "upsert_many", "delete_where", "delete_by_pks"])
+    async def test_bulk_write_invalidates(self, session, profile, stored, write, meaning):
+        await self._read(session, stored.id, profile.id)
+        session.expunge_all()
+
+        await write(VocabularyRepository(), session, stored)
+        session.expunge_all()
+
+        obj = await self._read(session, stored.id, profile.id)
+        assert (obj.meaning if obj else None) == meaning
+
+    async def test_cascaded_delete_of_the_parent_invalidates(self, session, profile, stored):
+        await self._read(session, stored.id, profile.id)
+
+        await session.delete(await session.get(UserProfileModel, profile.id))
+        await session.flush()
+        session.expunge_all()
+
+        assert await self._read(session, stored.id, profile.id) is None
+
+    async def test_bulk_delete_of_the_parent_evicts_its_children(self, session, profile, stored):
+        await self._read(session, stored.id, profile.id)
+
+        await UserProfileRepository().delete_where(session, UserProfileModel.id == profile.id)
+
+        assert ReadCache.key(VocabularyModel, stored.id) not in VocabularyService.read_cache
+
+    async def test_rows_written_in_the_transaction_are_not_cached(self, session, profile, stored):
+        context = {"parent_id": profile.id}
+        key = ReadCache.key(VocabularyModel, stored.id)
+        await _service().update(session, stored.id, VocabularyUpdate(meaning="red fruit"), context=context)
+        await self._read(session, stored.id, profile.id)
+        assert key not in VocabularyService.read_cache
+
+        await session.rollback()
+
+        assert key not in VocabularyService.read_cache
+
+    async def test_parent_existence_is_cached(self, session, profile, statements):
+        context = {"parent_id": profile.id}
+        await _service().create(session, VocabularyCreate(item="pear", meaning="m"), context=context)
+        statements.clear()
+
+        await _service().create(session, VocabularyCreate(item="plum", meaning="m"), context=context)
+
+        assert [s.split()[0] for s in statements] == ["INSERT"]
@@ -105,9 +105,25 @@ def mock_async_session():
     session.refresh = AsyncMock()
     session.add = MagicMock()
     session.get = AsyncMock()
+    session.info = {}
+    # A database without RETURNING support, so repositories take the portable code paths.
+    bind = MagicMock()
+    bind.dialect.name = "sqlite"
+    bind.dialect.insert_returning = False
+    bind.dialect.update_returning = False
+    bind.dialect.delete_returning = False
+    session.get_bind = MagicMock(return_value=bind)
     return session
 
 
+@pytest.fixture
+def returning_session(mock_async_session):
+    """Mocked async session for a database that supports RETURNING."""
+    dialect = mock_async_session.get_bind.return_value.dialect
+    dialect.insert_returning = dialect.update_returning = dialect.delete_returning = True
+    return mock_async_session
+
+
 @pytest.fixture
 def sample_uuid():
     """Provide a consistent UUID for testing."""
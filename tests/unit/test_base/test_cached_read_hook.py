@@ -0,0 +1,36 @@
+"""Unit tests for app.base.services.cached_read_hook module."""
+
+import uuid
+
+from app.base.services.cached_read_hook import ReadCache
+from tests.unit.test_base.conftest import MockModel
+
+
+class TestReadCache:
+    """Tests for the snapshot cache itself."""
+
+    def test_counts_hits_and_misses(self):
+        cache = ReadCache()
+        key = ReadCache.key(MockModel, uuid.uuid4())
+
+        assert cache.get(key) is None
+        cache.set(key, {"name": "a"})
+        assert cache.get(key) == {"name": "a"}
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_keys_normalize_pk(self):
+        pk = uuid.uuid4()
+        assert ReadCache.key(MockModel, pk) == ReadCache.key(MockModel, (pk,)) == ReadCache.key(MockModel, [pk])
+        assert ReadCache.exists_key(MockModel, pk) != ReadCache.key(MockModel, pk)
+
+    def test_custom_backend(self):
+        backend = {}
+        cache = ReadCache(backend=backend)
+        key = ReadCache.key(MockModel, 1)
+
+        cache.set(key, {"name": "a"})
+        assert backend == {key: {"name": "a"}}
+
+        cache.delete(key)
+        cache.delete(key)
+        assert key not in cache and len(cache) == 0
@@ -0,0 +1,16 @@
+"""Unit tests for app.base.deps.params.fields module."""
+
+from app.base.deps.params.fields import fields_params
+
+
+class TestFieldsParams:
+    """Tests for the ?fields= query parameter parser."""
+
+    def test_none_when_omitted(self):
+        """Should request every field when the parameter is absent or empty."""
+        assert fields_params(None) is None
+        assert fields_params("") is None
+
+    def test_splits_and_strips(self):
+        """Should split on commas and ignore blanks."""
+        assert fields_params(" item, meaning ,,") == ["item", "meaning"]
@@ -0,0 +1,32 @@
+"""Unit tests for app.base.deps.params.ids module."""
+
+import uuid
+
+import pytest
+from fastapi.exceptions import RequestValidationError
+
+from app.base.deps.params.ids import ids_params, MAX_IDS
+
+
+class TestIdsParams:
+    """Tests for the ?ids= query parameter parser."""
+
+    def test_none_when_omitted(self):
+        """Should fall back to pagination when the parameter is absent."""
+        assert ids_params(None) is None
+
+    def test_parses_uuids_in_order(self):
+        """Should parse comma-separated UUIDs, keeping their order."""
+        first, second = uuid.uuid4(), uuid.uuid4()
+        assert ids_params(f"{second}, {first}") == [second, first]
+
+    def test_invalid_uuid_is_a_validation_error(self):
+        """Should raise a 422 validation error pointing at the bad entry."""
+        with pytest.raises(RequestValidationError) as exc_info:
+            ids_params(f"{uuid.uuid4()},bad")
+        assert exc_info.value.errors()[0]["loc"] == ("query", "ids", 1)
+
+    def test_too_many_ids(self):
+        """Should cap the number of ids per request."""
+        with pytest.raises(RequestValidationError):
+            ids_params(",".join(str(uuid.uuid4()) for _ in range(MAX_IDS + 1)))
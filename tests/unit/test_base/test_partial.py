@@ -0,0 +1,44 @@
+"""Unit tests for app.base.schemas.partial module."""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+from app.base.schemas.partial import partial_schema
+
+
+class ItemRead(BaseModel):
+    id: int
+    name: str
+    description: Optional[str]
+
+
+ItemPartialRead = partial_schema(ItemRead)
+
+
+class TestPartialSchema:
+    """Tests for partial_schema and its sparse fieldset validation."""
+
+    def test_all_fields_optional(self):
+        """Should accept an empty payload."""
+        assert ItemPartialRead().model_dump() == {"id": None, "name": None, "description": None}
+
+    def test_default_name(self):
+        """Should prefix the source schema name."""
+        assert ItemPartialRead.__name__ == "PartialItemRead"
+
+    def test_model_validate_fields_sets_only_requested(self):
+        """Should mark only the requested fields (and id) as set."""
+        obj = ItemRead(id=1, name="a", description="b")
+
+        partial = ItemPartialRead.model_validate_fields(obj, ["name"])
+
+        assert partial.model_dump(exclude_unset=True) == {"id": 1, "name": "a"}
+
+    def test_model_validate_fields_without_fields(self):
+        """Should set every field when no fieldset is requested."""
+        obj = ItemRead(id=1, name="a", description=None)
+
+        partial = ItemPartialRead.model_validate_fields(obj)
+
+        assert partial.model_dump(exclude_unset=True) == {"id": 1, "name": "a", "description": None}
@@ -0,0 +1,111 @@
+"""Unit tests for app.base.services.pipeline (flattened service hook chains)."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.base.services.base import BaseContextKwargs, BaseCreateHooks, BaseCreateServiceMixin, BaseGetServiceMixin
+from app.base.services.pipeline import hook_stage
+
+
+def _recording_mixin(label: str, calls: list[str]):
+    class Mixin(BaseCreateHooks):
+        @hook_stage
+        async def _context_create(self, session, obj_data, context):
+            calls.append(f"enter {label}")
+            try:
+                yield
+            finally:
+                calls.append(f"exit {label}")
+
+    Mixin.__name__ = f"Mixin{label}"
+    return Mixin
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def service_class(calls):
+    outer, inner = _recording_mixin("A", calls), _recording_mixin("B", calls)
+
+    class Service(outer, inner, BaseCreateServiceMixin):
+        context_model = BaseContextKwargs
+
+        def __init__(self):
+            self._repo = AsyncMock()
+            self._repo.create.side_effect = lambda *args, **kwargs: calls.append("create") or "obj"
+
+        @property
+        def repo(self):
+            return self._repo
+
+    return Service
+
+
+class TestHookPipeline:
+    """Flattened stages run in the same order as the cooperative super() chain."""
+
+    async def test_pipeline_matches_super_chain_order(self, service_class, calls):
+        service = service_class()
+
+        assert await service.create(None, {}) == "obj"
+        flat = list(calls)
+
+        calls.clear()
+        async with service._context_create(None, {}, context={}):
+            calls.append("create")
+
+        assert flat == calls == ["enter B", "enter A", "create", "exit A", "exit B"]
+        assert len(service_class._hook_pipeline["_context_create"]) == 2
+
+    async def test_no_op_base_hooks_are_skipped(self):
+        class Plain(BaseGetServiceMixin):
+            context_model = BaseContextKwargs
+            repo = None
+
+        assert Plain._hook_pipeline["_context_get"] == ()
+        assert Plain._hook_pipeline["_post_get"] is None
+
+    async def test_exception_unwinds_entered_stages(self, service_class, calls):
+        service = service_class()
+        service.repo.create.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await service.create(None, {})
+
+        assert calls == ["enter B", "enter A", "exit A", "exit B"]
+
+    async def test_plain_super_hook_still_runs_the_rest_of_the_chain(self, service_class, calls):
+        class Legacy(service_class):
+            @asynccontextmanager
+            async def _context_create(self, session, obj_data, context):
+                async with super()._context_create(session, obj_data, context):
+                    calls.append("enter legacy")
+                    yield
+
+        await Legacy().create(None, {})
+
+        assert calls == ["enter B", "enter A", "enter legacy", "create", "exit A", "exit B"]
+
+    async def test_outer_stage_sees_exception_translated_by_inner_stage(self, service_class, calls):
+        class Translating(BaseCreateHooks):
+            @hook_stage
+            async def _context_create(self, session, obj_data, context):
+                try:
+                    yield
+                except RuntimeError as e:
+                    raise ValueError("translated") from e
+
+        class Service(Translating, service_class):
+            pass
+
+        service = Service()
+        service.repo.create.side_effect = RuntimeError("boom")
+
+        with pytest.raises(ValueError, match="translated"):
+            await service.create(None, {})
+        assert calls == ["enter B", "enter A", "exit A", "exit B"]
@@ -1,10 +1,12 @@
 """Unit tests for app.base.repos.base module."""
 
+import datetime
 import uuid
 from unittest.mock import MagicMock
 
 import pytest
 
+from app.base.repos.count import CountStrategy
 from app.base.schemas.paginated import PaginatedList
 
 
@@ -80,6 +82,59 @@ class TestBaseRepositorySelect:
         assert stmt is not None
 
 
+class TestBaseRepositoryStatementCache:
+    """Tests for _cached_statement."""
+
+    def test_statement_built_once_per_repository(self, mock_repository):
+        """Should reuse the cached construct across repository instances."""
+        from tests.unit.test_base.conftest import MockRepository
+        assert MockRepository()._select() is mock_repository._select()
+
+    def test_cache_is_keyed_by_model(self, mock_repository, mock_soft_delete_repository):
+        """Should not share statements between repositories of different models."""
+        assert mock_repository._select() is not mock_soft_delete_repository._select()
+
+    def test_where_does_not_modify_cached_statement(self, mock_repository):
+        """Should leave the cached statement untouched when adding criteria."""
+        from tests.unit.test_base.conftest import MockModel
+        base = mock_repository._select()
+        filtered = mock_repository._select(where=[MockModel.name == "test"])
+
+        assert filtered is not base
+        assert "WHERE" not in str(base)
+
+
+class TestBaseRepositoryFields:
+    """Tests for sparse fieldset (load_only) projection."""
+
+    def test_no_fields_adds_no_options(self, mock_repository):
+        """Should load every column when fields is None."""
+        assert mock_repository._load_options(None) == []
+
+    def test_fields_always_include_primary_key(self, mock_repository):
+        """Should project the requested columns plus the primary key."""
+        stmt = mock_repository._select(fields=["name"])
+        sql = str(stmt.compile())
+
+        assert "mock_items.name" in sql
+        assert "mock_items.id" in sql
+        assert "mock_items.description" not in sql
+
+    def test_unknown_field_raises(self, mock_repository):
+        """Should reject fields that are not columns of the model."""
+        with pytest.raises(ValueError, match="Unknown fields"):
+            mock_repository._load_options(["name", "missing"])
+
+    @pytest.mark.asyncio
+    async def test_get_by_pk_passes_load_options(self, mock_repository, mock_async_session, mock_model, sample_uuid):
+        """Should forward load_only options to session.get."""
+        mock_async_session.get.return_value = mock_model
+
+        await mock_repository.get_by_pk(mock_async_session, sample_uuid, fields=["name"])
+
+        assert len(mock_async_session.get.call_args.kwargs["options"]) == 1
+
+
 class TestBaseRepositoryGet:
     """Tests for get operations."""
 
@@ -117,6 +172,12 @@ class TestBaseRepositoryGet:
         assert result == mock_model
         mock_async_session.get.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_by_pks_validates_primary_keys(self, mock_repository, mock_async_session, sample_uuid):
+        """Should reject primary keys with the wrong number of values."""
+        with pytest.raises(ValueError, match="Incorrect number of primary key values"):
+            await mock_repository.get_by_pks(mock_async_session, [[sample_uuid, sample_uuid]])
+
     @pytest.mark.asyncio
     async def test_get_by_pk_with_sequence_pk(self, mock_repository, mock_async_session, mock_model, sample_uuid):
         """Should handle sequence of PK values."""
@@ -195,6 +256,106 @@ class TestBaseRepositoryCreate:
         assert added_model.id == extra_id
 
 
+class TestBaseRepositoryBulkCreate:
+    """Tests for create_many / upsert_many."""
+
+    @pytest.fixture
+    def sqlite_session(self, returning_session):
+        return returning_session
+
+    @pytest.mark.asyncio
+    async def test_create_many_empty_does_not_execute(self, mock_repository, sqlite_session):
+        """Should return an empty list without touching the database."""
+        assert await mock_repository.create_many(sqlite_session, []) == []
+        sqlite_session.scalars.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_many_chunks_under_parameter_limit(
+            self, mock_repository, sqlite_session, mock_create_schema, monkeypatch
+    ):
+        """Should split rows into statements that stay under the bound parameter limit."""
+        # MockModel has 5 columns, so 10 parameters allow 2 rows per statement.
+        monkeypatch.setattr(type(mock_repository), "max_bind_params", {"sqlite": 10})
+
+        result = await mock_repository.create_many(sqlite_session, [mock_create_schema] * 5, returning=False)
+
+        assert result == 5
+        chunk_sizes = [len(call.args[1]) for call in sqlite_session.execute.call_args_list]
+        assert chunk_sizes == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_create_many_applies_update_fields(self, mock_repository, sqlite_session, mock_create_schema):
+        """Should merge extra fields into every row."""
+        await mock_repository.create_many(sqlite_session, [mock_create_schema, {"name": "x"}], returning=False,
+                                          description="shared")
+
+        rows = sqlite_session.execute.call_args.args[1]
+        assert [row["description"] for row in rows] == ["shared", "shared"]
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_rejects_unsupported_dialect(self, mock_repository, sqlite_session, mock_create_schema):
+        """Should raise NotImplementedError for dialects without ON CONFLICT."""
+        sqlite_session.get_bind.return_value.dialect.name = "mssql"
+        with pytest.raises(NotImplementedError):
+            await mock_repository.upsert_many(sqlite_session, [mock_create_schema], conflict_cols=["name"])
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_rejects_mixed_columns(self, mock_repository, sqlite_session):
+        """Should require every row to provide the same columns."""
+        with pytest.raises(ValueError, match="same columns"):
+            await mock_repository.upsert_many(sqlite_session, [{"name": "a"}, {"name": "b", "description": "c"}],
+                                              conflict_cols=["name"])
+
+
+class TestBaseRepositoryReturning:
+    """Tests for the RETURNING fast paths of create / update_by_pk."""
+
+    @pytest.mark.asyncio
+    async def test_create_uses_insert_returning(self, mock_repository, returning_session, mock_create_schema,
+                                                mock_model):
+        """Should insert and hydrate the object in one statement, without flush/refresh."""
+        returning_session.scalars.return_value.one = MagicMock(return_value=mock_model)
+
+        result = await mock_repository.create(returning_session, mock_create_schema)
+
+        assert result is mock_model
+        stmt = returning_session.scalars.call_args.args[0]
+        assert "RETURNING" in str(stmt.compile())
+        returning_session.add.assert_not_called()
+        returning_session.refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_by_pk_uses_update_returning(self, mock_repository, returning_session, mock_model,
+                                                      sample_uuid):
+        """Should update and return the row in one statement instead of re-selecting it."""
+        returning_session.scalars.return_value.one_or_none = MagicMock(return_value=mock_model)
+
+        result = await mock_repository.update_by_pk(returning_session, sample_uuid, {"name": "Updated"})
+
+        assert result is mock_model
+        returning_session.scalars.assert_called_once()
+        returning_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_by_pk_returning_none_when_not_found(self, mock_repository, returning_session,
+                                                              sample_uuid):
+        """Should return None when RETURNING yields no row."""
+        returning_session.scalars.return_value.one_or_none = MagicMock(return_value=None)
+
+        assert await mock_repository.update_by_pk(returning_session, sample_uuid, {"name": "Updated"}) is None
+
+    @pytest.mark.asyncio
+    async def test_returning_can_be_disabled(self, mock_repository, returning_session, mock_create_schema,
+                                             monkeypatch):
+        """Should take the flush/refresh path when use_returning is off."""
+        monkeypatch.setattr(type(mock_repository), "use_returning", False)
+
+        await mock_repository.create(returning_session, mock_create_schema)
+
+        returning_session.add.assert_called_once()
+        returning_session.refresh.assert_called_once()
+
+
 class TestBaseRepositoryGetMulti:
     """Tests for get_multi (pagination) operations."""
 
@@ -252,6 +413,211 @@ class TestBaseRepositoryGetMulti:
         assert len(result.items) == 100
 
 
+class TestBaseRepositoryCursorPagination:
+    """Tests for keyset (cursor) pagination in get_multi."""
+
+    @staticmethod
+    def _mock_results(mock_async_session, items, total_count=None):
+        data_result = MagicMock()
+        data_result.scalars.return_value.all.return_value = items
+        if total_count is None:
+            mock_async_session.execute.side_effect = [data_result]
+            return
+        count_result = MagicMock()
+        count_result.scalar_one.return_value = total_count
+        mock_async_session.execute.side_effect = [count_result, data_result]
+
+    @staticmethod
+    def _make_models(count):
+        from tests.unit.test_base.conftest import MockModel
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return [
+            MockModel(id=uuid.uuid4(), name=f"item{i}", updated_at=now - datetime.timedelta(minutes=i))
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_first_page_fetches_extra_row_and_returns_next_cursor(self, mock_repository, mock_async_session):
+        """Should fetch limit + 1 rows and expose a next cursor when more rows exist."""
+        models = self._make_models(3)
+        self._mock_results(mock_async_session, models, total_count=5)
+
+        result = await mock_repository.get_multi(mock_async_session, limit=2)
+
+        assert result.items == models[:2]
+        assert result.next_cursor is not None
+        assert result.prev_cursor is None
+        data_stmt = mock_async_session.execute.call_args_list[1].args[0]
+        assert data_stmt._limit == 3
+
+    @pytest.mark.asyncio
+    async def test_no_next_cursor_on_last_page(self, mock_repository, mock_async_session):
+        """Should not expose a next cursor when the page is not full."""
+        self._mock_results(mock_async_session, self._make_models(1), total_count=1)
+
+        result = await mock_repository.get_multi(mock_async_session, limit=2)
+
+        assert result.next_cursor is None
+        assert result.last is True
+
+    @pytest.mark.asyncio
+    async def test_cursor_page_filters_by_keyset(self, mock_repository, mock_async_session):
+        """Should filter by the cursor values instead of using an offset."""
+        models = self._make_models(3)
+        self._mock_results(mock_async_session, models, total_count=5)
+        first_page = await mock_repository.get_multi(mock_async_session, limit=2)
+
+        mock_async_session.execute.reset_mock()
+        self._mock_results(mock_async_session, models[2:])
+        result = await mock_repository.get_multi(mock_async_session, limit=2, cursor=first_page.next_cursor)
+
+        assert result.items == models[2:]
+        assert result.next_cursor is None
+        assert result.prev_cursor is not None
+        assert result.total_count is None
+        assert mock_async_session.execute.call_count == 1
+        data_stmt = mock_async_session.execute.call_args_list[-1].args[0]
+        sql = str(data_stmt.compile())
+        assert "mock_items.updated_at <" in sql
+        assert "ORDER BY mock_items.updated_at DESC, mock_items.id DESC" in sql
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_raises_error(self, mock_repository, mock_async_session):
+        """Should raise ValueError for a malformed cursor."""
+        self._mock_results(mock_async_session, [])
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await mock_repository.get_multi(mock_async_session, cursor="not-a-cursor")
+
+    @pytest.mark.asyncio
+    async def test_cursor_for_other_ordering_raises_error(self, mock_repository, mock_async_session):
+        """Should reject a cursor that was issued for a different ordering."""
+        from tests.unit.test_base.conftest import MockModel
+
+        self._mock_results(mock_async_session, self._make_models(3), total_count=5)
+        first_page = await mock_repository.get_multi(mock_async_session, limit=2)
+
+        self._mock_results(mock_async_session, [])
+        with pytest.raises(ValueError, match="does not match"):
+            await mock_repository.get_multi(
+                mock_async_session, limit=2, cursor=first_page.next_cursor, order_by=[MockModel.name.asc()]
+            )
+
+    @pytest.mark.asyncio
+    async def test_cursor_with_offset_raises_error(self, mock_repository, mock_async_session):
+        """Should reject combining offset and cursor."""
+        with pytest.raises(ValueError, match="cannot be combined"):
+            await mock_repository.get_multi(mock_async_session, offset=10, cursor="abc")
+
+
+class TestBaseRepositoryCountStrategy:
+    """Tests for the total_count strategies of get_multi."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_count_cache(self, mock_repository):
+        mock_repository.count_cache.clear()
+        yield
+        mock_repository.count_cache.clear()
+
+    @staticmethod
+    def _data_result(items):
+        data_result = MagicMock()
+        data_result.scalars.return_value.all.return_value = items
+        return data_result
+
+    @staticmethod
+    def _count_result(total_count):
+        count_result = MagicMock()
+        count_result.scalar_one.return_value = total_count
+        return count_result
+
+    @pytest.mark.asyncio
+    async def test_none_skips_count_query(self, mock_repository, mock_async_session, mock_model):
+        """Should run only the page query and leave total_count unset."""
+        mock_async_session.execute.side_effect = [self._data_result([mock_model])]
+
+        result = await mock_repository.get_multi(mock_async_session, limit=10, count_strategy=CountStrategy.NONE)
+
+        assert result.total_count is None
+        assert mock_async_session.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_window_counts_in_page_query(self, mock_repository, mock_async_session, mock_model):
+        """Should read total_count from a count(*) OVER () column of the page query."""
+        row = MagicMock()
+        row.__getitem__.side_effect = lambda i: mock_model
+        row.total_count = 42
+        window_result = MagicMock()
+        window_result.all.return_value = [row]
+        mock_async_session.execute.side_effect = [window_result]
+
+        result = await mock_repository.get_multi(mock_async_session, limit=10, count_strategy=CountStrategy.WINDOW)
+
+        assert result.total_count == 42
+        assert result.items == [mock_model]
+        assert mock_async_session.execute.call_count == 1
+        sql = str(mock_async_session.execute.call_args.args[0].compile())
+        assert "count(*) OVER ()" in sql
+
+    @pytest.mark.asyncio
+    async def test_window_empty_first_page_counts_zero(self, mock_repository, mock_async_session):
+        """Should report zero without another query when the first page is empty."""
+        window_result = MagicMock()
+        window_result.all.return_value = []
+        mock_async_session.execute.side_effect = [window_result]
+
+        result = await mock_repository.get_multi(mock_async_session, limit=10, count_strategy=CountStrategy.WINDOW)
+
+        assert result.total_count == 0
+        assert mock_async_session.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_count_only_when_asked(self, mock_repository, mock_async_session):
+        """Should skip counting for cursor pages unless a strategy is given."""
+        models = TestBaseRepositoryCursorPagination._make_models(3)
+        mock_async_session.execute.side_effect = [self._data_result(models)]
+        first_page = await mock_repository.get_multi(mock_async_session, limit=2, count_strategy=CountStrategy.NONE)
+
+        mock_async_session.execute.side_effect = [self._count_result(3), self._data_result(models[2:])]
+        result = await mock_repository.get_multi(
+            mock_async_session, limit=2, cursor=first_page.next_cursor, count_strategy=CountStrategy.EXACT)
+
+        assert result.total_count == 3
+        assert mock_async_session.execute.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cached_reuses_count_for_same_filter(self, mock_repository, mock_async_session, mock_model):
+        """Should run the count query once per filter while the cache entry is alive."""
+        from tests.unit.test_base.conftest import MockModel
+
+        mock_async_session.execute.side_effect = [
+            self._count_result(7), self._data_result([mock_model]),
+            self._data_result([mock_model]),
+            self._count_result(3), self._data_result([mock_model]),
+        ]
+
+        first = await mock_repository.get_multi(
+            mock_async_session, where=[MockModel.name == "a"], count_strategy=CountStrategy.CACHED)
+        second = await mock_repository.get_multi(
+            mock_async_session, where=[MockModel.name == "a"], count_strategy=CountStrategy.CACHED)
+        other = await mock_repository.get_multi(
+            mock_async_session, where=[MockModel.name == "b"], count_strategy=CountStrategy.CACHED)
+
+        assert first.total_count == second.total_count == 7
+        assert other.total_count == 3
+        assert mock_async_session.execute.call_count == 5
+
+
+class TestBaseRepositoryStream:
+    """Tests for stream method."""
+
+    @pytest.mark.asyncio
+    async def test_stream_rejects_non_positive_batch_size(self, mock_repository, mock_async_session):
+        """Should raise ValueError for a batch size below one."""
+        with pytest.raises(ValueError, match="Batch size"):
+            async for _ in mock_repository.stream(mock_async_session, batch_size=0):
+                pass
+
+
 class TestBaseRepositoryUpdate:
     """Tests for update operations."""
 
@@ -376,6 +742,79 @@ class TestBaseRepositoryDelete:
             await mock_repository.delete_by_pk(mock_async_session, sample_uuid, soft_delete=True)
 
 
+class TestBaseRepositorySetBased:
+    """Tests for update_where / delete_where."""
+
+    @pytest.mark.asyncio
+    async def test_update_where_returns_rowcount(self, mock_repository, mock_async_session):
+        """Should run one UPDATE for all matching rows and return the affected count."""
+        from tests.unit.test_base.conftest import MockModel
+
+        mock_async_session.execute.return_value = MagicMock(rowcount=3)
+
+        result = await mock_repository.update_where(mock_async_session, MockModel.name == "a", {"description": "x"})
+
+        assert result == 3
+        mock_async_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_update_where_requires_where(self, mock_repository, mock_async_session):
+        """Should refuse an unfiltered update."""
+        with pytest.raises(ValueError, match="requires a where clause"):
+            await mock_repository.update_where(mock_async_session, [], {"description": "x"})
+
+    @pytest.mark.asyncio
+    async def test_update_where_returning_ids(self, mock_repository, returning_session, sample_uuid):
+        """Should return primary keys from UPDATE ... RETURNING."""
+        from tests.unit.test_base.conftest import MockModel
+
+        returning_session.execute.return_value.all = MagicMock(return_value=[(sample_uuid,)])
+
+        result = await mock_repository.update_where(
+            returning_session, [MockModel.name == "a"], {"description": "x"}, returning_ids=True)
+
+        assert result == [sample_uuid]
+        assert "RETURNING" in str(returning_session.execute.call_args.args[0].compile())
+
+    @pytest.mark.asyncio
+    async def test_delete_where_returning_ids_without_returning_support(
+            self, mock_repository, mock_async_session, sample_uuid
+    ):
+        """Should select the matching keys before deleting when RETURNING is unavailable."""
+        from tests.unit.test_base.conftest import MockModel
+
+        id_result = MagicMock()
+        id_result.all.return_value = [(sample_uuid,)]
+        mock_async_session.execute.side_effect = [id_result, MagicMock(rowcount=1)]
+
+        result = await mock_repository.delete_where(mock_async_session, MockModel.name == "a", returning_ids=True)
+
+        assert result == [sample_uuid]
+        assert mock_async_session.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_where_soft_delete(self, mock_soft_delete_repository, mock_async_session):
+        """Should soft delete with a single UPDATE setting the configured columns."""
+        from tests.unit.test_base.conftest import MockSoftDeleteModel
+
+        mock_async_session.execute.return_value = MagicMock(rowcount=2)
+
+        result = await mock_soft_delete_repository.delete_where(
+            mock_async_session, MockSoftDeleteModel.name == "a", soft_delete=True)
+
+        assert result == 2
+        sql = str(mock_async_session.execute.call_args.args[0].compile())
+        assert sql.startswith("UPDATE") and "is_deleted" in sql and "deleted_at" in sql
+
+    @pytest.mark.asyncio
+    async def test_delete_where_soft_delete_without_column_raises_error(self, mock_repository, mock_async_session):
+        """Should raise error when soft delete requested but model lacks is_deleted column."""
+        from tests.unit.test_base.conftest import MockModel
+
+        with pytest.raises(ValueError, match="Soft delete requires"):
+            await mock_repository.delete_where(mock_async_session, MockModel.name == "a", soft_delete=True)
+
+
 class TestBaseRepositoryModelName:
     """Tests for model_name property."""
 
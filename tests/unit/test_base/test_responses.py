@@ -0,0 +1,49 @@
+"""Unit tests for app.base.responses module."""
+
+import pytest
+from pydantic import BaseModel
+
+from app.base.exceptions.basic import NotFoundException
+from app.base.responses import ndjson_response, NDJSON_MEDIA_TYPE
+
+
+class Row(BaseModel):
+    id: int
+
+
+async def _rows(n):
+    for i in range(n):
+        yield {"id": i}
+
+
+async def _body(response):
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+class TestNdjsonResponse:
+    """Tests for ndjson_response."""
+
+    @pytest.mark.asyncio
+    async def test_streams_one_line_per_row(self):
+        """Should serialize each row on its own line across chunks."""
+        response = await ndjson_response(_rows(5), Row, lines_per_chunk=2)
+
+        assert response.media_type == NDJSON_MEDIA_TYPE
+        assert (await _body(response)).splitlines() == [f'{{"id":{i}}}'.encode() for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_empty(self):
+        """Should return an empty body when there are no rows."""
+        response = await ndjson_response(_rows(0), Row)
+
+        assert await _body(response) == b""
+
+    @pytest.mark.asyncio
+    async def test_error_before_first_row_is_raised(self):
+        """Should raise up-front errors before the response starts."""
+        async def failing():
+            raise NotFoundException()
+            yield
+
+        with pytest.raises(NotFoundException):
+            await ndjson_response(failing(), Row)
@@ -118,3 +118,31 @@ class TestPaginatedListSerialization:
 
         assert dumped["items"] == items
         assert dumped["total_count"] == 2
+
+
+class TestPaginatedListCursor:
+    """Tests for keyset (cursor) pagination fields."""
+
+    def test_cursors_default_to_none(self):
+        """Should leave cursors unset for plain offset pages."""
+        paginated = PaginatedList(items=[], offset=0, limit=10, total_count=0)
+        assert paginated.next_cursor is None
+        assert paginated.prev_cursor is None
+
+    def test_last_false_when_next_cursor_present(self):
+        """Should not be the last page while a next cursor exists."""
+        paginated = PaginatedList(items=["a"], offset=0, limit=1, total_count=None, next_cursor="abc")
+        assert paginated.last is False
+
+    def test_last_true_on_final_cursor_page(self):
+        """Should be the last page when only a previous cursor exists."""
+        paginated = PaginatedList(items=["a"], offset=0, limit=10, total_count=100, prev_cursor="abc")
+        assert paginated.first is False
+        assert paginated.last is True
+
+    def test_from_items_is_a_single_complete_page(self):
+        """Should describe every item on one page."""
+        paginated = PaginatedList.from_items(["a", "b"], limit=5)
+        assert paginated.total_count == 2
+        assert paginated.first is True
+        assert paginated.last is True
@@ -83,6 +83,34 @@ class TestEnsureContext:
         result_with_values = BaseServiceMixinInterface._ensure_context({"tenant_id": "abc"}, OptionalContextKwargs)
         assert result_with_values["tenant_id"] == "abc"
 
+    def test_ensure_context_reuses_compiled_validator(self):
+        """The validator for a context type is compiled once and shared."""
+        BaseServiceMixinInterface._ensure_context({"user_id": uuid.uuid4()}, CustomContextKwargs)
+        validator = BaseServiceMixinInterface._context_validators[CustomContextKwargs]
+
+        BaseServiceMixinInterface._ensure_context({"user_id": uuid.uuid4()}, CustomContextKwargs)
+        assert BaseServiceMixinInterface._context_validators[CustomContextKwargs] is validator
+
+    def test_ensure_context_revalidates_for_other_type(self):
+        """A context validated for another type is validated again."""
+        context = BaseServiceMixinInterface._ensure_context({"tenant_id": "abc"}, OptionalContextKwargs)
+
+        with pytest.raises(ValueError, match="Invalid context provided"):
+            BaseServiceMixinInterface._ensure_context(context, CustomContextKwargs)
+        with pytest.raises(ValueError, match="Invalid context provided"):
+            BaseServiceMixinInterface._ensure_context({"tenant_id": 1}, OptionalContextKwargs)
+
+    def test_context_validator_compiled_at_class_definition(self):
+        """Services compile the validator for their context_model when the class is created."""
+
+        class ScopedContextKwargs(TypedDict):
+            scope: str
+
+        class ScopedService(BaseServiceMixinInterface):
+            context_model = ScopedContextKwargs
+
+        assert ScopedContextKwargs in BaseServiceMixinInterface._context_validators
+
 
 # =============================================================================
 # Tests for BaseCreateServiceMixin
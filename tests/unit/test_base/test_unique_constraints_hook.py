@@ -0,0 +1,38 @@
+"""Unit tests for app.base.services.unique_constraints_hook module."""
+
+from sqlalchemy.exc import IntegrityError
+
+from app.base.services.unique_constraints_hook import UniqueConstraintHooksMixin
+from tests.unit.test_base.conftest import MockModel
+
+
+def _integrity_error(detail: str) -> IntegrityError:
+    return IntegrityError("INSERT ...", {}, Exception(detail))
+
+
+class TestIntegrityErrorMessage:
+    """Tests for mapping IntegrityError back to the violated constraint."""
+
+    items = [
+        (MockModel.name == "a", "Name already exists."),
+        ((MockModel.name == "a") & (MockModel.description == "b"), "Name and description already exist."),
+    ]
+
+    def test_sqlite_message(self):
+        """Should match the columns listed by SQLite."""
+        error = _integrity_error("UNIQUE constraint failed: mock_items.name")
+        assert UniqueConstraintHooksMixin._integrity_error_message(error, self.items) == "Name already exists."
+
+    def test_postgresql_message(self):
+        """Should match the key columns reported by PostgreSQL."""
+        error = _integrity_error(
+            'duplicate key value violates unique constraint "uq_mock"\n'
+            "DETAIL:  Key (description, name)=(b, a) already exists."
+        )
+        items = list(reversed(self.items))
+        assert UniqueConstraintHooksMixin._integrity_error_message(error, items) == "Name and description already exist."
+
+    def test_unrelated_error(self):
+        """Should return None when no constraint matches, so the error is re-raised."""
+        error = _integrity_error("NOT NULL constraint failed: mock_items.id")
+        assert UniqueConstraintHooksMixin._integrity_error_message(error, self.items) is None
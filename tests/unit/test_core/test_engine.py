@@ -0,0 +1,47 @@
+"""Unit tests for app.core.database.engine module."""
+
+import pytest
+
+from app.core.config import AppSettings
+from app.core.database.engine import create_write_engine, engine_options
+from app.core.database.pool import InstrumentedAsyncQueuePool
+
+
+class TestEngineOptions:
+    """Tests for building engine arguments from the pool settings."""
+
+    @pytest.mark.parametrize("url", ["sqlite+aiosqlite:///app.db", "postgresql+asyncpg://user@host/db"])
+    def test_queue_pools_are_sized_from_settings(self, url):
+        settings = AppSettings(DATABASE_POOL_SIZE=3, DATABASE_POOL_MAX_OVERFLOW=2, DATABASE_POOL_RECYCLE_SECONDS=60)
+
+        assert engine_options(url, settings) == {
+            "pool_pre_ping": True,
+            "poolclass": InstrumentedAsyncQueuePool,
+            "pool_size": 3,
+            "max_overflow": 2,
+            "pool_timeout": 30.0,
+            "pool_recycle": 60,
+        }
+
+    def test_single_connection_pool_is_not_sized(self):
+        settings = AppSettings(DATABASE_POOL_PRE_PING=False)
+        assert engine_options("sqlite+aiosqlite:///:memory:", settings) == {"pool_pre_ping": False}
+
+
+class TestCreateWriteEngine:
+    """Tests for the engine of the SQLite write queue."""
+
+    async def test_single_connection_engine_for_sqlite_files(self, tmp_path):
+        settings = AppSettings(DATABASE_SQLITE_WRITE_QUEUE=True)
+        engine = create_write_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}", settings)
+
+        assert (engine.pool.size(), engine.pool._max_overflow) == (1, 0)
+        await engine.dispose()
+
+    @pytest.mark.parametrize("url, enabled", [
+        ("sqlite+aiosqlite:///app.db", False),
+        ("sqlite+aiosqlite:///:memory:", True),
+        ("postgresql+asyncpg://user@host/db", True),
+    ])
+    def test_disabled_or_not_a_sqlite_file(self, url, enabled):
+        assert create_write_engine(url, AppSettings(DATABASE_SQLITE_WRITE_QUEUE=enabled)) is None
@@ -0,0 +1,129 @@
+"""Unit tests for app.core.database.explain module."""
+
+import pytest
+
+from app.core.database.explain import (
+    FULL_SCAN, TEMP_SORT, PlanCollector, PlanIssue, StatementPlan, find_issues, format_report, index_advice,
+    statement_shape,
+)
+
+LIST_BY_PROFILE = (
+    "SELECT vocabulary.item, vocabulary.id FROM vocabulary WHERE vocabulary.user_profile_id = ? "
+    "ORDER BY vocabulary.created_at DESC, vocabulary.id DESC LIMIT ? OFFSET ?"
+)
+
+
+class TestFindIssues:
+    """Tests for spotting full scans and temporary sorts in plans."""
+
+    @pytest.mark.parametrize("dialect, plan, expected", [
+        ("sqlite", ["SCAN vocabulary"], [PlanIssue(FULL_SCAN, "vocabulary", "SCAN vocabulary")]),
+        ("sqlite", ["SCAN TABLE vocabulary"], [PlanIssue(FULL_SCAN, "vocabulary", "SCAN TABLE vocabulary")]),
+        ("sqlite", ["SCAN vocabulary USING INDEX ix_vocabulary_next_review_at"], []),
+        ("sqlite", ["SEARCH vocabulary USING INDEX idx_vocabulary_mastery (mastery_level=?)"], []),
+        ("sqlite", ["SCAN CONSTANT ROW", "SCAN (subquery-2)"], []),
+        ("sqlite", ["USE TEMP B-TREE FOR ORDER BY"], [PlanIssue(TEMP_SORT, None, "USE TEMP B-TREE FOR ORDER BY")]),
+        ("postgresql", ["Seq Scan on vocabulary  (cost=0.00..1.01 rows=1 width=8)"],
+         [PlanIssue(FULL_SCAN, "vocabulary", "Seq Scan on vocabulary  (cost=0.00..1.01 rows=1 width=8)")]),
+        ("postgresql", ["Limit  (cost=1.02..1.02 rows=1 width=8)", "  ->  Sort  (cost=1.02..1.02 rows=1 width=8)"],
+         [PlanIssue(TEMP_SORT, None, "->  Sort  (cost=1.02..1.02 rows=1 width=8)")]),
+        ("postgresql", ["Index Scan using ix_vocabulary_item on vocabulary  (cost=0.14..8.16 rows=1 width=8)"], []),
+    ])
+    def test_issues(self, dialect, plan, expected):
+        assert find_issues(dialect, plan) == expected
+
+
+class TestIndexAdvice:
+    """Tests for the indexes suggested from a statement's filter and ordering."""
+
+    def test_equality_then_ordering_columns(self):
+        issues = [PlanIssue(FULL_SCAN, "vocabulary", "SCAN vocabulary"), PlanIssue(TEMP_SORT, None, "")]
+
+        assert index_advice(LIST_BY_PROFILE, issues) == [
+            "CREATE INDEX ix_vocabulary_user_profile_id_created_at_id ON vocabulary (user_profile_id, created_at, id)"
+        ]
+
+    def test_sort_alone_uses_the_ordered_table(self):
+        statement = "SELECT user_profile.id FROM user_profile ORDER BY user_profile.created_at DESC"
+
+        assert index_advice(statement, [PlanIssue(TEMP_SORT, None, "")]) == [
+            "CREATE INDEX ix_user_profile_created_at ON user_profile (created_at)"
+        ]
+
+    def test_leading_wildcard_like_needs_full_text_search(self):
+        statement = ("SELECT vocabulary.id FROM vocabulary "
+                     "WHERE (vocabulary.item LIKE '%' || ? || '%') OR (vocabulary.meaning LIKE '%' || ? || '%')")
+
+        advice = index_advice(statement, [PlanIssue(FULL_SCAN, "vocabulary", "SCAN vocabulary")])
+
+        assert len(advice) == 1
+        assert "item, meaning cannot use a B-tree index" in advice[0]
+
+
+class TestFormatReport:
+    def test_lists_flagged_plans_and_merges_advice(self):
+        plans = [
+            StatementPlan("SELECT 1", ["SEARCH vocabulary USING INDEX ix_vocabulary_item (item=?)"]),
+            StatementPlan("SELECT count(*) FROM vocabulary WHERE vocabulary.user_profile_id = ?", ["SCAN vocabulary"],
+                          [PlanIssue(FULL_SCAN, "vocabulary", "SCAN vocabulary")],
+                          ["CREATE INDEX ix_vocabulary_user_profile_id ON vocabulary (user_profile_id)"]),
+            StatementPlan(LIST_BY_PROFILE, ["SCAN vocabulary", "USE TEMP B-TREE FOR ORDER BY"],
+                          [PlanIssue(FULL_SCAN, "vocabulary", "SCAN vocabulary")],
+                          ["CREATE INDEX ix_vocabulary_user_profile_id_created_at_id "
+                           "ON vocabulary (user_profile_id, created_at, id)"]),
+        ]
+
+        report = format_report(plans)
+
+        assert report.startswith("2 of 3 statement shapes")
+        assert report.split("Index advice:\n")[1] == (
+            "  CREATE INDEX ix_vocabulary_user_profile_id_created_at_id ON vocabulary (user_profile_id, created_at, id)"
+        )
+
+
+class TestStatementShape:
+    """Tests for collapsing expanded IN lists into one statement shape."""
+
+    @pytest.mark.parametrize("statement", [
+        "SELECT vocabulary.id FROM vocabulary WHERE vocabulary.id IN (?, ?, ?)",
+        "SELECT vocabulary.id FROM vocabulary WHERE vocabulary.id IN ($1, $2)",
+        "SELECT vocabulary.id FROM vocabulary WHERE vocabulary.id IN (%(id_1_1)s, %(id_1_2)s)",
+        "SELECT vocabulary.id FROM vocabulary WHERE vocabulary.id IN (:id_1)",
+    ])
+    def test_in_lists_are_collapsed(self, statement):
+        assert statement_shape(statement) == "SELECT vocabulary.id FROM vocabulary WHERE vocabulary.id IN (...)"
+
+    def test_tuple_in_lists_are_collapsed(self):
+        statement = "DELETE FROM t WHERE (t.a, t.b) IN ((?, ?), (?, ?)) AND t.c = ?"
+        assert statement_shape(statement) == "DELETE FROM t WHERE (t.a, t.b) IN (...) AND t.c = ?"
+
+    def test_subqueries_are_kept(self):
+        statement = "SELECT t.id FROM t WHERE t.id IN (SELECT u.t_id FROM u WHERE u.a = ?)"
+        assert statement_shape(statement) == statement
+
+
+class TestPlanCollector:
+    """Tests for the bound on the statement shapes a collector keeps."""
+
+    @staticmethod
+    def _record(collector, statement, parameters=()):
+        collector._record(None, None, statement, parameters, None, False)
+
+    def test_in_lists_of_any_length_are_one_shape(self):
+        collector = PlanCollector(engine=None)
+        for size in range(1, 50):
+            self._record(collector, f"SELECT t.id FROM t WHERE t.id IN ({', '.join('?' * size)})", (1,) * size)
+
+        assert list(collector._statements) == ["SELECT t.id FROM t WHERE t.id IN (...)"]
+        assert collector._statements["SELECT t.id FROM t WHERE t.id IN (...)"][1] == (1,)
+
+    def test_least_recently_run_shapes_are_dropped(self):
+        collector = PlanCollector(engine=None, max_statements=2)
+        collector._plans["SELECT a FROM t"] = StatementPlan("SELECT a FROM t", [])
+        for statement in ["SELECT a FROM t", "SELECT b FROM t", "SELECT a FROM t", "SELECT c FROM t"]:
+            self._record(collector, statement)
+
+        assert list(collector._statements) == ["SELECT a FROM t", "SELECT c FROM t"]
+        self._record(collector, "SELECT d FROM t")
+        assert list(collector._statements) == ["SELECT c FROM t", "SELECT d FROM t"]
+        assert collector._plans == {}
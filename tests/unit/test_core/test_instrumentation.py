@@ -0,0 +1,99 @@
+"""Unit tests for app.core.database.instrumentation module."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import AppSettings
+from app.core.database import instrumentation
+from app.core.database.instrumentation import install_query_instrumentation, redact_parameters, track_queries
+from app.core.logger import logger, request_id_var
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    install_query_instrumentation(engine)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def warnings():
+    messages = []
+    sink = logger.add(messages.append, level="WARNING", format="{message}")
+    yield messages
+    logger.remove(sink)
+
+
+async def _select(engine, n=1):
+    async with engine.connect() as conn:
+        for _ in range(n):
+            await conn.execute(text("SELECT :value"), {"value": "secret"})
+
+
+class TestTrackQueries:
+    """Tests for aggregating statements per request ID."""
+
+    async def test_counts_and_times_statements_of_the_request(self, engine):
+        token = request_id_var.set("req-1")
+        try:
+            with track_queries("req-1") as stats:
+                await _select(engine, 3)
+        finally:
+            request_id_var.reset(token)
+
+        assert stats.count == 3
+        assert stats.seconds > 0
+
+    async def test_other_requests_are_not_counted(self, engine):
+        with track_queries("req-1") as stats:
+            token = request_id_var.set("req-2")
+            try:
+                await _select(engine)
+            finally:
+                request_id_var.reset(token)
+
+        assert stats.count == 0
+
+    async def test_failed_statements_do_not_leak_start_times(self, engine):
+        async with engine.connect() as conn:
+            with pytest.raises(Exception):
+                await conn.execute(text("SELECT * FROM missing"))
+            assert conn.sync_connection.info["query_start_times"] == []
+
+    def test_install_is_idempotent(self, engine):
+        install_query_instrumentation(engine)
+        assert len(engine.sync_engine.dispatch.after_cursor_execute) == 1
+
+
+class TestSlowQueryLog:
+    """Tests for logging statements over the threshold."""
+
+    async def test_slow_statements_are_logged_without_values(self, engine, warnings, monkeypatch):
+        monkeypatch.setattr(instrumentation, "get_app_settings",
+                            lambda: AppSettings(DATABASE_SLOW_QUERY_SECONDS=1e-9))
+
+        await _select(engine)
+
+        assert len(warnings) == 1
+        assert "SELECT ?" in warnings[0]
+        assert "secret" not in warnings[0]
+
+    async def test_disabled_by_zero_threshold(self, engine, warnings, monkeypatch):
+        monkeypatch.setattr(instrumentation, "get_app_settings", lambda: AppSettings(DATABASE_SLOW_QUERY_SECONDS=0))
+
+        await _select(engine)
+
+        assert warnings == []
+
+
+class TestRedactParameters:
+    @pytest.mark.parametrize("parameters, redacted", [
+        (("alice", 3), ("?", "?")),
+        ({"name": "alice"}, {"name": "?"}),
+        ([("alice",), ("bob",)], "<2 parameter sets>"),
+        ((), ()),
+    ])
+    def test_values_are_replaced(self, parameters, redacted):
+        assert redact_parameters(parameters) == redacted
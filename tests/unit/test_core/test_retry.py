@@ -0,0 +1,44 @@
+"""Unit tests for app.core.database.retry module."""
+
+import sqlite3
+
+import pytest
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from app.core.database.retry import RetryPolicy
+
+
+class PgError(Exception):
+    def __init__(self, sqlstate):
+        super().__init__("error")
+        self.sqlstate = sqlstate
+
+
+def _wrap(orig: BaseException, cls=OperationalError):
+    return cls("UPDATE ...", {}, orig)
+
+
+class TestRetryPolicy:
+    """Tests for error classification and backoff."""
+
+    @pytest.mark.parametrize("exc, dialect, retryable", [
+        (_wrap(sqlite3.OperationalError("database is locked")), "sqlite", True),
+        (_wrap(sqlite3.OperationalError("no such table: x")), "sqlite", False),
+        (_wrap(PgError("40001")), "postgresql", True),
+        (_wrap(PgError("40P01")), "postgresql", True),
+        (_wrap(PgError("23505"), IntegrityError), "postgresql", False),
+        (_wrap(Exception(1213, "Deadlock found")), "mysql", True),
+        (_wrap(sqlite3.OperationalError("database is locked")), "oracle", False),
+        (sqlite3.OperationalError("database is locked"), "sqlite", False),
+    ])
+    def test_classifies_by_dialect(self, exc, dialect, retryable):
+        assert RetryPolicy().is_retryable(exc, dialect) is retryable
+
+    def test_full_jitter_exponential_backoff(self):
+        policy = RetryPolicy(base_delay=0.1, max_delay=0.3, rand=lambda: 1.0)
+        assert [policy.delay(attempt) for attempt in (1, 2, 3, 4)] == [0.1, 0.2, 0.3, 0.3]
+
+        assert RetryPolicy(rand=lambda: 0.0).delay(3) == 0.0
+
+    def test_at_least_one_attempt(self):
+        assert RetryPolicy(max_attempts=0).max_attempts == 1
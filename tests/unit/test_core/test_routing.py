@@ -0,0 +1,41 @@
+"""Unit tests for app.core.database.routing module."""
+
+from unittest.mock import MagicMock
+
+from app.core.database.routing import RoutingSessionMaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRoutingSessionMaker:
+    """Tests for replica selection and read-your-writes stickiness."""
+
+    def test_no_replicas_reads_from_primary(self):
+        """Should return None (use the primary) without replicas."""
+        router = RoutingSessionMaker()
+        assert router.has_replicas is False
+        assert router.reader() is None
+
+    def test_replicas_round_robin(self):
+        """Should cycle through the replicas."""
+        first, second = MagicMock(), MagicMock()
+        router = RoutingSessionMaker([first, second])
+        assert [router.reader() for _ in range(3)] == [first, second, first]
+
+    def test_reads_stick_to_primary_after_write(self):
+        """Should use the primary within the stickiness window after a write."""
+        clock = FakeClock()
+        replica = MagicMock()
+        router = RoutingSessionMaker([replica], stickiness=5, clock=clock)
+
+        router.mark_write()
+        assert router.reader() is None
+
+        clock.now += 5
+        assert router.reader() is replica
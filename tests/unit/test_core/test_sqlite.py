@@ -0,0 +1,31 @@
+"""Unit tests for app.core.database.sqlite module."""
+
+from app.core.config import AppSettings
+from app.core.database.sqlite import sqlite_pragmas
+
+
+class TestSqlitePragmas:
+    """Tests for the PRAGMA statements built from the SQLite profile settings."""
+
+    def test_default_profile(self):
+        assert sqlite_pragmas(AppSettings()) == [
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=NORMAL",
+            "PRAGMA cache_size=-65536",
+            "PRAGMA mmap_size=268435456",
+            "PRAGMA temp_store=MEMORY",
+            "PRAGMA busy_timeout=5000",
+            "PRAGMA optimize=0x10002",
+        ]
+
+    def test_zero_sizes_and_interval_are_left_out(self):
+        settings = AppSettings(
+            DATABASE_SQLITE_CACHE_SIZE_KIB=0, DATABASE_SQLITE_MMAP_SIZE_BYTES=0,
+            DATABASE_SQLITE_OPTIMIZE_INTERVAL_SECONDS=0, DATABASE_SQLITE_BUSY_TIMEOUT_MS=0,
+        )
+        assert sqlite_pragmas(settings) == [
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=NORMAL",
+            "PRAGMA temp_store=MEMORY",
+            "PRAGMA busy_timeout=0",
+        ]